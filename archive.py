@@ -0,0 +1,43 @@
+"""
+Archive Store
+Finished tournaments and games as gzip-compressed JSON files, one per record,
+so they can leave memory and still be read back for history
+"""
+
+import gzip
+import json
+import os
+from typing import Any, Dict, Optional
+
+
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "archive")
+
+
+class ArchiveStore:
+    """<root>/<kind>/<key>.json.gz; calls block on disk, run them in a thread from async code"""
+
+    def __init__(self, root: str = ARCHIVE_DIR):
+        self.root = root
+
+    def _path(self, kind: str, key: str) -> str:
+        safe_key = "".join(c if c.isalnum() or c in "-_" else "_" for c in key)
+        return os.path.join(self.root, kind, f"{safe_key}.json.gz")
+
+    def save(self, kind: str, key: str, record: Dict[str, Any]):
+        path = self._path(kind, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = json.dumps(record, separators=(",", ":")).encode()
+        tmp_path = path + ".tmp"
+        with gzip.open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)  # Readers never see a half-written record
+
+    def load(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with gzip.open(self._path(kind, key), "rb") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return None
+
+    def exists(self, kind: str, key: str) -> bool:
+        return os.path.exists(self._path(kind, key))
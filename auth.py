@@ -0,0 +1,110 @@
+"""
+Telegram Auth
+Mini App initData verification with the HMAC secret derived once, verified initData cached
+until it goes stale, and short-lived session tokens so later calls skip verification
+"""
+
+import hashlib
+import heapq
+import hmac
+import json
+import secrets
+import urllib.parse
+from typing import Any, Dict, List, Optional, Tuple
+
+from clock import now
+
+
+INIT_DATA_MAX_AGE_SECONDS = 24 * 60 * 60  # initData signed longer ago than this (auth_date) is rejected
+SESSION_TTL_SECONDS = 60 * 60
+
+
+class TelegramAuth:
+    """
+    Verifies initData against the bot token. Verified strings are cached until auth_date + max age,
+    so a client resending the same initData costs one dict lookup; issue_session() trades a verified
+    user for a random token that REST and websocket calls can present instead.
+    Expired cache entries and sessions are dropped from one expiry heap as time passes.
+    """
+
+    def __init__(
+        self,
+        bot_token: Optional[str],
+        max_age_seconds: float = INIT_DATA_MAX_AGE_SECONDS,
+        session_ttl_seconds: float = SESSION_TTL_SECONDS
+    ):
+        self._secret_key = hashlib.sha256(bot_token.encode()).digest() if bot_token else None
+        self.max_age_seconds = max_age_seconds
+        self.session_ttl_seconds = session_ttl_seconds
+        self._verified: Dict[str, Tuple[float, Dict[str, Any]]] = {}  # initData -> (expires_at, user)
+        self._sessions: Dict[str, Tuple[float, Dict[str, Any]]] = {}  # token -> (expires_at, user)
+        self._expiry: List[Tuple[float, bool, str]] = []              # (expires_at, is_session, key)
+
+    @property
+    def configured(self) -> bool:
+        return self._secret_key is not None
+
+    def verify(self, init_data: str) -> Dict[str, Any]:
+        """Telegram user of a signed initData string; raises ValueError when it is missing, forged or stale"""
+        if not self.configured:
+            raise ValueError("TELEGRAM_TOKEN not set")
+        if not init_data:
+            raise ValueError("missing initData")
+
+        moment = now()
+        self._prune(moment)
+        cached = self._verified.get(init_data)
+        if cached:
+            return cached[1]
+
+        data = dict(urllib.parse.parse_qsl(init_data, keep_blank_values=True))
+        tg_hash = data.pop("hash", None)
+        if not tg_hash:
+            raise ValueError("missing hash")
+
+        # Data-check-string: key=value lines in alphabetical order by key
+        data_check_string = "\n".join(f"{k}={v}" for k, v in sorted(data.items()))
+        expected = hmac.new(self._secret_key, data_check_string.encode(), hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(expected, tg_hash):
+            raise ValueError("bad signature")
+
+        try:
+            signed_at = float(data["auth_date"])
+        except (KeyError, ValueError):
+            signed_at = moment
+        expires_at = signed_at + self.max_age_seconds
+        if expires_at <= moment:
+            raise ValueError("initData expired")
+
+        try:
+            user = json.loads(data["user"]) if data.get("user") else {}
+        except ValueError:
+            user = {}
+
+        self._verified[init_data] = (expires_at, user)
+        heapq.heappush(self._expiry, (expires_at, False, init_data))
+        return user
+
+    def issue_session(self, user: Dict[str, Any]) -> str:
+        """Random session token standing in for a verified user until it expires"""
+        moment = now()
+        self._prune(moment)
+        token = secrets.token_urlsafe(24)
+        expires_at = moment + self.session_ttl_seconds
+        self._sessions[token] = (expires_at, user)
+        heapq.heappush(self._expiry, (expires_at, True, token))
+        return token
+
+    def resolve_session(self, token: str) -> Optional[Dict[str, Any]]:
+        entry = self._sessions.get(token)
+        if not entry or entry[0] <= now():
+            return None
+        return entry[1]
+
+    def _prune(self, moment: float):
+        while self._expiry and self._expiry[0][0] <= moment:
+            _, is_session, key = heapq.heappop(self._expiry)
+            store = self._sessions if is_session else self._verified
+            entry = store.get(key)
+            if entry and entry[0] <= moment:
+                del store[key]
@@ -0,0 +1,232 @@
+"""
+Bot Players
+Rule-based bots for empty seats in game_engine and TableSession games.
+Preflop is a lookup into a chart precomputed at import; postflop uses an
+evaluate_hand-based strength estimate cached per (hole cards, board), so a
+decision costs microseconds and never eats into a table's action timer.
+"""
+
+import itertools
+import random
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from game_engine import (
+    Card, GamePhase, GameState, Player,
+    evaluate_hand, process_action, starting_hand_class
+)
+
+
+BOT_NAMES = [
+    "Ace Bot", "River Rat", "Chip Leader", "Nit Bot", "Button Masher",
+    "Fish Finder", "Bluff Bot", "Pot Odds", "Short Stack", "All-In Annie",
+]
+
+# Preflop tiers
+FOLD, SPECULATIVE, PLAYABLE, STRONG, PREMIUM = range(5)
+
+SHORT_STACK_BB = 10      # At or below this many big blinds bots play push/fold
+OPEN_RAISE_BB = 3        # Unopened pots are raised to 3 big blinds
+MAX_BOT_ACTIONS = 200    # Safety net for play_bot_turns
+
+RANK_CHARS = "23456789TJQKA"
+RANK_VALUES = {char: idx + 2 for idx, char in enumerate(RANK_CHARS)}
+RANK_VALUES.update({"10": 10, "J": 11, "Q": 12, "K": 13, "A": 14})
+
+BETTING_PHASES = (GamePhase.PRE_FLOP, GamePhase.FLOP, GamePhase.TURN, GamePhase.RIVER)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PREFLOP CHART
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _chen_score(high: int, low: int, suited: bool) -> int:
+    """Bill Chen's starting-hand formula"""
+    points = {14: 10.0, 13: 8.0, 12: 7.0, 11: 6.0}.get(high, high / 2)
+    if high == low:
+        return int(max(5.0, points * 2))
+    if suited:
+        points += 2
+    gap = high - low - 1
+    points -= {0: 0, 1: 1, 2: 2, 3: 4}.get(gap, 5)
+    if gap <= 1 and high < 12:
+        points += 1
+    return int(points + 0.5)
+
+
+def _build_preflop_chart() -> Dict[str, int]:
+    chart = {}
+    for high, low in itertools.combinations_with_replacement(range(14, 1, -1), 2):
+        name = RANK_CHARS[high - 2] + RANK_CHARS[low - 2]
+        for suited in ([False] if high == low else [True, False]):
+            score = _chen_score(high, low, suited)
+            tier = PREMIUM if score >= 12 else STRONG if score >= 10 else \
+                PLAYABLE if score >= 8 else SPECULATIVE if score >= 5 else FOLD
+            chart[name if high == low else name + ("s" if suited else "o")] = tier
+    return chart
+
+
+PREFLOP_CHART: Dict[str, int] = _build_preflop_chart()  # 169 hand classes -> tier
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# POSTFLOP STRENGTH
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Made-hand category (evaluate_hand rank) -> rough equity
+CATEGORY_STRENGTH = {1: 0.1, 2: 0.45, 3: 0.7, 4: 0.8, 5: 0.85, 6: 0.88, 7: 0.94, 8: 0.98, 9: 1.0, 10: 1.0}
+
+
+def card_key(cards: List[Card]) -> Tuple[Tuple[int, str], ...]:
+    """Hashable, order-independent key for a set of cards"""
+    return tuple(sorted((c.rank, c.suit) for c in cards))
+
+
+def cards_from_dicts(cards: List[Dict[str, str]]) -> List[Card]:
+    """TableSession cards ({"rank": "10", "suit": "hearts"}) as game_engine Cards"""
+    return [Card(rank=RANK_VALUES[c["rank"]], suit=c["suit"]) for c in cards]
+
+
+@lru_cache(maxsize=65536)
+def _strength(hole: Tuple[Tuple[int, str], ...], board: Tuple[Tuple[int, str], ...]) -> float:
+    cards = [Card(rank=r, suit=s) for r, s in hole + board]
+    category, tiebreakers, _ = evaluate_hand(cards)
+    hole_ranks = {r for r, _ in hole}
+    board_ranks = [r for r, _ in board]
+    top_board = max(board_ranks)
+    strength = CATEGORY_STRENGTH.get(category, 0.1)
+
+    if category == 1:
+        strength += 0.1 * (max(hole_ranks) - 2) / 12
+    elif category == 2:
+        pair = tiebreakers[0]
+        if pair not in hole_ranks:
+            strength = 0.15  # Paired board, we only have high card
+        elif pair >= top_board:
+            strength = 0.6 + 0.05 * (pair - 2) / 12  # Top pair or overpair
+        else:
+            strength = 0.35 + 0.1 * (pair - 2) / 12
+    elif category in (3, 4):
+        made_ranks = tiebreakers[:2] if category == 3 else tiebreakers[:1]
+        if not hole_ranks & set(made_ranks):
+            strength = 0.3  # The board made it, not our cards
+
+    if len(board) < 5 and category < 5:
+        suits = [s for _, s in hole + board]
+        if any(suits.count(s) == 4 for _, s in hole):
+            strength += 0.12  # Flush draw
+        ranks = sorted(set(hole_ranks) | set(board_ranks))
+        if any(ranks[i + 3] - ranks[i] == 3 for i in range(len(ranks) - 3)):
+            strength += 0.08  # Open-ended straight draw
+    return min(strength, 1.0)
+
+
+def postflop_strength(hole: List[Card], board: List[Card]) -> float:
+    """Estimated strength in [0, 1] of hole cards on this board (cached)"""
+    return _strength(card_key(hole), card_key(board))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# DECISIONS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def decide(
+    hole: List[Card],
+    board: List[Card],
+    to_call: int,
+    pot: int,
+    stack: int,
+    committed: int,
+    current_bet: int,
+    min_raise_to: int,
+    big_blind: int,
+    rng: random.Random,
+) -> Tuple[str, int]:
+    """
+    Engine-neutral decision.
+    Returns (action, raise_to) where action is fold/check/call/raise/all_in and
+    raise_to is the total bet for this street (only meaningful for raise).
+    """
+    can_check = to_call <= 0
+    passive = ("check", 0) if can_check else ("fold", 0)
+    total = stack + committed  # The most we can have in front of us this street
+
+    def raise_to(target: int) -> Tuple[str, int]:
+        target = max(target, min_raise_to)
+        if target >= total:
+            return "all_in", 0
+        return "raise", target
+
+    def call() -> Tuple[str, int]:
+        if can_check:
+            return "check", 0
+        return ("all_in", 0) if to_call >= stack else ("call", 0)
+
+    if not board:
+        tier = PREFLOP_CHART[starting_hand_class(hole)]
+        if total <= SHORT_STACK_BB * big_blind:
+            shove_tier = SPECULATIVE if total <= 4 * big_blind else PLAYABLE
+            return ("all_in", 0) if tier >= shove_tier else passive
+        unopened = current_bet <= big_blind
+        if tier == PREMIUM:
+            if unopened:
+                return raise_to(OPEN_RAISE_BB * big_blind)
+            return ("all_in", 0) if 3 * current_bet >= total * 0.4 else raise_to(3 * current_bet)
+        if tier == STRONG:
+            if unopened:
+                return raise_to(OPEN_RAISE_BB * big_blind)
+            return call() if to_call <= stack * 0.2 else passive
+        if tier == PLAYABLE:
+            if unopened:
+                return raise_to(OPEN_RAISE_BB * big_blind) if rng.random() < 0.6 else call()
+            return call() if to_call <= min(3 * big_blind, stack * 0.1) else passive
+        if tier == SPECULATIVE and to_call <= big_blind:
+            return call()
+        return passive
+
+    strength = postflop_strength(hole, board)
+    pot_odds = to_call / (pot + to_call) if to_call > 0 else 0.0
+    if strength >= 0.8:
+        return raise_to(committed + to_call + pot)
+    if strength >= 0.55:
+        if can_check:
+            return raise_to(committed + (pot * 2) // 3) if rng.random() < 0.7 else ("check", 0)
+        return call() if pot_odds < strength - 0.2 else passive
+    if strength >= 0.3:
+        return call() if pot_odds < strength - 0.15 else passive
+    if can_check and rng.random() < 0.1:
+        return raise_to(committed + pot // 2)  # Occasional bluff
+    return passive
+
+
+def bot_policy(game: GameState, player: Player, rng: random.Random) -> Tuple[str, int]:
+    """Bot decision in game_engine terms (same signature as the simulator policies)"""
+    to_call = max(0, game.current_bet - player.current_bet)
+    if game.current_bet == 0:
+        min_total = game.big_blind
+    else:
+        min_total = game.current_bet + game.min_raise
+    return decide(
+        player.cards, game.community_cards,
+        to_call=to_call, pot=game.pot, stack=player.chips, committed=player.current_bet,
+        current_bet=game.current_bet, min_raise_to=min_total, big_blind=game.big_blind, rng=rng,
+    )
+
+
+def play_bot_turns(game: GameState, rng: Optional[random.Random] = None) -> int:
+    """
+    Let bot seats act until a human is to act or the hand is over.
+    Returns the number of bot actions taken.
+    """
+    rng = rng or random
+    actions = 0
+    while game.phase in BETTING_PHASES and actions < MAX_BOT_ACTIONS:
+        player = game.players.get(game.current_player_seat)
+        if not player or not player.is_bot:
+            break
+        action, amount = bot_policy(game, player, rng)
+        success, _, _ = process_action(game.session_id, player.seat, action, amount)
+        if not success:
+            process_action(game.session_id, player.seat, "fold", 0)
+        actions += 1
+    return actions
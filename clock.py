@@ -0,0 +1,107 @@
+"""
+Clock Abstraction
+Wall time and sleeping behind one interface, so engine timers can run on
+accelerated or virtual time in tests, simulations and benchmarks
+"""
+
+import asyncio
+import heapq
+import time
+from typing import List, Optional, Tuple
+
+
+class Clock:
+    """Real time: time.time() and asyncio.sleep()"""
+
+    def time(self) -> float:
+        return time.time()
+
+    async def sleep(self, seconds: float):
+        await asyncio.sleep(seconds)
+
+
+class AcceleratedClock(Clock):
+    """
+    Real time running `speed` times faster: a 30s action timer fires after 30/speed real seconds.
+    Timestamps start at the wall time of construction so they still look like epoch seconds.
+    """
+
+    def __init__(self, speed: float):
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self._origin = time.time()
+        self._real_origin = time.monotonic()
+
+    def time(self) -> float:
+        return self._origin + (time.monotonic() - self._real_origin) * self.speed
+
+    async def sleep(self, seconds: float):
+        await asyncio.sleep(max(0.0, seconds) / self.speed)
+
+
+class VirtualClock(Clock):
+    """
+    Manually driven clock for simulations and tests.
+    sleep() parks the caller until advance() moves virtual time past its deadline.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+        self._sleepers: List[Tuple[float, int, asyncio.Future]] = []  # (wake_at, seq, future)
+        self._seq = 0
+
+    def time(self) -> float:
+        return self._now
+
+    async def sleep(self, seconds: float):
+        if seconds <= 0:
+            await asyncio.sleep(0)
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._sleepers, (self._now + seconds, self._seq, future))
+        self._seq += 1
+        await future
+
+    async def advance(self, seconds: float):
+        """Move time forward, waking sleepers in deadline order"""
+        target = self._now + seconds
+        await asyncio.sleep(0)  # Let freshly created tasks reach their first sleep()
+        while self._sleepers and self._sleepers[0][0] <= target:
+            wake_at, _, future = heapq.heappop(self._sleepers)
+            if future.done():  # Sleeper was cancelled
+                continue
+            self._now = max(self._now, wake_at)
+            future.set_result(None)
+            # Let the woken task run (and possibly sleep again) before later deadlines fire
+            await asyncio.sleep(0)
+        self._now = max(self._now, target)
+
+    def pending(self) -> int:
+        """Number of parked sleepers (cancelled ones included until their deadline passes)"""
+        return len(self._sleepers)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PROCESS-WIDE CLOCK
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_clock: Clock = Clock()
+
+
+def get_clock() -> Clock:
+    """Clock used by every engine timer that wasn't given one explicitly"""
+    return _clock
+
+
+def set_clock(clock: Optional[Clock]) -> Clock:
+    """Install a clock process-wide (None restores real time); returns the previous one"""
+    global _clock
+    previous = _clock
+    _clock = clock or Clock()
+    return previous
+
+
+def now() -> float:
+    """Current time on the process-wide clock (usable as a dataclass default_factory)"""
+    return _clock.time()
@@ -4,11 +4,21 @@ Manages game state, card dealing, and player actions
 """
 
 import random
-import time
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+from clock import now
+
+
+# Console logging of game events. Simulations and benchmarks turn this off.
+VERBOSE = True
+
+
+def _log(message: str):
+    if VERBOSE:
+        print(message)
+
 
 class Suit(Enum):
     HEARTS = "hearts"
@@ -52,6 +62,7 @@ class Player:
     is_folded: bool = False
     is_all_in: bool = False
     is_active: bool = True
+    is_bot: bool = False  # Seat played by bots.play_bot_turns
     
     def to_dict(self, hide_cards: bool = True) -> Dict[str, Any]:
         return {
@@ -63,6 +74,7 @@ class Player:
             "isFolded": self.is_folded,
             "isAllIn": self.is_all_in,
             "isActive": self.is_active,
+            "isBot": self.is_bot,
             "cards": [] if hide_cards else [c.to_dict() for c in self.cards],
             "hasCards": len(self.cards) > 0
         }
@@ -84,18 +96,20 @@ class GameState:
     phase: GamePhase = GamePhase.WAITING
     min_raise: int = 0  # Last raise delta (for calculating min raise)
     last_raiser_seat: Optional[int] = None
-    created_at: float = field(default_factory=time.time)
+    created_at: float = field(default_factory=now)
+    last_activity_at: float = field(default_factory=now)  # Last hand start or accepted action (idle check for archiving)
     max_players: int = 2  # How many players expected
     connected_count: int = 0  # How many have connected
     winner_seat: Optional[int] = None  # Winner's seat number
     winner_hand: Optional[str] = None  # Winner's hand name
     # Turn timer
-    turn_start_time: Optional[float] = None  # When current turn started (time.time())
+    turn_start_time: Optional[float] = None  # When current turn started (clock.now())
     turn_timeout_seconds: int = 20  # Seconds allowed per turn
     # Rake system (casino commission)
     rake_percentage: float = 0.05  # 5% rake
     rake_cap: int = 50  # Maximum rake per hand
     total_rake_collected: int = 0  # Rake collected this hand
+    last_pot: int = 0  # Size of the last awarded pot (before rake)
     # Tournament configuration
     buy_in_usd: float = 1.0  # Entry fee in USD
     starting_chips: int = 1000  # Chips given for buy-in
@@ -162,7 +176,7 @@ class GameState:
         """Calculate remaining time for current turn"""
         if self.turn_start_time is None or self.current_player_seat is None:
             return None
-        elapsed = time.time() - self.turn_start_time
+        elapsed = now() - self.turn_start_time
         remaining = self.turn_timeout_seconds - elapsed
         return max(0, remaining)
 
@@ -198,9 +212,10 @@ def create_game(session_id: str, lobby_code: str, players_data: List[Dict],
             seat=seat,
             chips=1000,  # Starting chips
             cards=[],
+            is_bot=p.get("is_bot", False),
         )
         players[seat] = player  # Key is SEAT, telegram_id stored in player
-        print(f"🎮 Created player: seat={seat}, telegram_id={tg_id}, name={player.name}")
+        _log(f"🎮 Created player: seat={seat}, telegram_id={tg_id}, name={player.name}")
     
     game = GameState(
         session_id=session_id,
@@ -214,7 +229,7 @@ def create_game(session_id: str, lobby_code: str, players_data: List[Dict],
     )
     
     active_games[session_id] = game
-    print(f"🎮 GAME: Created game {session_id} with {num_players} seats")
+    _log(f"🎮 GAME: Created game {session_id} with {num_players} seats")
     
     return game
 
@@ -224,6 +239,7 @@ def start_hand(session_id: str) -> Optional[GameState]:
     game = active_games.get(session_id)
     if not game:
         return None
+    game.last_activity_at = now()
     
     # Reset for new hand
     game.deck = create_deck()
@@ -286,9 +302,9 @@ def start_hand(session_id: str) -> Optional[GameState]:
         game.current_player_seat = sb_player.seat
     
     # Start turn timer
-    game.turn_start_time = time.time()
+    game.turn_start_time = now()
     
-    print(f"🎮 GAME: Hand started, {len(active_players)} players, pot=${game.pot}, first to act: seat {game.current_player_seat}")
+    _log(f"🎮 GAME: Hand started, {len(active_players)} players, pot=${game.pot}, first to act: seat {game.current_player_seat}")
     return game
 
 
@@ -348,19 +364,19 @@ def process_action(session_id: str, player_seat: int, action: str, amount: int =
     
     if action == "fold":
         player.is_folded = True
-        print(f"🎮 GAME: Seat {player_seat} ({player.name}) folds")
+        _log(f"🎮 GAME: Seat {player_seat} ({player.name}) folds")
         
     elif action == "check":
         if game.current_bet > player.current_bet:
             return False, "Cannot check, must call or fold", None
-        print(f"🎮 GAME: Seat {player_seat} ({player.name}) checks")
+        _log(f"🎮 GAME: Seat {player_seat} ({player.name}) checks")
         
     elif action == "call":
         call_amount = game.current_bet - player.current_bet
         
         # If nothing to call, treat as check
         if call_amount <= 0:
-            print(f"🎮 GAME: Seat {player_seat} ({player.name}) checks (call with 0 amount)")
+            _log(f"🎮 GAME: Seat {player_seat} ({player.name}) checks (call with 0 amount)")
         else:
             actual_call = min(call_amount, player.chips)
             player.chips -= actual_call
@@ -370,7 +386,7 @@ def process_action(session_id: str, player_seat: int, action: str, amount: int =
             if player.chips == 0:
                 player.is_all_in = True
             
-            print(f"🎮 GAME: Seat {player_seat} ({player.name}) calls ${actual_call}")
+            _log(f"🎮 GAME: Seat {player_seat} ({player.name}) calls ${actual_call}")
         
     elif action == "raise":
         # Amount is the TOTAL bet the player wants to make (not additional raise)
@@ -414,7 +430,7 @@ def process_action(session_id: str, player_seat: int, action: str, amount: int =
             player.is_all_in = True
         
         action_name = "bets" if game.current_bet == amount else "raises to"
-        print(f"🎮 GAME: Seat {player_seat} ({player.name}) {action_name} ${amount}")
+        _log(f"🎮 GAME: Seat {player_seat} ({player.name}) {action_name} ${amount}")
         
     elif action == "all_in":
         all_in_amount = player.chips
@@ -437,11 +453,13 @@ def process_action(session_id: str, player_seat: int, action: str, amount: int =
             game.current_bet = new_total_bet
             game.last_raiser_seat = player_seat
         
-        print(f"🎮 GAME: Seat {player_seat} ({player.name}) goes ALL IN for ${all_in_amount}")
+        _log(f"🎮 GAME: Seat {player_seat} ({player.name}) goes ALL IN for ${all_in_amount}")
     
     else:
         return False, "Unknown action", None
     
+    game.last_activity_at = now()
+    
     # Check if round is complete
     _check_round_complete(game)
     
@@ -483,7 +501,7 @@ def _check_round_complete(game: GameState):
     all_can_act_seats = set(p.seat for p in can_act)
     everyone_acted = all_can_act_seats.issubset(players_acted)
     
-    print(f"🎮 ROUND CHECK: matched={all_matched}, everyone_acted={everyone_acted}, players_acted={players_acted}, can_act={all_can_act_seats}")
+    _log(f"🎮 ROUND CHECK: matched={all_matched}, everyone_acted={everyone_acted}, players_acted={players_acted}, can_act={all_can_act_seats}")
     
     if all_matched and everyone_acted:
         # Move to next phase
@@ -496,7 +514,7 @@ def _check_round_complete(game: GameState):
     else:
         # Next player's turn
         game.current_player_seat = next_seat
-        game.turn_start_time = time.time()  # Reset turn timer
+        game.turn_start_time = now()  # Reset turn timer
 
 
 def _advance_phase(game: GameState):
@@ -508,10 +526,11 @@ def _advance_phase(game: GameState):
     game.last_raiser_seat = None
     game.min_raise = game.big_blind  # Reset min raise to big blind for new street
     
-    active = get_active_players(game)
-    if active:
-        game.current_player_seat = active[0].seat  # Use seat, not telegram_id!
-        game.turn_start_time = time.time()  # Reset turn timer
+    # First to act is the first player who can still bet (all-in players are skipped)
+    can_act = [p for p in get_active_players(game) if not p.is_all_in]
+    if can_act:
+        game.current_player_seat = can_act[0].seat  # Use seat, not telegram_id!
+        game.turn_start_time = now()  # Reset turn timer
     
     if game.phase == GamePhase.PRE_FLOP:
         # Deal flop (3 cards)
@@ -519,21 +538,21 @@ def _advance_phase(game: GameState):
         for _ in range(3):
             if game.deck:
                 game.community_cards.append(game.deck.pop())
-        print(f"🎮 GAME: Flop dealt")
+        _log(f"🎮 GAME: Flop dealt")
         
     elif game.phase == GamePhase.FLOP:
         # Deal turn (1 card)
         game.phase = GamePhase.TURN
         if game.deck:
             game.community_cards.append(game.deck.pop())
-        print(f"🎮 GAME: Turn dealt")
+        _log(f"🎮 GAME: Turn dealt")
         
     elif game.phase == GamePhase.TURN:
         # Deal river (1 card)
         game.phase = GamePhase.RIVER
         if game.deck:
             game.community_cards.append(game.deck.pop())
-        print(f"🎮 GAME: River dealt")
+        _log(f"🎮 GAME: River dealt")
         
     elif game.phase == GamePhase.RIVER:
         # Showdown
@@ -549,6 +568,16 @@ def _deal_remaining_cards(game: GameState):
     _determine_winner(game)
 
 
+def starting_hand_class(cards: List[Card]) -> str:
+    """Preflop hand class of two hole cards, e.g. "AA", "AKs", "T9o" (169 classes)"""
+    rank_chars = {14: 'A', 13: 'K', 12: 'Q', 11: 'J', 10: 'T'}
+    high, low = sorted(cards[:2], key=lambda c: c.rank, reverse=True)
+    name = rank_chars.get(high.rank, str(high.rank)) + rank_chars.get(low.rank, str(low.rank))
+    if high.rank == low.rank:
+        return name
+    return name + ("s" if high.suit == low.suit else "o")
+
+
 def evaluate_hand(cards: List[Card]) -> Tuple[int, List[int], str]:
     """
     Evaluate a poker hand and return (rank, tiebreakers, name)
@@ -617,7 +646,7 @@ def evaluate_hand(cards: List[Card]) -> Tuple[int, List[int], str]:
         return (4, [three_rank] + [r for r in ranks if r != three_rank][:2], "Three of a Kind")
     
     if counts[0] == 2 and counts[1] == 2:
-        pairs = sorted([r for r, c in rank_counts.items() if c == 2], reverse=True)
+        pairs = sorted([r for r, c in rank_counts.items() if c == 2], reverse=True)[:2]  # Best two of up to three pairs
         kicker = [r for r in ranks if r not in pairs][0]
         return (3, pairs + [kicker], "Two Pair")
     
@@ -660,7 +689,7 @@ def _determine_winner(game: GameState):
             all_cards = player.cards + game.community_cards
             hand = evaluate_hand(all_cards)
             
-            print(f"🎮 HAND: {player.name} has {hand[2]} ({hand[0]})")
+            _log(f"🎮 HAND: {player.name} has {hand[2]} ({hand[0]})")
             
             if hand[0] > best_hand[0]:
                 best_hand = hand
@@ -678,14 +707,15 @@ def _determine_winner(game: GameState):
     rake = _calculate_rake(game, game.pot)
     game.total_rake_collected = rake
     pot_after_rake = game.pot - rake
+    game.last_pot = game.pot
     
     winner.chips += pot_after_rake
     game.winner_seat = winner.seat
     game.winner_hand = hand_name
     
     if rake > 0:
-        print(f"🎮 RAKE: Collected ${rake} ({game.rake_percentage*100:.0f}% of ${game.pot})")
-    print(f"🎮 GAME: {winner.name} wins ${pot_after_rake} with {hand_name}!")
+        _log(f"🎮 RAKE: Collected ${rake} ({game.rake_percentage*100:.0f}% of ${game.pot})")
+    _log(f"🎮 GAME: {winner.name} wins ${pot_after_rake} with {hand_name}!")
     
     game.pot = 0
     game.phase = GamePhase.FINISHED
@@ -696,6 +726,7 @@ def start_new_hand(session_id: str) -> Optional[GameState]:
     game = active_games.get(session_id)
     if not game:
         return None
+    game.last_activity_at = now()
     
     # Reset for new hand
     game.deck = create_deck()
@@ -730,24 +761,32 @@ def start_new_hand(session_id: str) -> Optional[GameState]:
         sb_amount = min(game.small_blind, sb_player.chips)
         sb_player.chips -= sb_amount
         sb_player.current_bet = sb_amount
+        sb_player.is_all_in = sb_player.chips == 0
         game.pot += sb_amount
-        
+
         bb_amount = min(game.big_blind, bb_player.chips)
         bb_player.chips -= bb_amount
         bb_player.current_bet = bb_amount
+        bb_player.is_all_in = bb_player.chips == 0
         game.pot += bb_amount
-        game.current_bet = bb_amount
-        
-        # First to act
-        if len(active) > 2:
-            game.current_player_seat = active[2].seat
+        # A short-stacked big blind can post less than the small blind
+        game.current_bet = max(sb_amount, bb_amount)
+        game.min_raise = game.big_blind
+
+        # First to act (skip players all-in from posting a blind)
+        first_idx = 2 if len(active) > 2 else 0
+        order = active[first_idx:] + active[:first_idx]
+        can_act = [p for p in order if not p.is_all_in]
+
+        if can_act:
+            game.current_player_seat = can_act[0].seat
+            # Start turn timer
+            game.turn_start_time = now()
         else:
-            game.current_player_seat = sb_player.seat
-        
-        # Start turn timer
-        game.turn_start_time = time.time()
+            # Both blinds all-in: nothing to bet, run out the board
+            _deal_remaining_cards(game)
     
-    print(f"🎮 GAME: New hand started!")
+    _log(f"🎮 GAME: New hand started!")
     return game
 
 
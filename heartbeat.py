@@ -0,0 +1,105 @@
+"""
+Websocket Heartbeat
+One sweeper for every socket: a socket quiet for an interval gets a server ping, and one that
+has not answered (with anything) by the deadline is reaped - its cleanup runs right away instead
+of waiting for a broadcast to fail on it
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from clock import get_clock, now
+
+
+HEARTBEAT_INTERVAL_SECONDS = 20   # Quiet this long -> server sends {"type": "ping"}
+HEARTBEAT_TIMEOUT_SECONDS = 10    # No message within this long after the ping -> dead
+HEARTBEAT_SWEEP_SECONDS = 5
+HEARTBEAT_SEND_TIMEOUT_SECONDS = 2
+HEARTBEAT_CLOSE_CODE = 4408
+
+
+class _Beat:
+    __slots__ = ("websocket", "on_dead", "last_seen", "ping_sent_at")
+
+    def __init__(self, websocket: Any, on_dead: Optional[Callable[[], Awaitable]], moment: float):
+        self.websocket = websocket
+        self.on_dead = on_dead
+        self.last_seen = moment
+        self.ping_sent_at: Optional[float] = None
+
+
+class HeartbeatMonitor:
+    """
+    Sockets register with the cleanup to run if they die (the same, idempotent cleanup their
+    handler runs on disconnect) and report every incoming message through seen().
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = HEARTBEAT_INTERVAL_SECONDS,
+        timeout_seconds: float = HEARTBEAT_TIMEOUT_SECONDS
+    ):
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self._beats: Dict[Any, _Beat] = {}
+        self.reaped = 0
+
+    def __len__(self) -> int:
+        return len(self._beats)
+
+    def register(self, websocket: Any, on_dead: Optional[Callable[[], Awaitable]] = None):
+        self._beats[websocket] = _Beat(websocket, on_dead, now())
+
+    def unregister(self, websocket: Any):
+        self._beats.pop(websocket, None)
+
+    def seen(self, websocket: Any):
+        """Any message from the client proves it is alive (a pong is just the cheapest one)"""
+        beat = self._beats.get(websocket)
+        if beat:
+            beat.last_seen = now()
+            beat.ping_sent_at = None
+
+    async def sweep(self) -> int:
+        """Ping quiet sockets, reap the ones past their deadline; returns how many were reaped"""
+        moment = now()
+        dead = []
+        for beat in list(self._beats.values()):
+            if beat.ping_sent_at is not None:
+                if moment - beat.ping_sent_at >= self.timeout_seconds:
+                    dead.append(beat)
+            elif moment - beat.last_seen >= self.interval_seconds:
+                beat.ping_sent_at = moment
+                try:
+                    await asyncio.wait_for(beat.websocket.send_json({"type": "ping"}), HEARTBEAT_SEND_TIMEOUT_SECONDS)
+                except Exception:
+                    dead.append(beat)
+        for beat in dead:
+            await self._reap(beat)
+        return len(dead)
+
+    async def _reap(self, beat: _Beat):
+        if self._beats.get(beat.websocket) is not beat:
+            return  # Its handler already cleaned up
+        del self._beats[beat.websocket]
+        self.reaped += 1
+        if beat.on_dead:
+            try:
+                await beat.on_dead()
+            except Exception as e:
+                print(f"❌ HEARTBEAT: Cleanup failed: {e}")
+        try:
+            await asyncio.wait_for(beat.websocket.close(code=HEARTBEAT_CLOSE_CODE), HEARTBEAT_SEND_TIMEOUT_SECONDS)
+        except Exception:
+            pass
+
+    async def run(self, interval: float = HEARTBEAT_SWEEP_SECONDS):
+        """Background task: sweep forever"""
+        while True:
+            await get_clock().sleep(interval)
+            try:
+                reaped = await self.sweep()
+                if reaped:
+                    print(f"💓 HEARTBEAT: Closed {reaped} dead socket(s), {len(self)} live")
+            except Exception as e:
+                print(f"❌ HEARTBEAT: Sweep error: {e}")
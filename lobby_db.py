@@ -3,14 +3,26 @@ Lobby Database Module
 In-memory storage for private poker lobbies with Telegram integration
 """
 
+import heapq
 import uuid
 import time
 import random
 import string
-from typing import Dict, List, Optional, Any, Tuple
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
+from clock import get_clock, now
+
+
+LOBBY_TTL_SECONDS = 24 * 60 * 60
+LOBBY_SWEEP_SECONDS = 60
+
+LOBBY_CODE_CHARS = 'ABCDEFGHJKMNPQRSTUVWXYZ23456789'  # No confusing chars like 0,O,1,I,L
+LOBBY_CODE_LENGTH = 6
+LOBBY_CODE_QUARANTINE_SECONDS = 7 * 24 * 60 * 60  # Freed codes wait this long so old invite links go stale first
+
 
 @dataclass
 class LobbyPlayer:
@@ -19,7 +31,7 @@ class LobbyPlayer:
     username: Optional[str]
     first_name: str
     seat_number: int
-    joined_at: float = field(default_factory=time.time)
+    joined_at: float = field(default_factory=now)
     is_ready: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
@@ -44,12 +56,19 @@ class Lobby:
     buy_in: int
     game_mode: str  # 'cash' or 'tournament'
     status: str  # 'waiting', 'playing', 'finished'
-    created_at: float = field(default_factory=time.time)
-    expires_at: float = field(default_factory=lambda: time.time() + 24 * 60 * 60)
+    created_at: float = field(default_factory=now)
+    expires_at: float = field(default_factory=lambda: now() + LOBBY_TTL_SECONDS)
     started_at: Optional[float] = None
     finished_at: Optional[float] = None
     players: Dict[int, LobbyPlayer] = field(default_factory=dict)
     game_session_id: Optional[str] = None
+    # Bumped on every change pushed to lobby sockets, so clients can spot a missed event and resync
+    version: int = 0
+    _free_seats: List[int] = field(default_factory=list, repr=False, compare=False)  # Min-heap of open seats
+    
+    def __post_init__(self):
+        occupied = {p.seat_number for p in self.players.values()}
+        self._free_seats = [seat for seat in range(1, self.max_players + 1) if seat not in occupied]
     
     def to_dict(self, include_players: bool = True) -> Dict[str, Any]:
         result = {
@@ -68,48 +87,141 @@ class Lobby:
             "playerCount": len(self.players),
             "availableSeats": self.max_players - len(self.players),
             "gameSessionId": self.game_session_id,
+            "version": self.version,
         }
         if include_players:
             result["players"] = [p.to_dict() for p in sorted(self.players.values(), key=lambda x: x.seat_number)]
         return result
     
+    def touch(self) -> int:
+        self.version += 1
+        return self.version
+    
     def is_expired(self) -> bool:
-        return time.time() > self.expires_at
+        return now() > self.expires_at
     
     def is_full(self) -> bool:
         return len(self.players) >= self.max_players
     
     def get_next_seat(self) -> int:
-        """Get next available seat number"""
+        """Get next available seat number (lowest first)"""
+        return self._free_seats[0] if self._free_seats else -1
+    
+    def add_player(self, telegram_id: int, username: Optional[str], first_name: str, is_ready: bool = False) -> LobbyPlayer:
+        """Seat a player at the lowest open seat (caller checks is_full)"""
+        player = LobbyPlayer(
+            telegram_id=telegram_id,
+            username=username,
+            first_name=first_name,
+            seat_number=heapq.heappop(self._free_seats),
+            is_ready=is_ready,
+        )
+        self.players[telegram_id] = player
+        self.touch()
+        return player
+    
+    def remove_player(self, telegram_id: int) -> Optional[LobbyPlayer]:
+        player = self.players.pop(telegram_id, None)
+        if player:
+            heapq.heappush(self._free_seats, player.seat_number)
+            self.touch()
+        return player
+    
+    def resize(self, max_players: int):
+        """Change the table size (caller checks no one sits above it)"""
         occupied = {p.seat_number for p in self.players.values()}
-        for seat in range(1, self.max_players + 1):
-            if seat not in occupied:
-                return seat
-        return -1
+        self.max_players = max_players
+        self._free_seats = [seat for seat in range(1, max_players + 1) if seat not in occupied]
+
+
+class LobbyCodeAllocator:
+    """
+    Unique lobby codes in O(1), e.g. A7K9X2.
+    A counter is pushed through a keyed Feistel permutation of the whole code space (31^6, split
+    into two halves of 31^3), so consecutive lobbies get unrelated codes and no code repeats until
+    the space runs out. Codes of deleted lobbies are handed out again after a quarantine.
+    """
+    
+    def __init__(self, rounds: int = 4, rng: Optional[random.Random] = None):
+        self._half = len(LOBBY_CODE_CHARS) ** (LOBBY_CODE_LENGTH // 2)
+        self._size = self._half * self._half
+        rng = rng or random.SystemRandom()
+        self._keys = [rng.getrandbits(32) for _ in range(rounds)]
+        self._counter = 0
+        self._recycled: Deque[Tuple[float, str]] = deque()  # (reusable_at, code), oldest first
+    
+    @staticmethod
+    def _mix(value: int, key: int) -> int:
+        x = (value * 0x9E3779B1 + key) & 0xFFFFFFFF
+        x ^= x >> 15
+        x = (x * 0x85EBCA6B) & 0xFFFFFFFF
+        return x ^ (x >> 13)
+    
+    def _permute(self, value: int) -> int:
+        left, right = divmod(value, self._half)
+        for key in self._keys:
+            left, right = right, (left + self._mix(right, key)) % self._half
+        return left * self._half + right
+    
+    @staticmethod
+    def _encode(value: int) -> str:
+        chars = []
+        for _ in range(LOBBY_CODE_LENGTH):
+            value, digit = divmod(value, len(LOBBY_CODE_CHARS))
+            chars.append(LOBBY_CODE_CHARS[digit])
+        return ''.join(chars)
+    
+    def allocate(self) -> str:
+        if self._recycled and self._recycled[0][0] <= now():
+            return self._recycled.popleft()[1]
+        if self._counter >= self._size:
+            raise ValueError("Could not generate unique lobby code")
+        code = self._encode(self._permute(self._counter))
+        self._counter += 1
+        return code
+    
+    def release(self, code: str):
+        """Return a deleted lobby's code to the pool"""
+        self._recycled.append((now() + LOBBY_CODE_QUARANTINE_SECONDS, code))
+
+
+lobby_code_allocator = LobbyCodeAllocator()
+
+
+def create_unique_lobby_code() -> str:
+    """Allocate a lobby code that no live lobby is using"""
+    return lobby_code_allocator.allocate()
 
 
 # In-memory storage
 lobbies_db: Dict[str, Lobby] = {}  # lobby_id -> Lobby
 lobby_codes: Dict[str, str] = {}  # lobby_code -> lobby_id
+player_lobbies: Dict[int, Set[str]] = {}  # telegram_id -> codes of the lobbies they're in
+_expiry_heap: List[Tuple[float, str]] = []  # (expires_at, lobby_id); stale entries are skipped when popped
 
 
-def generate_lobby_code() -> str:
-    """
-    Generate a unique 6-character lobby code.
-    Format: A7K9X2 (letters and numbers, no confusing chars like 0,O,1,I,L)
-    """
-    # Exclude confusing characters
-    chars = 'ABCDEFGHJKMNPQRSTUVWXYZ23456789'
-    return ''.join(random.choices(chars, k=6))
+def _index_player(telegram_id: int, lobby_code: str):
+    player_lobbies.setdefault(telegram_id, set()).add(lobby_code)
 
 
-def create_unique_lobby_code() -> str:
-    """Generate a unique lobby code that doesn't exist in database"""
-    for _ in range(100):  # Max attempts
-        code = generate_lobby_code()
-        if code not in lobby_codes:
-            return code
-    raise ValueError("Could not generate unique lobby code")
+def _unindex_player(telegram_id: int, lobby_code: str):
+    codes = player_lobbies.get(telegram_id)
+    if codes is not None:
+        codes.discard(lobby_code)
+        if not codes:
+            del player_lobbies[telegram_id]
+
+
+def _schedule_expiry(lobby: Lobby):
+    heapq.heappush(_expiry_heap, (lobby.expires_at, lobby.id))
+
+
+def _delete_lobby(lobby: Lobby):
+    for telegram_id in lobby.players:
+        _unindex_player(telegram_id, lobby.lobby_code)
+    lobbies_db.pop(lobby.id, None)
+    if lobby_codes.pop(lobby.lobby_code, None):
+        lobby_code_allocator.release(lobby.lobby_code)
 
 
 async def create_lobby(
@@ -150,18 +262,13 @@ async def create_lobby(
     )
     
     # Add host as first player
-    host_player = LobbyPlayer(
-        telegram_id=host_telegram_id,
-        username=host_username,
-        first_name=host_first_name,
-        seat_number=1,
-        is_ready=True,  # Host is always ready
-    )
-    lobby.players[host_telegram_id] = host_player
+    lobby.add_player(host_telegram_id, host_username, host_first_name, is_ready=True)  # Host is always ready
     
     # Store in database
     lobbies_db[lobby_id] = lobby
     lobby_codes[lobby_code] = lobby_id
+    _index_player(host_telegram_id, lobby_code)
+    _schedule_expiry(lobby)
     
     print(f"✅ LOBBY: Created lobby {lobby_code} (ID: {lobby_id})")
     return lobby
@@ -211,19 +318,10 @@ async def join_lobby(
         return True, "Already in lobby", lobby  # Not an error, just return success
     
     # Add player
-    seat = lobby.get_next_seat()
-    if seat == -1:
-        return False, "No seats available", None
-    
-    player = LobbyPlayer(
-        telegram_id=telegram_id,
-        username=username,
-        first_name=first_name,
-        seat_number=seat,
-    )
-    lobby.players[telegram_id] = player
+    player = lobby.add_player(telegram_id, username, first_name)
+    _index_player(telegram_id, lobby.lobby_code)
     
-    print(f"✅ LOBBY: Player {telegram_id} joined lobby {lobby_code} at seat {seat}")
+    print(f"✅ LOBBY: Player {telegram_id} joined lobby {lobby_code} at seat {player.seat_number}")
     return True, "Joined successfully", lobby
 
 
@@ -242,17 +340,89 @@ async def leave_lobby(lobby_code: str, telegram_id: int) -> Tuple[bool, str]:
     
     # If host leaves, delete lobby
     if telegram_id == lobby.host_telegram_id:
-        del lobbies_db[lobby.id]
-        del lobby_codes[lobby.lobby_code]
+        _delete_lobby(lobby)
         print(f"🗑️ LOBBY: Lobby {lobby_code} deleted (host left)")
         return True, "Lobby deleted"
     
     # Remove player
-    del lobby.players[telegram_id]
+    lobby.remove_player(telegram_id)
+    _unindex_player(telegram_id, lobby.lobby_code)
     print(f"👋 LOBBY: Player {telegram_id} left lobby {lobby_code}")
     return True, "Left lobby"
 
 
+async def set_player_ready(lobby_code: str, telegram_id: int, ready: bool) -> Tuple[bool, str, Optional[Lobby]]:
+    """
+    Mark a player ready or not.
+    Returns: (success, message, lobby)
+    """
+    lobby = await get_lobby_by_code(lobby_code)
+    
+    if not lobby:
+        return False, "Lobby not found", None
+    
+    player = lobby.players.get(telegram_id)
+    if not player:
+        return False, "Not in lobby", None
+    
+    if telegram_id == lobby.host_telegram_id:
+        return True, "Host is always ready", lobby
+    
+    if player.is_ready != ready:
+        player.is_ready = ready
+        lobby.touch()
+    return True, "Ready" if ready else "Not ready", lobby
+
+
+async def update_lobby_settings(
+    lobby_code: str,
+    host_telegram_id: int,
+    lobby_name: Optional[str] = None,
+    max_players: Optional[int] = None,
+    buy_in: Optional[int] = None
+) -> Tuple[bool, str, Optional[Lobby], Dict[str, Any]]:
+    """
+    Change lobby settings before the game starts. Only host can change them.
+    Returns: (success, message, lobby, changes) where changes holds the updated fields as in to_dict
+    """
+    lobby = await get_lobby_by_code(lobby_code)
+    
+    if not lobby:
+        return False, "Lobby not found", None, {}
+    
+    if lobby.host_telegram_id != host_telegram_id:
+        return False, "Only host can change settings", None, {}
+    
+    if lobby.status != "waiting":
+        return False, "Game has already started", None, {}
+    
+    if max_players is not None:
+        if max_players < 2 or max_players > 9:
+            return False, "Max players must be between 2 and 9", None, {}
+        highest_seat = max(p.seat_number for p in lobby.players.values())
+        if max_players < highest_seat:
+            return False, f"Seat {highest_seat} is taken", None, {}
+    if buy_in is not None and buy_in < 10:
+        return False, "Buy-in must be at least 10", None, {}
+    
+    changes: Dict[str, Any] = {}
+    if lobby_name is not None and lobby_name.strip() and lobby_name.strip() != lobby.lobby_name:
+        lobby.lobby_name = lobby_name.strip()
+        changes["lobbyName"] = lobby.lobby_name
+    if max_players is not None and max_players != lobby.max_players:
+        lobby.resize(max_players)
+        changes["maxPlayers"] = max_players
+        changes["availableSeats"] = max_players - len(lobby.players)
+    if buy_in is not None and buy_in != lobby.buy_in:
+        lobby.buy_in = buy_in
+        changes["buyIn"] = buy_in
+    
+    if changes:
+        lobby.touch()
+        print(f"⚙️ LOBBY: Settings of {lobby.lobby_code} changed: {changes}")
+    return True, "Settings updated" if changes else "No changes", lobby, changes
+
+
 async def start_game(lobby_code: str, host_telegram_id: int) -> Tuple[bool, str, Optional[str]]:
     """
     Start the game. Only host can start.
@@ -277,8 +447,9 @@ async def start_game(lobby_code: str, host_telegram_id: int) -> Tuple[bool, str,
     
     # Update lobby status
     lobby.status = "playing"
-    lobby.started_at = time.time()
+    lobby.started_at = now()
     lobby.game_session_id = game_session_id
+    lobby.touch()
     
     print(f"🎮 LOBBY: Game started for lobby {lobby_code}, session: {game_session_id}")
     return True, "Game started", game_session_id
@@ -291,32 +462,45 @@ async def finish_game(lobby_code: str) -> bool:
         return False
     
     lobby.status = "finished"
-    lobby.finished_at = time.time()
+    lobby.finished_at = now()
+    lobby.expires_at = min(lobby.expires_at, lobby.finished_at)  # Swept with the expired ones
+    _schedule_expiry(lobby)
     return True
 
 
 async def get_player_lobbies(telegram_id: int) -> List[Lobby]:
     """Get all lobbies a player is in"""
-    return [
-        lobby for lobby in lobbies_db.values()
-        if telegram_id in lobby.players and not lobby.is_expired()
-    ]
+    lobbies = []
+    for code in player_lobbies.get(telegram_id, ()):
+        lobby = lobbies_db.get(lobby_codes.get(code, ""))
+        if lobby and not lobby.is_expired():
+            lobbies.append(lobby)
+    lobbies.sort(key=lambda lobby: lobby.created_at)
+    return lobbies
 
 
 async def cleanup_expired_lobbies() -> int:
-    """Remove expired lobbies. Returns count of removed."""
-    expired = [
-        lobby_id for lobby_id, lobby in lobbies_db.items()
-        if lobby.is_expired() or lobby.status == "finished"
-    ]
-    
-    for lobby_id in expired:
+    """Remove expired (and finished) lobbies, soonest-expiring first. Returns count of removed."""
+    moment = now()
+    removed = 0
+    while _expiry_heap and _expiry_heap[0][0] <= moment:
+        _, lobby_id = heapq.heappop(_expiry_heap)
         lobby = lobbies_db.get(lobby_id)
-        if lobby:
-            del lobby_codes[lobby.lobby_code]
-        del lobbies_db[lobby_id]
+        if lobby and lobby.expires_at <= moment:
+            _delete_lobby(lobby)
+            removed += 1
     
-    if expired:
-        print(f"🧹 LOBBY: Cleaned up {len(expired)} expired lobbies")
+    if removed:
+        print(f"🧹 LOBBY: Cleaned up {removed} expired lobbies")
     
-    return len(expired)
+    return removed
+
+
+async def run_lobby_sweeper(interval: float = LOBBY_SWEEP_SECONDS):
+    """Background task: expire lobbies every `interval` seconds"""
+    while True:
+        await get_clock().sleep(interval)
+        try:
+            await cleanup_expired_lobbies()
+        except Exception as e:
+            print(f"❌ LOBBY: Sweep error: {e}")
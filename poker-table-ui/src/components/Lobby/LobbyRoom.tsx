@@ -24,8 +24,39 @@ interface LobbyData {
   availableSeats: number;
   players: LobbyPlayer[];
   gameSessionId?: string;
+  version?: number;
 }
 
+// Incremental lobby events from the socket, applied to the last known state
+const applyLobbyEvent = (prev: LobbyData, message: any): LobbyData => {
+  switch (message.type) {
+    case 'playerJoined':
+      if (prev.players.some(p => p.telegramId === message.player.telegramId)) return prev;
+      return {
+        ...prev,
+        players: [...prev.players, message.player],
+        playerCount: message.playerCount,
+        availableSeats: prev.maxPlayers - message.playerCount,
+      };
+    case 'playerLeft':
+      return {
+        ...prev,
+        players: prev.players.filter(p => p.telegramId !== message.telegramId),
+        playerCount: message.playerCount,
+        availableSeats: prev.maxPlayers - message.playerCount,
+      };
+    case 'playerReady':
+      return {
+        ...prev,
+        players: prev.players.map(p => (p.telegramId === message.telegramId ? { ...p, isReady: message.ready } : p)),
+      };
+    case 'lobbySettings':
+      return { ...prev, ...message.changes };
+    default:
+      return prev;
+  }
+};
+
 interface LobbyRoomProps {
   lobbyCode: string;
   onGameStart: (gameSessionId: string) => void;
@@ -41,6 +72,7 @@ export const LobbyRoom: React.FC<LobbyRoomProps> = ({ lobbyCode, onGameStart, on
   const [copied, setCopied] = useState(false);
   
   const wsRef = useRef<WebSocket | null>(null);
+  const versionRef = useRef<number | null>(null);
   const currentUserId = useRef<number | null>(null);
 
   // Get current Telegram user
@@ -95,33 +127,34 @@ export const LobbyRoom: React.FC<LobbyRoomProps> = ({ lobbyCode, onGameStart, on
         const message = JSON.parse(event.data);
         console.log('📩 Lobby WS message:', message);
 
+        // Incremental events carry the lobby version; on a gap ask for the full state
+        if (message.version !== undefined && message.type !== 'lobbyState') {
+          if (versionRef.current !== null && message.version !== versionRef.current + 1) {
+            console.log('🔄 Lobby version gap, resyncing');
+            ws.send(JSON.stringify({ type: 'getState' }));
+            return;
+          }
+          versionRef.current = message.version;
+        }
+
         switch (message.type) {
+          case 'ping':
+            // Server heartbeat: answer or the server closes the socket
+            ws.send(JSON.stringify({ type: 'pong' }));
+            break;
           case 'lobbyState':
+            versionRef.current = message.lobby?.version ?? null;
             setLobby(message.lobby);
             break;
           case 'playerJoined':
-            setLobby(prev => {
-              if (!prev) return prev;
-              const exists = prev.players.some(p => p.telegramId === message.player.telegramId);
-              if (exists) return prev;
-              return {
-                ...prev,
-                players: [...prev.players, message.player],
-                playerCount: message.playerCount,
-                availableSeats: prev.maxPlayers - message.playerCount,
-              };
-            });
-            break;
           case 'playerLeft':
-            setLobby(prev => {
-              if (!prev) return prev;
-              return {
-                ...prev,
-                players: prev.players.filter(p => p.telegramId !== message.telegramId),
-                playerCount: prev.playerCount - 1,
-                availableSeats: prev.availableSeats + 1,
-              };
-            });
+          case 'playerReady':
+          case 'lobbySettings':
+            setLobby(prev => (prev ? applyLobbyEvent(prev, message) : prev));
+            break;
+          case 'lobbyClosed':
+            setError(message.reason ? `Lobby closed: ${message.reason}` : 'Lobby closed');
+            ws.close();
             break;
           case 'gameStarted':
             console.log('🎮 Game started:', message.gameSessionId);
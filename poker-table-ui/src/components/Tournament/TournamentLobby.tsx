@@ -156,6 +156,7 @@ export const TournamentLobby: React.FC<TournamentLobbyProps> = ({
           telegram_id: telegramId,
           username: username,
           first_name: firstName,
+          initData: (window as any).Telegram?.WebApp?.initData || '',
         }),
       });
       
@@ -186,6 +187,7 @@ export const TournamentLobby: React.FC<TournamentLobbyProps> = ({
     try {
       const response = await fetch(`${API_BASE}/api/tournaments/${tournamentId}/unregister?telegram_id=${telegramId}`, {
         method: 'POST',
+        headers: { 'X-Telegram-Init-Data': (window as any).Telegram?.WebApp?.initData || '' },
       });
       
       const data = await response.json();
@@ -15,11 +15,23 @@ export const api = {
     start: (code: string) => `${API_URL}/api/lobby/${code}/start`,
   },
   ws: {
-    lobby: (code: string) => `${WS_URL}/ws/lobby/${code}`,
+    // The lobby socket only admits members, identified by their Telegram initData
+    lobby: (code: string) => `${WS_URL}/ws/lobby/${code}?${telegramIdentityParams().toString()}`,
     table: (tableId: string) => `${WS_URL}/ws/${tableId}`,
   },
 };
 
+// initData (verified by the server) plus the bare telegramId it accepts in local browser mode
+export const telegramIdentityParams = () => {
+  const webApp = (window as any).Telegram?.WebApp;
+  const params = new URLSearchParams({ initData: webApp?.initData || '' });
+  const telegramId = webApp?.initDataUnsafe?.user?.id;
+  if (telegramId) {
+    params.set('telegramId', String(telegramId));
+  }
+  return params;
+};
+
 // Generate invite link for Telegram
 export const getInviteLink = (lobbyCode: string) => {
   return `https://t.me/${BOT_USERNAME}?start=lobby_${lobbyCode}`;
@@ -5,6 +5,11 @@ import { fetchCurrentUser } from '../services/userService';
 
 type ConnectionStatus = 'idle' | 'connecting' | 'connected' | 'error';
 
+// Exponential backoff 1s..16s: five attempts cover the server's 30s resume grace window
+const RECONNECT_BASE_DELAY_MS = 1000;
+const RECONNECT_MAX_DELAY_MS = 16000;
+const RECONNECT_MAX_ATTEMPTS = 5;
+
 interface UsePokerSocketResult {
   currentUser: CurrentUserProfile | null;
   tableState: ServerTableState | null;
@@ -14,12 +19,26 @@ interface UsePokerSocketResult {
   socket: WebSocket | null;
 }
 
-const buildWsUrl = (base: string, tableId: string, user: CurrentUserProfile) => {
+interface ResumeState {
+  token: string | null;
+  lastSeq: number;
+}
+
+const buildWsUrl = (base: string, tableId: string, user: CurrentUserProfile, resume?: ResumeState) => {
   const sanitizedBase = base.replace(/\/$/, '');
   const params = new URLSearchParams({
     user_id: user.userId,
     display_name: user.displayName,
+    initData: (window as any).Telegram?.WebApp?.initData || '',
   });
+  if (user.sessionToken) {
+    params.set('sessionToken', user.sessionToken);
+  }
+  // Same seat and only the missed messages, if the server still holds the stream
+  if (resume?.token) {
+    params.set('resumeToken', resume.token);
+    params.set('lastSeq', String(resume.lastSeq));
+  }
   return `${sanitizedBase}/ws/tables/${tableId}?${params.toString()}`;
 };
 
@@ -29,6 +48,7 @@ export const usePokerSocket = (tableId: string): UsePokerSocketResult => {
   const [connectionStatus, setConnectionStatus] = useState<ConnectionStatus>('idle');
   const [error, setError] = useState<string | null>(null);
   const socketRef = useRef<WebSocket | null>(null);
+  const resumeRef = useRef<ResumeState>({ token: null, lastSeq: 0 });
 
   useEffect(() => {
     let cancelled = false;
@@ -60,40 +80,75 @@ export const usePokerSocket = (tableId: string): UsePokerSocketResult => {
       return;
     }
 
-    setConnectionStatus('connecting');
-    setError(null);
-
-    const url = buildWsUrl(SERVER_WS_URL, tableId, currentUser);
-    const socket = new WebSocket(url);
-    socketRef.current = socket;
-
-    socket.onopen = () => {
-      setConnectionStatus('connected');
-    };
-
-    socket.onmessage = (event) => {
-      try {
-        const message = JSON.parse(event.data);
-        if (message.type === 'state') {
-          setTableState(message.payload as ServerTableState);
+    let disposed = false;
+    let reconnectAttempts = 0;
+    let reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+    resumeRef.current = { token: null, lastSeq: 0 };
+
+    const connect = (isReconnect: boolean) => {
+      setConnectionStatus('connecting');
+      setError(null);
+
+      const url = buildWsUrl(SERVER_WS_URL, tableId, currentUser, isReconnect ? resumeRef.current : undefined);
+      const socket = new WebSocket(url);
+      socketRef.current = socket;
+      let socketLastSeq = 0;
+
+      socket.onopen = () => {
+        reconnectAttempts = 0;
+        setConnectionStatus('connected');
+      };
+
+      socket.onmessage = (event) => {
+        try {
+          const message = JSON.parse(event.data);
+          if (typeof message.seq === 'number') {
+            socketLastSeq = Math.max(socketLastSeq, message.seq);
+            resumeRef.current.lastSeq = Math.max(resumeRef.current.lastSeq, message.seq);
+          }
+          if (message.type === 'ping') {
+            // Server heartbeat: answer or the server closes the socket
+            socket.send(JSON.stringify({ type: 'pong' }));
+          } else if (message.type === 'welcome') {
+            if (!message.payload?.resumed) {
+              // A fresh seat (the resume window had passed) numbers its messages from the start again
+              resumeRef.current.lastSeq = socketLastSeq;
+            }
+            resumeRef.current.token = message.payload?.resumeToken ?? null;
+          } else if (message.type === 'state') {
+            setTableState(message.payload as ServerTableState);
+          }
+        } catch (err) {
+          console.error('Failed to parse WS message', err);
         }
-      } catch (err) {
-        console.error('Failed to parse WS message', err);
-      }
-    };
-
-    socket.onerror = (event) => {
-      console.error('WebSocket error', event);
-      setError('Ошибка подключения к серверу');
-      setConnectionStatus('error');
+      };
+
+      socket.onerror = (event) => {
+        console.error('WebSocket error', event);
+        setError('Ошибка подключения к серверу');
+        setConnectionStatus('error');
+      };
+
+      socket.onclose = (event) => {
+        if (disposed || event.wasClean || reconnectAttempts >= RECONNECT_MAX_ATTEMPTS) {
+          setConnectionStatus('idle');
+          return;
+        }
+        reconnectAttempts += 1;
+        const delay = Math.min(RECONNECT_BASE_DELAY_MS * 2 ** (reconnectAttempts - 1), RECONNECT_MAX_DELAY_MS);
+        setConnectionStatus('connecting');
+        reconnectTimer = setTimeout(() => connect(true), delay);
+      };
     };
 
-    socket.onclose = () => {
-      setConnectionStatus('idle');
-    };
+    connect(false);
 
     return () => {
-      socket.close();
+      disposed = true;
+      if (reconnectTimer) {
+        clearTimeout(reconnectTimer);
+      }
+      socketRef.current?.close();
     };
   }, [currentUser, tableId]);
 
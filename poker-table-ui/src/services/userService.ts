@@ -7,7 +7,7 @@ export const fetchCurrentUser = async (): Promise<CurrentUserProfile> => {
     headers: {
       'Content-Type': 'application/json',
     },
-    body: JSON.stringify({ initData: '' }),
+    body: JSON.stringify({ initData: (window as any).Telegram?.WebApp?.initData || '' }),
   });
 
   if (!response.ok) {
@@ -19,5 +19,6 @@ export const fetchCurrentUser = async (): Promise<CurrentUserProfile> => {
     userId: payload.user_id,
     displayName: payload.display_name,
     balance: payload.balance,
+    sessionToken: payload.session_token,
   };
 };
@@ -53,4 +53,6 @@ export interface CurrentUserProfile {
   userId: string;
   displayName: string;
   balance: number;
+  // From /api/me when initData verified; sockets send it instead of initData
+  sessionToken?: string | null;
 }
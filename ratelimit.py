@@ -0,0 +1,113 @@
+"""
+Websocket Message Limits
+Token buckets per connection and command class, plus light schema checks on incoming messages,
+so a misbehaving client cannot turn a flood of small messages into a flood of full broadcasts
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from clock import now
+
+
+RateLimit = Tuple[float, float]  # (tokens per second, burst)
+
+LIMIT_MAX_STRIKES = 50  # Refused messages in a row before the socket is closed
+
+
+class TokenBucket:
+    """Refilled lazily from the elapsed time on each take()"""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float, moment: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = moment
+
+    def take(self, moment: float) -> float:
+        """Spend one token; returns 0 if allowed, else seconds until one is available"""
+        self.tokens = min(self.capacity, self.tokens + (moment - self.updated_at) * self.rate)
+        self.updated_at = moment
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class ConnectionLimiter:
+    """
+    One per socket. Commands map to classes (chat, play, control...) and each class has its own
+    bucket, so spamming chat never eats into the budget for real game actions.
+    Unknown commands share the `default_class` bucket.
+    """
+
+    def __init__(self, limits: Dict[str, RateLimit], classes: Dict[str, str], default_class: str = "other"):
+        self._limits = limits
+        self._classes = classes
+        self._default_class = default_class
+        self._buckets: Dict[str, TokenBucket] = {}
+        self.strikes = 0  # Refusals since the last admitted message
+
+    def check(self, command: Any) -> float:
+        """0 if the command may run now, else seconds to wait"""
+        name = self._classes.get(command, self._default_class) if isinstance(command, str) else self._default_class
+        moment = now()
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            rate, burst = self._limits[name]
+            bucket = self._buckets[name] = TokenBucket(rate, burst, moment)
+        wait = bucket.take(moment)
+        self.strikes = self.strikes + 1 if wait else 0
+        return wait
+
+    @property
+    def exhausted(self) -> bool:
+        return self.strikes >= LIMIT_MAX_STRIKES
+
+
+# ═══════════════════════════════════════════════════
+# MESSAGE SCHEMAS
+# ═══════════════════════════════════════════════════
+
+@dataclass(frozen=True)
+class Field:
+    """One field of an incoming message; fields not listed in a schema are ignored"""
+    types: Any                       # Type or tuple of types (bool never passes as a number)
+    required: bool = False
+    max_length: Optional[int] = None
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+
+
+MessageSchemas = Dict[str, Dict[str, Field]]  # message kind -> field name -> Field
+
+
+def validate_message(message: Any, schemas: MessageSchemas, key: str = "type") -> Tuple[Optional[str], Optional[str]]:
+    """(kind, error) for an incoming message, kind read from `key`; error is None when it fits its schema"""
+    if not isinstance(message, dict):
+        return None, "message must be an object"
+    kind = message.get(key)
+    if not isinstance(kind, str) or kind not in schemas:
+        return None, f"unknown {key}: {kind!r}"
+
+    for name, spec in schemas[kind].items():
+        value = message.get(name)
+        if value is None:
+            if spec.required:
+                return kind, f"{name} is required"
+            continue
+        if not isinstance(value, spec.types) or (isinstance(value, bool) and bool not in _as_tuple(spec.types)):
+            return kind, f"{name} has the wrong type"
+        if spec.max_length is not None and len(value) > spec.max_length:
+            return kind, f"{name} is too long"
+        if spec.min_value is not None and value < spec.min_value:
+            return kind, f"{name} is too small"
+        if spec.max_value is not None and value > spec.max_value:
+            return kind, f"{name} is too large"
+    return kind, None
+
+
+def _as_tuple(types: Any) -> tuple:
+    return types if isinstance(types, tuple) else (types,)
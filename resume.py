@@ -0,0 +1,138 @@
+"""
+Websocket Resume
+Numbered outbound streams that survive a dropped socket: a client reconnecting with its resume
+token and last sequence number within the grace window gets back the same seat and only what it
+missed, instead of a fresh seat lookup and a full state dump
+"""
+
+import asyncio
+import secrets
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional
+
+from clock import get_clock, now
+
+
+RESUME_GRACE_SECONDS = 30    # A dropped socket keeps its stream (and seat) this long
+RESUME_BUFFER_SIZE = 64      # Events kept per stream for replay
+
+
+class ResumableStream:
+    """
+    Everything sent to one viewer, stamped with a sequence number.
+    Two kinds of message: snapshots (full state; only the newest matters, so while the viewer is
+    away one is merely owed and built on resume) and events (chat, notices; buffered for replay).
+    """
+
+    def __init__(self, token: str, key: Hashable, buffer_size: int = RESUME_BUFFER_SIZE):
+        self.token = token
+        self.key = key                          # What the stream is attached to, e.g. (session_id, seat)
+        self.seq = 0
+        self.websocket: Optional[Any] = None
+        self.detached_at: Optional[float] = None
+        self._events: Deque[Dict[str, Any]] = deque()
+        self._buffer_size = buffer_size
+        self._floor = 0                         # Highest event seq dropped from the buffer
+        self._snapshot_seq = 0                  # Seq of the newest snapshot, sent or owed
+
+    @property
+    def attached(self) -> bool:
+        return self.websocket is not None
+
+    async def snapshot(self, build: Callable[[], Dict[str, Any]]):
+        """Send fresh state now, or owe it until the viewer is back"""
+        self.seq += 1
+        self._snapshot_seq = self.seq
+        if self.websocket is not None:
+            message = build()
+            message["seq"] = self.seq
+            await self.websocket.send_json(message)
+
+    async def event(self, message: Dict[str, Any]):
+        self.seq += 1
+        message = {**message, "seq": self.seq}
+        if len(self._events) >= self._buffer_size:
+            self._floor = self._events.popleft()["seq"]
+        self._events.append(message)
+        if self.websocket is not None:
+            await self.websocket.send_json(message)
+
+    def attach(self, websocket: Any):
+        self.websocket = websocket
+        self.detached_at = None
+
+    def detach(self):
+        self.websocket = None
+        self.detached_at = now()
+
+    async def replay(self, last_seq: int, build: Callable[[], Dict[str, Any]]) -> int:
+        """
+        Send what the viewer missed after last_seq: buffered events, then one fresh snapshot if
+        any snapshot (or an event that fell out of the buffer) came after it. Returns messages sent.
+        """
+        sent = 0
+        for message in self._events:
+            if message["seq"] > last_seq:
+                await self.websocket.send_json(message)
+                sent += 1
+        if last_seq < self._snapshot_seq or last_seq < self._floor:
+            message = build()
+            message["seq"] = self.seq
+            await self.websocket.send_json(message)
+            sent += 1
+        return sent
+
+
+class ResumeRegistry:
+    """
+    Resume token -> stream. A detached stream is dropped once it has been away for the grace
+    window, and its on_expire callback runs then (e.g. a table finally removes the player).
+    """
+
+    def __init__(self, grace_seconds: float = RESUME_GRACE_SECONDS, buffer_size: int = RESUME_BUFFER_SIZE):
+        self.grace_seconds = grace_seconds
+        self.buffer_size = buffer_size
+        self._streams: Dict[str, ResumableStream] = {}
+        self._expiry_tasks: Dict[str, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+    def open(self, key: Hashable) -> ResumableStream:
+        token = secrets.token_urlsafe(16)
+        stream = ResumableStream(token, key, self.buffer_size)
+        self._streams[token] = stream
+        return stream
+
+    def get(self, token: Optional[str]) -> Optional[ResumableStream]:
+        """The stream behind a token while it is alive; callers check stream.key is theirs"""
+        return self._streams.get(token) if token else None
+
+    def resume(self, stream: ResumableStream, websocket: Any):
+        task = self._expiry_tasks.pop(stream.token, None)
+        if task:
+            task.cancel()
+        stream.attach(websocket)
+
+    def detach(self, stream: ResumableStream, on_expire: Optional[Callable[[], Awaitable]] = None):
+        """The socket is gone: keep the stream for the grace window, then drop it"""
+        stream.detach()
+        old = self._expiry_tasks.pop(stream.token, None)
+        if old:
+            old.cancel()
+        self._expiry_tasks[stream.token] = asyncio.create_task(self._expire(stream, on_expire))
+
+    def close(self, stream: ResumableStream):
+        self._streams.pop(stream.token, None)
+        task = self._expiry_tasks.pop(stream.token, None)
+        if task:
+            task.cancel()
+
+    async def _expire(self, stream: ResumableStream, on_expire: Optional[Callable[[], Awaitable]]):
+        await get_clock().sleep(self.grace_seconds)
+        if stream.attached:
+            return
+        self._expiry_tasks.pop(stream.token, None)
+        self._streams.pop(stream.token, None)
+        if on_expire:
+            await on_expire()
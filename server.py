@@ -1,10 +1,8 @@
 import os
-import hmac
 import hashlib
 import urllib.parse
 import asyncio
 import random
-import time
 from collections import Counter
 from dataclasses import dataclass, field
 from itertools import combinations
@@ -18,9 +16,9 @@ try:
 except ImportError:
     print("⚠️ python-dotenv not installed, using system env vars")
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Body, Request
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Body, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -28,16 +26,23 @@ from db import get_user, top_balances, set_display_name
 from lobby_db import (
     create_lobby, get_lobby_by_code, get_lobby_by_id,
     join_lobby, leave_lobby, start_game, finish_game,
-    get_player_lobbies, cleanup_expired_lobbies, Lobby
+    set_player_ready, update_lobby_settings,
+    get_player_lobbies, cleanup_expired_lobbies, run_lobby_sweeper, Lobby
 )
 from game_engine import (
     create_game, start_hand, process_action, get_game,
     end_game, GameState, get_active_players
 )
 from tournament_engine import (
-    tournament_manager, TournamentMode, TournamentStatus, SnGFormat,
-    create_default_tournaments
+    tournament_manager, tournament_orchestrator, tournament_scheduler, tournament_archiver, TournamentMode, TournamentStatus, SnGFormat,
+    PlayerTournamentIndex, create_default_tournaments
 )
+from auth import TelegramAuth
+from resume import ResumableStream, ResumeRegistry
+from heartbeat import HeartbeatMonitor
+from ratelimit import ConnectionLimiter, Field, MessageSchemas, RateLimit, validate_message
+from clock import Clock, get_clock
+from bots import BOT_NAMES, cards_from_dicts, decide, play_bot_turns
 import json
 
 # ═══════════════════════════════════════════════════
@@ -107,41 +112,17 @@ async def index():
     })
 
 
+telegram_auth = TelegramAuth(os.getenv("TELEGRAM_TOKEN"))
+# Telegram ids allowed to run admin-only endpoints, comma separated
+ADMIN_TELEGRAM_IDS = {int(x) for x in os.getenv("ADMIN_TELEGRAM_IDS", "").split(",") if x.strip().isdigit()}
+
+
 def _parse_init_data(init_data: str) -> Dict[str, str]:
     # initData is URL-encoded key=value pairs separated by &
     parsed = urllib.parse.parse_qsl(init_data, keep_blank_values=True)
     return {k: v for k, v in parsed}
 
 
-def _check_telegram_auth(init_data: str, bot_token: str) -> Dict[str, Any]:
-    if not init_data:
-        raise HTTPException(status_code=401, detail="missing initData")
-    data = _parse_init_data(init_data)
-    if "hash" not in data:
-        raise HTTPException(status_code=401, detail="missing hash")
-    tg_hash = data.pop("hash")
-
-    # Build data-check-string in alphabetical order by key
-    data_check_arr = [f"{k}={v}" for k, v in sorted(data.items())]
-    data_check_string = "\n".join(data_check_arr)
-
-    secret_key = hashlib.sha256(bot_token.encode()).digest()
-    h = hmac.new(secret_key, data_check_string.encode(), hashlib.sha256).hexdigest()
-    if not hmac.compare_digest(h, tg_hash):
-        raise HTTPException(status_code=401, detail="bad signature")
-
-    # Extract user JSON if present
-    user_json = data.get("user")
-    user: Dict[str, Any] = {}
-    if user_json:
-        import json
-        try:
-            user = json.loads(user_json)
-        except Exception:
-            user = {}
-    return {"data": data, "user": user}
-
-
 RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
 SUITS = ["hearts", "diamonds", "clubs", "spades"]
 MAX_PLAYERS = 6
@@ -166,6 +147,7 @@ ACTION_TIMEOUT_SECONDS = 30
 SMALL_BLIND = 10
 BIG_BLIND = 20
 BUSTOUT_TIMEOUT_SECONDS = 30
+BOT_THINK_SECONDS = 1.0  # Pause before a bot acts so clients can follow (the decision itself takes microseconds)
 
 
 def create_shuffled_deck() -> List[Dict[str, str]]:
@@ -273,13 +255,110 @@ class TablePlayer:
     is_all_in: bool = False
     is_busted: bool = False
     bust_deadline_ms: Optional[int] = None
+    is_bot: bool = False
+
+
+# ═══════════════════════════════════════════════════
+# WEBSOCKET MESSAGE LIMITS
+# ═══════════════════════════════════════════════════
+
+# Token buckets per connection and command class (tokens per second, burst)
+WS_RATE_LIMITS: Dict[str, RateLimit] = {
+    "ping": (1.0, 5),
+    "play": (5.0, 10),      # Bets, folds, show/muck
+    "chat": (1.0, 3),
+    "control": (0.5, 2),    # Each one changes shared state and broadcasts it to the whole table/lobby
+    "query": (1.0, 3),      # Full state rebuilt for one socket
+    "other": (1.0, 3),      # Unknown or malformed messages
+}
+
+WS_COMMAND_CLASSES: Dict[str, str] = {
+    "ping": "ping", "pong": "ping",
+    "action": "play", "fold": "play", "check": "play", "call": "play", "bet": "play", "raise": "play",
+    "all_in": "play", "rebuy": "play", "leave_table": "play", "showcards": "play",
+    "chat": "chat",
+    "start_hand": "control", "advance_stage": "control", "add_bot": "control", "new_hand": "control",
+    "ready": "control", "settings": "control",
+    "getState": "query", "getLeaderboard": "query",
+}
+
+_AMOUNT = Field((int, float), min_value=0)
+
+# /ws/tables: {"type": "action", "payload": {"command": ..., ...}}
+TABLE_MESSAGES: MessageSchemas = {
+    "ping": {},
+    "pong": {},  # Reply to a server heartbeat ping
+    "action": {"payload": Field(dict, required=True)},
+}
+TABLE_ACTIONS: MessageSchemas = {
+    "fold": {}, "check": {}, "call": {}, "all_in": {}, "rebuy": {}, "leave_table": {},
+    "bet": {"amount": _AMOUNT},
+    "raise": {"amount": _AMOUNT},
+    "showcards": {"show": Field(bool)},
+    "chat": {"message": Field(str, required=True, max_length=200)},
+    "start_hand": {}, "advance_stage": {}, "add_bot": {},
+}
+GAME_MESSAGES: MessageSchemas = {
+    "ping": {},
+    "pong": {},  # Reply to a server heartbeat ping
+    "action": {"action": Field(str, required=True, max_length=16), "amount": _AMOUNT},
+    "new_hand": {},
+    "chat": {"message": Field(str, required=True, max_length=20), "senderName": Field(str, max_length=64)},  # Quick phrases are short
+}
+LOBBY_MESSAGES: MessageSchemas = {
+    "ping": {},
+    "pong": {},  # Reply to a server heartbeat ping
+    "getState": {},
+    "ready": {"ready": Field((bool, int))},
+    "settings": {"lobbyName": Field(str, max_length=64), "maxPlayers": Field(int), "buyIn": Field((int, float))},
+}
+TOURNAMENT_MESSAGES: MessageSchemas = {
+    "ping": {},
+    "pong": {},  # Reply to a server heartbeat ping
+    "getLeaderboard": {},
+    "getState": {},
+}
+
+
+def _ws_limiter() -> ConnectionLimiter:
+    return ConnectionLimiter(WS_RATE_LIMITS, WS_COMMAND_CLASSES)
+
+
+async def _admit_ws_message(websocket: WebSocket, limiter: ConnectionLimiter, command: Optional[str], error: Optional[str]) -> bool:
+    """
+    Rate-limit, then validate, one incoming message; False means drop it.
+    A refused streak gets one error reply; a client that keeps pushing past its budget is disconnected.
+    """
+    wait = limiter.check(command)
+    if wait:
+        if limiter.exhausted:
+            await websocket.close(code=1008)
+            raise WebSocketDisconnect(code=1008)
+        if limiter.strikes == 1:
+            await websocket.send_json({"type": "error", "message": "Too many messages", "retryAfterMs": int(wait * 1000) + 1})
+        return False
+    if error:
+        await websocket.send_json({"type": "error", "message": f"Invalid message: {error}"})
+        return False
+    return True
+
+
+# Server-driven ping/pong for every socket; one sweeper reaps the ones that stop answering
+heartbeat_monitor = HeartbeatMonitor()
+
+
+# Resume tokens for table and game sockets: a dropped client that reconnects within the grace
+# window keeps its seat and gets only what it missed (keys: ("table", table_id, user_id), ("game", session_id, seat))
+resume_registry = ResumeRegistry()
 
 
 class TableSession:
-    def __init__(self, table_id: str):
+    def __init__(self, table_id: str, clock: Optional[Clock] = None):
         self.table_id = table_id
+        self.clock = clock or get_clock()  # Action, showdown and bust-out timers run on this clock
         self.players: Dict[str, TablePlayer] = {}
         self.connections: Dict[str, WebSocket] = {}
+        self.streams: Dict[str, ResumableStream] = {}  # Outlive connections for the resume grace window
         self.community_cards: List[Dict[str, str]] = []
         self.pot: int = 0
         self.stage: str = "preflop"
@@ -302,6 +381,8 @@ class TableSession:
         self.turn_deadline_ms: Optional[int] = None
         self.showdown_card_decisions: Dict[str, bool] = {}  # Track show/hide decisions after showdown
         self.showdown_saved_cards: Dict[str, List[Tuple[str, str]]] = {}  # Save cards before clearing for Show/Muck
+        self.bot_rng = random.Random()
+        self.bots_added = 0
 
     def _ordered_players(self) -> List[TablePlayer]:
         return [player for player in sorted(self.players.values(), key=lambda p: p.seat)]
@@ -377,7 +458,11 @@ class TableSession:
             player.is_all_in = False
             if player.stack <= 0:
                 player.is_busted = True
-            player.bust_deadline_ms = None
+                player.has_folded = True  # Sits out until rebuy or bust-out removal
+                if player.user_id not in self.bustout_tasks:
+                    self._schedule_bustout(player)
+            else:
+                player.bust_deadline_ms = None
         self._rotate_button()
         self._post_blinds()
         self._deal_hole_cards()
@@ -525,9 +610,12 @@ class TableSession:
         player = self.players.get(active_id)
         if not player or player.has_folded:
             return
-        deadline = int((time.time() + ACTION_TIMEOUT_SECONDS) * 1000)
+        deadline = int((self.clock.time() + ACTION_TIMEOUT_SECONDS) * 1000)
         self.turn_deadline_ms = deadline
-        self.action_timer_task = asyncio.create_task(self._auto_fold_after_timeout(active_id, deadline))
+        if player.is_bot:
+            self.action_timer_task = asyncio.create_task(self._bot_turn(active_id, deadline))
+        else:
+            self.action_timer_task = asyncio.create_task(self._auto_fold_after_timeout(active_id, deadline))
 
     def _post_blinds(self):
         ordered = self._ordered_players()
@@ -551,7 +639,7 @@ class TableSession:
             player.is_big_blind = False
             player.blind_amount = 0
 
-        now = int(time.time() * 1000)
+        now = int(self.clock.time() * 1000)
         small_player = ordered[small_idx]
         big_player = ordered[big_idx]
 
@@ -653,7 +741,7 @@ class TableSession:
                     self.event_log.append({
                         "type": "system",
                         "message": f"{winner_name} wins the pot",
-                        "timestamp": int(time.time() * 1000),
+                        "timestamp": int(self.clock.time() * 1000),
                     })
                     # Emit handComplete event for win by fold
                     asyncio.create_task(self._emit_hand_complete([winner_player.user_id], pot_amount, "fold"))
@@ -663,7 +751,7 @@ class TableSession:
                 self.pots = []
                 self.side_pot_summary = []
                 self.stage = "showdown"
-                now = int(time.time() * 1000)
+                now = int(self.clock.time() * 1000)
                 if not winner_player:
                     self.event_log.append({"type": "system", "message": "Hand ended", "timestamp": now})
                 self._cancel_action_timer()
@@ -682,12 +770,12 @@ class TableSession:
 
     async def _auto_advance_after_delay(self, stage_snapshot: str):
         try:
-            await asyncio.sleep(BETTING_ROUND_DELAY)
+            await self.clock.sleep(BETTING_ROUND_DELAY)
             async with self.lock:
                 if self.stage != stage_snapshot:
                     return
                 self._advance_stage()
-                now = int(time.time() * 1000)
+                now = int(self.clock.time() * 1000)
                 self.event_log.append({"type": "system", "message": f"Stage -> {self.stage}", "timestamp": now})
                 await self._maybe_trigger_round_completion()
                 await self._broadcast_state_locked()
@@ -699,7 +787,7 @@ class TableSession:
     async def _auto_start_new_hand(self):
         try:
             print(f"⏳ SERVER: Waiting {SHOWDOWN_DELAY} seconds before new hand...")
-            await asyncio.sleep(SHOWDOWN_DELAY)
+            await self.clock.sleep(SHOWDOWN_DELAY)
             async with self.lock:
                 print(f"🔍 SERVER: Checking conditions - stage={self.stage}, players={len(self.players)}")
                 if self.stage != "showdown":
@@ -710,7 +798,7 @@ class TableSession:
                     return
                 print("🎲 SERVER: Starting new hand!")
                 self._reset_round()
-                now = int(time.time() * 1000)
+                now = int(self.clock.time() * 1000)
                 self.event_log.append({"type": "system", "message": "New hand started", "timestamp": now})
                 print("📡 SERVER: Broadcasting new game state (preflop)")
                 await self._broadcast_state_locked()
@@ -722,7 +810,7 @@ class TableSession:
 
     async def _auto_fold_after_timeout(self, user_id: str, deadline_ms: int):
         try:
-            await asyncio.sleep(ACTION_TIMEOUT_SECONDS)
+            await self.clock.sleep(ACTION_TIMEOUT_SECONDS)
             async with self.lock:
                 if self.active_user_id != user_id or self.turn_deadline_ms != deadline_ms:
                     return
@@ -731,7 +819,7 @@ class TableSession:
                     return
                 player.has_folded = True
                 self._record_action(user_id)
-                now = int(time.time() * 1000)
+                now = int(self.clock.time() * 1000)
                 self.event_log.append({
                     "type": "action",
                     "userId": user_id,
@@ -749,6 +837,43 @@ class TableSession:
             if self.action_timer_task is None and self.active_user_id == user_id:
                 self.turn_deadline_ms = None
 
+    def _bot_decision(self, player: TablePlayer) -> Dict[str, Any]:
+        committed = self._player_contribution(player.user_id)
+        action, raise_to = decide(
+            cards_from_dicts(player.cards),
+            cards_from_dicts(self.community_cards),
+            to_call=self._required_to_call(player),
+            pot=self.pot + sum(self.player_bets.values()),
+            stack=player.stack,
+            committed=committed,
+            current_bet=self.current_bet,
+            min_raise_to=self._current_min_raise_total(),
+            big_blind=BIG_BLIND,
+            rng=self.bot_rng,
+        )
+        if action == "raise":
+            # TableSession bets are chips added this action, not the street total
+            return {"command": "raise" if self.current_bet else "bet", "amount": raise_to - committed}
+        return {"command": action}
+
+    async def _bot_turn(self, user_id: str, deadline_ms: int):
+        try:
+            await self.clock.sleep(BOT_THINK_SECONDS)
+            async with self.lock:
+                if self.active_user_id != user_id or self.turn_deadline_ms != deadline_ms:
+                    return
+                player = self.players.get(user_id)
+                if not player or player.has_folded or self.stage == "showdown":
+                    return
+                payload = self._bot_decision(player)
+                # Acting restarts the action timer; detach so it doesn't cancel this task
+                self.action_timer_task = None
+            await self.handle_action(user_id, payload)
+            if self.active_user_id == user_id and self.turn_deadline_ms == deadline_ms:
+                await self.handle_action(user_id, {"command": "fold"})  # Rejected action
+        except asyncio.CancelledError:
+            return
+
     def _record_action(self, actor_id: str, *, resets_others: bool = False):
         player = self.players.get(actor_id)
         if not player:
@@ -759,16 +884,19 @@ class TableSession:
                 if other.user_id != actor_id:
                     other.has_acted = False
 
-    async def add_player(self, user_id: str, display_name: str, websocket: WebSocket):
+    async def add_player(self, user_id: str, display_name: str, websocket: Optional[WebSocket], is_bot: bool = False):
         async with self.lock:
             if user_id in self.players:
-                # reconnect
-                self.connections[user_id] = websocket
+                # reconnect without a resume token: fresh stream, full state
+                if websocket:
+                    stream = self._open_stream(user_id, websocket)
+                    await stream.snapshot(lambda: self._state_message(user_id))
                 return
             seat = self._next_seat()
-            player = TablePlayer(user_id=user_id, display_name=display_name, seat=seat)
+            player = TablePlayer(user_id=user_id, display_name=display_name, seat=seat, is_bot=is_bot)
             self.players[user_id] = player
-            self.connections[user_id] = websocket
+            if websocket:
+                self._open_stream(user_id, websocket)
             if len(self.players) == 1:
                 self.button_user_id = user_id
                 self.active_user_id = user_id
@@ -780,7 +908,7 @@ class TableSession:
             )
             if should_auto_start:
                 self._reset_round()
-                now = int(time.time() * 1000)
+                now = int(self.clock.time() * 1000)
                 self.event_log.append({"type": "system", "message": "New hand started", "timestamp": now})
             await self._maybe_trigger_round_completion()
             await self._broadcast_state_locked()
@@ -810,18 +938,13 @@ class TableSession:
     async def _emit_hand_complete(self, winner_ids: List[str], pot_amount: int, win_type: str):
         """Emit handComplete event to all connected clients for win banner animation"""
         print(f"🏆 SERVER: Emitting handComplete - winners: {winner_ids}, pot: {pot_amount}, type: {win_type}")
-        for user_id, ws in self.connections.items():
-            try:
-                await ws.send_json({
-                    "type": "handComplete",
-                    "winners": winner_ids,
-                    "potAmount": pot_amount,
-                    "potPerWinner": pot_amount // len(winner_ids) if winner_ids else 0,
-                    "winType": win_type
-                })
-                print(f"✅ SERVER: Sent handComplete to {user_id}")
-            except Exception as e:
-                print(f"❌ SERVER: Failed to send handComplete to {user_id}: {e}")
+        await self._send_event({
+            "type": "handComplete",
+            "winners": winner_ids,
+            "potAmount": pot_amount,
+            "potPerWinner": pot_amount // len(winner_ids) if winner_ids else 0,
+            "winType": win_type
+        })
 
     def _resolve_showdown(self):
         if self.stage != "showdown":
@@ -882,8 +1005,9 @@ class TableSession:
                 "type": "system",
                 "message": f"{busted.display_name} busted out",
                 "userId": busted.user_id,
-                "timestamp": int(time.time() * 1000),
+                "timestamp": int(self.clock.time() * 1000),
             })
+            self._schedule_bustout(busted)
         
         # Emit handComplete event for win banner animation
         if winner_ids and total_pot > 0:
@@ -909,22 +1033,71 @@ class TableSession:
                     "showCards": False
                 })
         
-        for user_id, ws in self.connections.items():
-            try:
-                await ws.send_json({
-                    "type": "showdownComplete",
-                    "winnerId": winner_ids[0] if winner_ids else None,
-                    "winners": winner_ids,
-                    "losers": losers_data
-                })
-                print(f"✅ SERVER: Sent showdownComplete to {user_id}")
-            except Exception as e:
-                print(f"❌ SERVER: Failed to send showdownComplete to {user_id}: {e}")
+        await self._send_event({
+            "type": "showdownComplete",
+            "winnerId": winner_ids[0] if winner_ids else None,
+            "winners": winner_ids,
+            "losers": losers_data
+        })
+
+    async def add_bot(self) -> Optional[str]:
+        """Seat a bot in the next free seat; returns its user_id (None if the table is full)"""
+        if len(self.players) >= MAX_PLAYERS:
+            return None
+        self.bots_added += 1
+        bot_id = f"bot_{self.bots_added}"
+        name = BOT_NAMES[(self.bots_added - 1) % len(BOT_NAMES)]
+        await self.add_player(bot_id, name, None, is_bot=True)
+        return bot_id
+
+    def _open_stream(self, user_id: str, websocket: WebSocket) -> ResumableStream:
+        old = self.streams.get(user_id)
+        if old:
+            resume_registry.close(old)
+        stream = resume_registry.open(("table", self.table_id, user_id))
+        stream.attach(websocket)
+        self.streams[user_id] = stream
+        self.connections[user_id] = websocket
+        return stream
+
+    async def resume_player(self, user_id: str, websocket: WebSocket, stream: ResumableStream, last_seq: int) -> int:
+        """Reattach a dropped client to its seat and send what it missed since last_seq"""
+        async with self.lock:
+            resume_registry.resume(stream, websocket)
+            self.connections[user_id] = websocket
+            await websocket.send_json({
+                "type": "welcome",
+                "payload": {"tableId": self.table_id, "resumeToken": stream.token, "resumed": True},
+            })
+            return await stream.replay(last_seq, lambda: self._state_message(user_id))
+
+    async def detach_player(self, user_id: str, websocket: WebSocket):
+        """The socket dropped: hold the seat for the resume grace window instead of removing the player"""
+        async with self.lock:
+            stream = self.streams.get(user_id)
+            if stream is None or stream.websocket not in (websocket, None) or stream.detached_at is not None:
+                return  # Replaced by a newer socket, or already detached (heartbeat reaped it)
+            if self.connections.get(user_id) is websocket:
+                del self.connections[user_id]
+
+            async def _expire():
+                if self.streams.get(user_id) is stream:
+                    await self.remove_player(user_id)
+
+            resume_registry.detach(stream, on_expire=_expire)
 
     async def remove_player(self, user_id: str):
         async with self.lock:
             self.connections.pop(user_id, None)
+            stream = self.streams.pop(user_id, None)
+            if stream:
+                resume_registry.close(stream)
             removed = self.players.pop(user_id, None)
+            if removed and not removed.is_bot and all(p.is_bot for p in self.players.values()):
+                # Last human left: bots don't keep playing to an empty table
+                for bot in list(self.players.values()):
+                    self._cancel_bustout_task(bot.user_id)
+                    self.players.pop(bot.user_id)
             if removed and self.button_user_id == user_id:
                 self._rotate_button()
             if self.active_user_id == user_id:
@@ -1062,12 +1235,12 @@ class TableSession:
 
     def _schedule_bustout(self, player: TablePlayer):
         self._cancel_bustout_task(player.user_id)
-        deadline = int((time.time() + BUSTOUT_TIMEOUT_SECONDS) * 1000)
+        deadline = int((self.clock.time() + BUSTOUT_TIMEOUT_SECONDS) * 1000)
         player.bust_deadline_ms = deadline
 
         async def _auto_remove():
             try:
-                await asyncio.sleep(BUSTOUT_TIMEOUT_SECONDS)
+                await self.clock.sleep(BUSTOUT_TIMEOUT_SECONDS)
                 should_remove = False
                 async with self.lock:
                     if player.is_busted and player.user_id in self.players:
@@ -1088,8 +1261,13 @@ class TableSession:
     async def handle_action(self, user_id: str, payload: Dict[str, Any]):
         command = (payload.get("command") or "").lower()
         pending_removal = False
+        if command == "add_bot":
+            # Seated players can fill an empty seat with a bot (add_player takes the lock itself)
+            if user_id in self.players:
+                await self.add_bot()
+            return
         async with self.lock:
-            now = int(time.time() * 1000)
+            now = int(self.clock.time() * 1000)
 
             if command == "start_hand":
                 self._reset_round()
@@ -1135,19 +1313,13 @@ class TableSession:
                     
                     # Broadcast visibility decision to ALL connected players
                     print(f"📡 SERVER: Broadcasting to {len(self.connections)} connected players")
-                    for uid, ws in self.connections.items():
-                        try:
-                            message = {
-                                "type": "playerCardsVisibility",
-                                "playerId": user_id,
-                                "nickname": player.display_name,
-                                "show": show,
-                                "cards": cards_data
-                            }
-                            await ws.send_json(message)
-                            print(f"✅ SERVER: Sent playerCardsVisibility to {uid}: {message}")
-                        except Exception as e:
-                            print(f"❌ SERVER: Failed to send playerCardsVisibility to {uid}: {e}")
+                    await self._send_event({
+                        "type": "playerCardsVisibility",
+                        "playerId": user_id,
+                        "nickname": player.display_name,
+                        "show": show,
+                        "cards": cards_data
+                    })
                 else:
                     print(f"❌ SERVER: Player {user_id} not found!")
                 return
@@ -1217,6 +1389,7 @@ class TableSession:
             "blindAmount": player.blind_amount,
             "isBusted": player.is_busted,
             "bustDeadlineMs": player.bust_deadline_ms,
+            "isBot": player.is_bot,
         }
 
     def _state_for_viewer(self, viewer_id: str) -> Dict[str, Any]:
@@ -1244,17 +1417,35 @@ class TableSession:
             "minRaiseTotal": self._current_min_raise_total(),
         }
 
+    def _state_message(self, user_id: str) -> Dict[str, Any]:
+        return {"type": "state", "payload": self._state_for_viewer(user_id)}
+
     async def _broadcast_state_locked(self):
+        # Detached viewers only have a snapshot marked as owed; it is built if they resume
         stale: Set[str] = set()
-        for user_id, ws in self.connections.items():
+        for user_id, stream in self.streams.items():
             try:
-                await ws.send_json({"type": "state", "payload": self._state_for_viewer(user_id)})
-            except RuntimeError:
-                stale.add(user_id)
+                await stream.snapshot(lambda: self._state_message(user_id))
             except Exception:
                 stale.add(user_id)
+        self._drop_stale(stale)
+
+    async def _send_event(self, message: Dict[str, Any]):
+        """Numbered event to every viewer, kept for replay to those who drop and resume"""
+        stale: Set[str] = set()
+        for user_id, stream in self.streams.items():
+            try:
+                await stream.event(message)
+            except Exception as e:
+                print(f"❌ SERVER: Failed to send {message['type']} to {user_id}: {e}")
+                stale.add(user_id)
+        self._drop_stale(stale)
+
+    def _drop_stale(self, stale: Set[str]):
+        # The socket's handler sees the disconnect and starts the grace window
         for user_id in stale:
             self.connections.pop(user_id, None)
+            self.streams[user_id].websocket = None
 
 
 class TableManager:
@@ -1284,11 +1475,12 @@ async def me(payload: Dict[str, str]):
             "balance_usd": float(db_user["balance"]),  # Real USD balance
         }
 
-    bot_token = os.getenv("TELEGRAM_TOKEN")
-    if not bot_token:
+    if not telegram_auth.configured:
         raise HTTPException(status_code=500, detail="server misconfigured: TELEGRAM_TOKEN not set")
-    auth = _check_telegram_auth(init_data, bot_token)
-    user = auth.get("user") or {}
+    try:
+        user = telegram_auth.verify(init_data)
+    except ValueError as e:
+        raise HTTPException(status_code=401, detail=str(e))
     user_id = user.get("id") or 0
     display = user.get("first_name") or "Player"
 
@@ -1299,6 +1491,9 @@ async def me(payload: Dict[str, str]):
         "user_id": db_user["user_id"],
         "display_name": db_user.get("display_name") or display,
         "balance_usd": float(db_user["balance"]),  # Real USD balance
+        # Send as "Authorization: Bearer <token>" (or ?sessionToken= on websockets) to skip initData checks
+        "session_token": telegram_auth.issue_session(user) if user_id else None,
+        "session_expires_in": telegram_auth.session_ttl_seconds,
     }
 
 
@@ -1311,18 +1506,43 @@ async def api_top():
 @app.websocket("/ws/tables/{table_id}")
 async def table_websocket(websocket: WebSocket, table_id: str):
     await websocket.accept()
-    user_id = websocket.query_params.get("user_id")
-    display_name = websocket.query_params.get("display_name", "Guest")
-    if not user_id:
-        await websocket.close(code=4000)
+    user = _socket_user(websocket, "user_id")
+    if not user:
+        await websocket.close(code=4401 if telegram_auth.configured else 4000)
         return
+    user_id = str(user["id"])
+    display_name = user.get("first_name") or websocket.query_params.get("display_name", "Guest")
     table = await table_manager.get_table(table_id)
+    # ?resumeToken=&lastSeq= from the previous welcome / last message: same seat, only missed messages
+    stream = resume_registry.get(websocket.query_params.get("resumeToken"))
     try:
-        await table.add_player(user_id=user_id, display_name=display_name, websocket=websocket)
-        await websocket.send_json({"type": "welcome", "payload": {"tableId": table_id}})
+        if stream and stream.key == ("table", table_id, user_id) and table.streams.get(user_id) is stream:
+            try:
+                last_seq = int(websocket.query_params.get("lastSeq", 0))
+            except ValueError:
+                last_seq = 0
+            await table.resume_player(user_id, websocket, stream, last_seq)
+        else:
+            await table.add_player(user_id=user_id, display_name=display_name, websocket=websocket)
+            stream = table.streams[user_id]
+            await websocket.send_json({
+                "type": "welcome",
+                "payload": {"tableId": table_id, "resumeToken": stream.token},
+            })
+        heartbeat_monitor.register(websocket, on_dead=lambda: table.detach_player(user_id, websocket))
+        limiter = _ws_limiter()
         while True:
             data = await websocket.receive_json()
-            msg_type = data.get("type")
+            heartbeat_monitor.seen(websocket)
+            msg_type, error = validate_message(data, TABLE_MESSAGES)
+            command = msg_type
+            if msg_type == "action" and not error:
+                payload = data["payload"]
+                if isinstance(payload.get("command"), str):
+                    payload["command"] = payload["command"].lower()
+                command, error = validate_message(payload, TABLE_ACTIONS, key="command")
+            if not await _admit_ws_message(websocket, limiter, command, error):
+                continue
             if msg_type == "ping":
                 await websocket.send_json({"type": "pong"})
             elif msg_type == "action":
@@ -1331,11 +1551,13 @@ async def table_websocket(websocket: WebSocket, table_id: str):
             else:
                 continue
     except WebSocketDisconnect:
-        await table.remove_player(user_id)
+        await table.detach_player(user_id, websocket)
     except Exception:
         await table.remove_player(user_id)
         await websocket.close(code=1011)
         raise
+    finally:
+        heartbeat_monitor.unregister(websocket)
 
 
 # ============================================
@@ -1346,7 +1568,7 @@ BOT_USERNAME = os.environ.get("BOT_USERNAME", "Pokergamebot")
 print(f"🤖 Using Telegram bot: @{BOT_USERNAME}")
 
 # Lobby WebSocket connections
-lobby_connections: Dict[str, Dict[str, WebSocket]] = {}  # lobby_code -> {user_id -> websocket}
+lobby_connections: Dict[str, Dict[int, WebSocket]] = {}  # lobby_code -> {telegram_id -> websocket}
 
 
 def _extract_telegram_user(init_data: str) -> Dict[str, Any]:
@@ -1361,6 +1583,70 @@ def _extract_telegram_user(init_data: str) -> Dict[str, Any]:
         return {}
 
 
+def _authenticate(init_data: str = "", session_token: str = "") -> Dict[str, Any]:
+    """
+    Telegram user behind a call: a session token from /api/me, else initData (verified when
+    TELEGRAM_TOKEN is set, read unverified in local browser mode). {} when nobody is identified.
+    """
+    if session_token:
+        user = telegram_auth.resolve_session(session_token)
+        if user:
+            return user
+    if telegram_auth.configured:
+        try:
+            return telegram_auth.verify(init_data)
+        except ValueError:
+            return {}
+    return _extract_telegram_user(init_data)
+
+
+async def request_user(request: Request) -> Dict[str, Any]:
+    """
+    Auth dependency for REST endpoints. Reads "Authorization: Bearer <session token>", then initData
+    from the X-Telegram-Init-Data header, the query string or the JSON body.
+    """
+    authorization = request.headers.get("authorization", "")
+    session_token = authorization[7:].strip() if authorization.lower().startswith("bearer ") else ""
+    init_data = request.headers.get("x-telegram-init-data") or request.query_params.get("initData", "")
+    if not init_data and request.method == "POST":  # Body initData backs up an expired session token
+        try:
+            body = await request.json()
+            if isinstance(body, dict):
+                init_data = body.get("initData") or ""
+        except Exception:
+            pass
+    return _authenticate(init_data, session_token)
+
+
+def _require_admin(user: Dict[str, Any]):
+    """403 unless the verified caller is in ADMIN_TELEGRAM_IDS (open in local browser mode without TELEGRAM_TOKEN)"""
+    if telegram_auth.configured and user.get("id") not in ADMIN_TELEGRAM_IDS:
+        raise HTTPException(status_code=403, detail="Admin only")
+
+
+def _socket_user(websocket: WebSocket, id_param: str) -> Dict[str, Any]:
+    """
+    Telegram user of a socket from its sessionToken or initData query param, like request_user.
+    Without TELEGRAM_TOKEN (local browser mode) a bare `id_param` query param is accepted too.
+    {} when nobody is identified.
+    """
+    user = _authenticate(
+        websocket.query_params.get("initData", ""),
+        websocket.query_params.get("sessionToken", ""),
+    )
+    if user.get("id") or telegram_auth.configured:
+        return user
+    claimed = websocket.query_params.get(id_param)
+    return {"id": claimed} if claimed else {}
+
+
+def _socket_telegram_id(websocket: WebSocket, id_param: str) -> Optional[int]:
+    try:
+        return int(_socket_user(websocket, id_param).get("id"))
+    except (TypeError, ValueError):
+        return None
+
+
 class CreateLobbyRequest(BaseModel):
     lobbyName: Optional[str] = None
     buyIn: int = 100
@@ -1378,8 +1664,15 @@ class JoinLobbyRequest(BaseModel):
     firstName: Optional[str] = None
     username: Optional[str] = None
 
+class LobbySettingsRequest(BaseModel):
+    initData: str = ""
+    telegramId: Optional[int] = None  # Browser mode fallback
+    lobbyName: Optional[str] = None
+    maxPlayers: Optional[int] = None
+    buyIn: Optional[int] = None
+
 @app.post("/api/lobby/create")
-async def api_create_lobby(request: CreateLobbyRequest):
+async def api_create_lobby(request: CreateLobbyRequest, user: Dict[str, Any] = Depends(request_user)):
     """
     Create a new private lobby.
     Telegram user info from initData.
@@ -1387,13 +1680,12 @@ async def api_create_lobby(request: CreateLobbyRequest):
     lobbyName = request.lobbyName
     buyIn = request.buyIn
     maxPlayers = request.maxPlayers
-    initData = request.initData
     print(f"🎯 API: Create lobby request - name={lobbyName}, buyIn={buyIn}, max={maxPlayers}")
     
-    # Extract user from initData
-    user = _extract_telegram_user(initData)
     if not user:
-        # Use fallback user info from request (browser mode)
+        if telegram_auth.configured:
+            raise HTTPException(status_code=401, detail="User not authenticated")
+        # Local browser mode: fallback user info from request
         if request.telegramId:
             user = {
                 "id": request.telegramId,
@@ -1456,13 +1748,14 @@ async def api_get_lobby(lobby_code: str):
 
 
 @app.post("/api/lobby/{lobby_code}/join")
-async def api_join_lobby(lobby_code: str, request: JoinLobbyRequest):
+async def api_join_lobby(lobby_code: str, request: JoinLobbyRequest, user: Dict[str, Any] = Depends(request_user)):
     """Join an existing lobby"""
     print(f"🎯 API: Join lobby {lobby_code}")
     
-    user = _extract_telegram_user(request.initData)
     if not user:
-        # Try fallback data from request
+        if telegram_auth.configured:
+            raise HTTPException(status_code=401, detail="User not authenticated")
+        # Local browser mode: fallback data from request
         if request.telegramId and request.firstName:
             user = {
                 "id": request.telegramId,
@@ -1494,11 +1787,13 @@ async def api_join_lobby(lobby_code: str, request: JoinLobbyRequest):
         raise HTTPException(status_code=400, detail=message)
     
     # Broadcast to lobby room
-    await _broadcast_lobby_event(lobby_code, {
-        "type": "playerJoined",
-        "player": lobby.players[telegram_id].to_dict(),
-        "playerCount": len(lobby.players),
-    })
+    if message != "Already in lobby":
+        await _broadcast_lobby_event(lobby.lobby_code, {
+            "type": "playerJoined",
+            "player": lobby.players[telegram_id].to_dict(),
+            "playerCount": len(lobby.players),
+            "version": lobby.version,
+        })
     
     return {
         "success": True,
@@ -1508,11 +1803,10 @@ async def api_join_lobby(lobby_code: str, request: JoinLobbyRequest):
 
 
 @app.post("/api/lobby/{lobby_code}/leave")
-async def api_leave_lobby(lobby_code: str, request: JoinLobbyRequest):
+async def api_leave_lobby(lobby_code: str, request: JoinLobbyRequest, user: Dict[str, Any] = Depends(request_user)):
     """Leave a lobby"""
     print(f"🎯 API: Leave lobby {lobby_code}")
     
-    user = _extract_telegram_user(request.initData)
     if not user:
         raise HTTPException(status_code=401, detail="User not authenticated")
     
@@ -1524,23 +1818,59 @@ async def api_leave_lobby(lobby_code: str, request: JoinLobbyRequest):
         raise HTTPException(status_code=400, detail=message)
     
     # Broadcast to lobby room
-    await _broadcast_lobby_event(lobby_code, {
-        "type": "playerLeft",
-        "telegramId": telegram_id,
-    })
+    lobby_code = lobby_code.upper()
+    lobby = await get_lobby_by_code(lobby_code)
+    if lobby:
+        await _broadcast_lobby_event(lobby_code, {
+            "type": "playerLeft",
+            "telegramId": telegram_id,
+            "playerCount": len(lobby.players),
+            "version": lobby.version,
+        })
+    else:
+        await _broadcast_lobby_event(lobby_code, {"type": "lobbyClosed", "reason": "Host left"})
+        lobby_connections.pop(lobby_code, None)
     
     return {"success": True, "message": message}
 
 
+@app.post("/api/lobby/{lobby_code}/settings")
+async def api_lobby_settings(lobby_code: str, request: LobbySettingsRequest, user: Dict[str, Any] = Depends(request_user)):
+    """Change lobby settings before the game starts. Only host can change them."""
+    # The body's telegramId is only trusted in local browser mode, as on lobby sockets
+    telegram_id = user.get("id") if user else (None if telegram_auth.configured else request.telegramId)
+    if not telegram_id:
+        raise HTTPException(status_code=401, detail="User not authenticated")
+    
+    success, message, lobby, changes = await update_lobby_settings(
+        lobby_code,
+        telegram_id,
+        lobby_name=request.lobbyName,
+        max_players=request.maxPlayers,
+        buy_in=request.buyIn,
+    )
+    
+    if not success:
+        raise HTTPException(status_code=400, detail=message)
+    
+    if changes:
+        await _broadcast_lobby_event(lobby.lobby_code, {
+            "type": "lobbySettings",
+            "changes": changes,
+            "version": lobby.version,
+        })
+    
+    return {"success": True, "message": message, "lobby": lobby.to_dict()}
+
+
 @app.post("/api/lobby/{lobby_code}/start")
-async def api_start_game(lobby_code: str, request: JoinLobbyRequest):
+async def api_start_game(lobby_code: str, request: JoinLobbyRequest, user: Dict[str, Any] = Depends(request_user)):
     """Start the game. Only host can start."""
     print(f"🎯 API: Start game in lobby {lobby_code}")
     
-    user = _extract_telegram_user(request.initData)
     if not user:
-        # For development: get host from lobby
-        lobby = await get_lobby_by_code(lobby_code)
+        # Local browser mode only: act as the host from the lobby
+        lobby = None if telegram_auth.configured else await get_lobby_by_code(lobby_code)
         if lobby:
             # Use the host's telegram_id
             telegram_id = lobby.host_telegram_id
@@ -1575,7 +1905,7 @@ async def api_start_game(lobby_code: str, request: JoinLobbyRequest):
         print(f"🎮 API: Game created with {len(players_data)} players")
     
     # Broadcast game started to all players
-    await _broadcast_lobby_event(lobby_code, {
+    await _broadcast_lobby_event(lobby_code.upper(), {
         "type": "gameStarted",
         "gameSessionId": game_session_id,
         "lobby": lobby.to_dict() if lobby else None,
@@ -1682,9 +2012,8 @@ async def get_users_count():
 
 
 @app.get("/api/my-lobbies")
-async def api_get_my_lobbies(initData: str = ""):
+async def api_get_my_lobbies(user: Dict[str, Any] = Depends(request_user)):
     """Get all lobbies current user is in"""
-    user = _extract_telegram_user(initData)
     if not user:
         return {"success": True, "lobbies": []}
     
@@ -1702,37 +2031,58 @@ async def _broadcast_lobby_event(lobby_code: str, event: Dict[str, Any]):
     connections = lobby_connections.get(lobby_code, {})
     stale = []
     
-    for user_id, ws in connections.items():
+    for telegram_id, ws in list(connections.items()):
         try:
             await ws.send_json(event)
         except Exception:
-            stale.append(user_id)
+            stale.append(telegram_id)
     
-    for user_id in stale:
-        connections.pop(user_id, None)
+    for telegram_id in stale:
+        connections.pop(telegram_id, None)
 
 
 @app.websocket("/ws/lobby/{lobby_code}")
 async def lobby_websocket(websocket: WebSocket, lobby_code: str):
-    """WebSocket endpoint for lobby real-time updates"""
+    """
+    WebSocket endpoint for lobby real-time updates.
+    Sends lobbyState once, then incremental events (playerJoined, playerLeft, playerReady,
+    lobbySettings, gameStarted, lobbyClosed) carrying the lobby version; a client that sees a gap
+    sends getState to resync.
+    """
     await websocket.accept()
     
+    lobby_code = lobby_code.upper()
     lobby = await get_lobby_by_code(lobby_code)
     if not lobby:
         await websocket.send_json({"type": "error", "message": "Lobby not found"})
         await websocket.close()
         return
     
-    # Get user ID from query params or generate temporary one
-    user_id = str(random.randint(100000, 999999))
+    telegram_id = _socket_telegram_id(websocket, "telegramId")
+    if not telegram_id:
+        await websocket.send_json({"type": "error", "message": "User not authenticated"})
+        await websocket.close(code=4401)
+        return
+    if telegram_id not in lobby.players:
+        await websocket.send_json({"type": "error", "message": "Not in lobby"})
+        await websocket.close(code=4403)
+        return
     
-    # Add to lobby connections
+    # Add to lobby connections (a reconnect replaces the old socket)
     if lobby_code not in lobby_connections:
         lobby_connections[lobby_code] = {}
-    lobby_connections[lobby_code][user_id] = websocket
+    lobby_connections[lobby_code][telegram_id] = websocket
+    
+    print(f"🔌 LOBBY WS: User {telegram_id} connected to lobby {lobby_code}")
     
-    print(f"🔌 LOBBY WS: User {user_id} connected to lobby {lobby_code}")
+    async def _release():
+        connections = lobby_connections.get(lobby_code)
+        if connections is not None and connections.get(telegram_id) is websocket:
+            del connections[telegram_id]
+            if not connections:
+                del lobby_connections[lobby_code]
     
+    heartbeat_monitor.register(websocket, on_dead=_release)
     try:
         # Send current lobby state
         await websocket.send_json({
@@ -1740,31 +2090,59 @@ async def lobby_websocket(websocket: WebSocket, lobby_code: str):
             "lobby": lobby.to_dict(),
         })
         
+        limiter = _ws_limiter()
         while True:
             data = await websocket.receive_json()
-            msg_type = data.get("type")
+            heartbeat_monitor.seen(websocket)
+            msg_type, error = validate_message(data, LOBBY_MESSAGES)
+            if not await _admit_ws_message(websocket, limiter, msg_type, error):
+                continue
             
             if msg_type == "ping":
                 await websocket.send_json({"type": "pong"})
+            elif msg_type == "getState":
+                lobby = await get_lobby_by_code(lobby_code)
+                if lobby:
+                    await websocket.send_json({"type": "lobbyState", "lobby": lobby.to_dict()})
             elif msg_type == "ready":
                 # Player marks ready
-                is_ready = data.get("ready", True)
-                # TODO: Update player ready status
+                is_ready = bool(data.get("ready", True))
+                success, message, lobby = await set_player_ready(lobby_code, telegram_id, is_ready)
+                if not success:
+                    await websocket.send_json({"type": "error", "message": message})
+                    continue
                 await _broadcast_lobby_event(lobby_code, {
                     "type": "playerReady",
-                    "userId": user_id,
-                    "ready": is_ready,
+                    "telegramId": telegram_id,
+                    "ready": lobby.players[telegram_id].is_ready,
+                    "version": lobby.version,
                 })
+            elif msg_type == "settings":
+                success, message, lobby, changes = await update_lobby_settings(
+                    lobby_code,
+                    telegram_id,
+                    lobby_name=data.get("lobbyName"),
+                    max_players=data.get("maxPlayers"),
+                    buy_in=data.get("buyIn"),
+                )
+                if not success:
+                    await websocket.send_json({"type": "error", "message": message})
+                elif changes:
+                    await _broadcast_lobby_event(lobby_code, {
+                        "type": "lobbySettings",
+                        "changes": changes,
+                        "version": lobby.version,
+                    })
             else:
                 continue
                 
     except WebSocketDisconnect:
-        print(f"🔌 LOBBY WS: User {user_id} disconnected from lobby {lobby_code}")
+        print(f"🔌 LOBBY WS: User {telegram_id} disconnected from lobby {lobby_code}")
     except Exception as e:
-        print(f"❌ LOBBY WS: Error for user {user_id}: {e}")
+        print(f"❌ LOBBY WS: Error for user {telegram_id}: {e}")
     finally:
-        if lobby_code in lobby_connections:
-            lobby_connections[lobby_code].pop(user_id, None)
+        heartbeat_monitor.unregister(websocket)
+        await _release()
 
 
 # ═══════════════════════════════════════════════════
@@ -1773,6 +2151,7 @@ async def lobby_websocket(websocket: WebSocket, lobby_code: str):
 
 # Game WebSocket connections
 game_connections: Dict[str, Dict[int, WebSocket]] = {}  # session_id -> {telegram_id -> websocket}
+game_streams: Dict[str, Dict[int, ResumableStream]] = {}  # session_id -> {seat -> stream}, kept through the resume grace window
 game_connection_locks: Dict[str, asyncio.Lock] = {}  # session_id -> Lock
 
 
@@ -1784,10 +2163,13 @@ class GameActionRequest(BaseModel):
 
 @app.get("/api/game/{session_id}")
 async def api_get_game(session_id: str, telegram_id: Optional[int] = None):
-    """Get current game state"""
+    """Get current game state (finished games come back from the archive)"""
     game = get_game(session_id)
     if not game:
-        raise HTTPException(status_code=404, detail="Game not found")
+        record = await tournament_archiver.get_game_record(session_id)
+        if not record:
+            raise HTTPException(status_code=404, detail="Game not found")
+        return {"success": True, "game": record, "archived": True}
     
     return {
         "success": True,
@@ -1796,14 +2178,13 @@ async def api_get_game(session_id: str, telegram_id: Optional[int] = None):
 
 
 @app.post("/api/game/{session_id}/action")
-async def api_game_action(session_id: str, request: GameActionRequest):
+async def api_game_action(session_id: str, request: GameActionRequest, user: Dict[str, Any] = Depends(request_user)):
     """Process player action"""
     print(f"🎮 API: Game action {request.action} in session {session_id}")
     
-    user = _extract_telegram_user(request.initData)
     if not user:
-        # For dev: get first player who can act
-        game = get_game(session_id)
+        # Local browser mode only: act for the player to act
+        game = None if telegram_auth.configured else get_game(session_id)
         if game and game.current_player_id:
             telegram_id = game.current_player_id
         else:
@@ -1824,6 +2205,7 @@ async def api_game_action(session_id: str, request: GameActionRequest):
     # Broadcast updated game state to all connected players
     if game:
         await _broadcast_game_state(session_id, game)
+        await _drive_bots(session_id, game)
     
     return {
         "success": True,
@@ -1832,42 +2214,60 @@ async def api_game_action(session_id: str, request: GameActionRequest):
     }
 
 
-async def _broadcast_game_state(session_id: str, game: GameState):
-    """Broadcast game state to all connected players by seat"""
-    connections = game_connections.get(session_id, {})
+def _game_state_message(game: GameState, seat: int) -> Dict[str, Any]:
+    return {
+        "type": "gameState",
+        "game": game.to_dict(for_seat=seat),
+        "yourSeat": seat,
+    }
+
+
+async def _send_to_game_streams(session_id: str, send):
+    """Run send(seat, stream) for every seat stream; a failed socket is dropped and its handler detaches it"""
+    streams = game_streams.get(session_id, {})
     stale = []
     
-    for seat, ws in connections.items():
+    for seat, stream in list(streams.items()):
         try:
-            await ws.send_json({
-                "type": "gameState",
-                "game": game.to_dict(for_seat=seat),
-            })
+            await send(seat, stream)
         except Exception:
             stale.append(seat)
     
+    connections = game_connections.get(session_id, {})
     for seat in stale:
         connections.pop(seat, None)
+        streams[seat].websocket = None
+
+
+async def _broadcast_game_state(session_id: str, game: GameState):
+    """Broadcast game state to all players by seat (seats away inside the resume window get it on resume)"""
+    await _send_to_game_streams(
+        session_id,
+        lambda seat, stream: stream.snapshot(lambda: _game_state_message(game, seat))
+    )
+
+
+async def _drive_bots(session_id: str, game: GameState):
+    """Let bot seats act until a human is up or the hand ends (decisions take microseconds)"""
+    if tournament_orchestrator.is_running(session_id):
+        # Tournament tables: the orchestrator plays bots, runs turn timers and deals the next hand
+        await tournament_orchestrator.after_action(session_id)
+        return
+    if play_bot_turns(game):
+        await _broadcast_game_state(session_id, game)
+    if game.phase.value in ["showdown", "finished"]:
+        await _handle_tournament_hand_result(session_id, game)
 
 
 async def _broadcast_chat_message(session_id: str, sender_seat: int, sender_name: str, message: str):
-    """Broadcast chat message to all connected players"""
-    connections = game_connections.get(session_id, {})
-    stale = []
-    
-    for seat, ws in connections.items():
-        try:
-            await ws.send_json({
-                "type": "chat",
-                "senderSeat": sender_seat,
-                "senderName": sender_name,
-                "message": message,
-            })
-        except Exception:
-            stale.append(seat)
-    
-    for seat in stale:
-        connections.pop(seat, None)
+    """Broadcast chat message to all players"""
+    event = {
+        "type": "chat",
+        "senderSeat": sender_seat,
+        "senderName": sender_name,
+        "message": message,
+    }
+    await _send_to_game_streams(session_id, lambda seat, stream: stream.event(event))
 
 
 async def _handle_tournament_hand_result(session_id: str, game):
@@ -1886,25 +2286,29 @@ async def _handle_tournament_hand_result(session_id: str, game):
 
 
 async def _broadcast_tournament_update(session_id: str, data: dict):
-    """Broadcast tournament-specific update to all connected players"""
-    connections = game_connections.get(session_id, {})
-    stale = []
-    
-    for seat, ws in connections.items():
-        try:
-            await ws.send_json(data)
-        except Exception:
-            stale.append(seat)
-    
-    for seat in stale:
-        connections.pop(seat, None)
+    """Broadcast tournament-specific update to all players"""
+    await _send_to_game_streams(session_id, lambda seat, stream: stream.event(data))
+
+
+def _drop_game_sockets(session_id: str):
+    """An archived game is gone: forget its sockets, resume streams and seat lock"""
+    game_connections.pop(session_id, None)
+    game_connection_locks.pop(session_id, None)
+    for stream in game_streams.pop(session_id, {}).values():
+        resume_registry.close(stream)
 
 
 @app.websocket("/ws/game/{session_id}")
-async def game_websocket(websocket: WebSocket, session_id: str, telegram_id: str = None):
+async def game_websocket(websocket: WebSocket, session_id: str):
     """WebSocket for real-time game updates"""
     await websocket.accept()
     
+    telegram_id = _socket_telegram_id(websocket, "telegram_id")
+    if not telegram_id and telegram_auth.configured:
+        await websocket.send_json({"type": "error", "message": "User not authenticated"})
+        await websocket.close(code=4401)
+        return
+    
     print(f"🎮 GAME WS: Connection request for session={session_id}, telegram_id={telegram_id}")
     
     game = get_game(session_id)
@@ -1919,9 +2323,22 @@ async def game_websocket(websocket: WebSocket, session_id: str, telegram_id: str
     
     # Use lock to prevent race conditions when assigning seats
     player_seat = None
+    resumed = False
     async with game_connection_locks[session_id]:
+        # RESUME: ?resumeToken= from an earlier gameState names the seat, no lookup needed
+        stream = resume_registry.get(websocket.query_params.get("resumeToken"))
+        if (
+            stream and stream.key[:2] == ("game", session_id)
+            and game_streams.get(session_id, {}).get(stream.key[2]) is stream
+            and (not telegram_auth.configured
+                 or str(getattr(game.players.get(stream.key[2]), "telegram_id", "")) == str(telegram_id))
+        ):
+            player_seat = stream.key[2]
+            resume_registry.resume(stream, websocket)
+            resumed = True
+        
         # FIND SEAT BY TELEGRAM_ID (correct way - player gets their own seat)
-        if telegram_id and telegram_id != "0":
+        if not player_seat and telegram_id:
             for seat, player in game.players.items():
                 player_tg_id = player.telegram_id if hasattr(player, 'telegram_id') else 0
                 if str(player_tg_id) == str(telegram_id):
@@ -1929,9 +2346,9 @@ async def game_websocket(websocket: WebSocket, session_id: str, telegram_id: str
                     print(f"🎮 GAME WS: Found seat {seat} for telegram_id {telegram_id} (player: {player.name})")
                     break
         
-        # Fallback: Find first unconnected seat (legacy behavior)
-        if not player_seat:
-            connected_seats = set(game_connections.get(session_id, {}).keys())
+        # Fallback: Find first unconnected seat (legacy behavior, local browser mode only); seats held for a resume are taken
+        if not player_seat and not telegram_auth.configured:
+            connected_seats = set(game_connections.get(session_id, {}).keys()) | set(game_streams.get(session_id, {}).keys())
             for seat in sorted(game.players.keys()):
                 if seat not in connected_seats:
                     player_seat = seat
@@ -1944,6 +2361,15 @@ async def game_websocket(websocket: WebSocket, session_id: str, telegram_id: str
             await websocket.close()
             return
         
+        if not resumed:
+            # New stream for the seat (a token-less reconnect replaces the old one)
+            seat_streams = game_streams.setdefault(session_id, {})
+            if player_seat in seat_streams:
+                resume_registry.close(seat_streams[player_seat])
+            stream = resume_registry.open(("game", session_id, player_seat))
+            stream.attach(websocket)
+            seat_streams[player_seat] = stream
+        
         # Register connection by SEAT number
         if session_id not in game_connections:
             game_connections[session_id] = {}
@@ -1954,17 +2380,51 @@ async def game_websocket(websocket: WebSocket, session_id: str, telegram_id: str
     
     print(f"🎮 GAME WS: Seat {player_seat} connected to game {session_id} ({game.connected_count}/{game.max_players} connected)")
     
+    async def _release():
+        connections = game_connections.get(session_id)
+        if connections is not None and connections.get(player_seat) is websocket:
+            del connections[player_seat]
+            # Update connection count
+            current = get_game(session_id)
+            if current:
+                current.connected_count = len(connections)
+        
+        # Hold the seat's stream for the grace window (unless a newer socket already took it)
+        if (
+            stream.websocket in (websocket, None) and stream.detached_at is None
+            and game_streams.get(session_id, {}).get(player_seat) is stream
+        ):
+            async def _expire():
+                seat_streams = game_streams.get(session_id)
+                if seat_streams and seat_streams.get(player_seat) is stream:
+                    del seat_streams[player_seat]
+                    if not seat_streams:
+                        del game_streams[session_id]
+            
+            resume_registry.detach(stream, on_expire=_expire)
+    
+    heartbeat_monitor.register(websocket, on_dead=_release)
     try:
-        # Send initial game state with seat number
-        await websocket.send_json({
-            "type": "gameState",
-            "game": game.to_dict(for_seat=player_seat),
-            "yourSeat": player_seat,
-        })
+        if resumed:
+            # Only what was missed since ?lastSeq=: buffered chat/updates, then fresh state if it moved on
+            try:
+                last_seq = int(websocket.query_params.get("lastSeq", 0))
+            except ValueError:
+                last_seq = 0
+            await websocket.send_json({"type": "resumed", "yourSeat": player_seat, "resumeToken": stream.token})
+            sent = await stream.replay(last_seq, lambda: _game_state_message(get_game(session_id) or game, player_seat))
+            print(f"🎮 GAME WS: Seat {player_seat} resumed in game {session_id} ({sent} missed messages)")
+        else:
+            # Send initial game state with seat number and the token to resume it with
+            await stream.snapshot(lambda: {**_game_state_message(game, player_seat), "resumeToken": stream.token})
         
+        limiter = _ws_limiter()
         while True:
             data = await websocket.receive_json()
-            msg_type = data.get("type")
+            heartbeat_monitor.seen(websocket)
+            msg_type, error = validate_message(data, GAME_MESSAGES)
+            if not await _admit_ws_message(websocket, limiter, msg_type, error):
+                continue
             
             if msg_type == "ping":
                 await websocket.send_json({"type": "pong"})
@@ -1982,9 +2442,8 @@ async def game_websocket(websocket: WebSocket, session_id: str, telegram_id: str
                     # Broadcast to all players
                     await _broadcast_game_state(session_id, updated_game)
                     
-                    # Check if hand finished (showdown/finished) - handle tournament integration
-                    if updated_game.phase.value in ["showdown", "finished"]:
-                        await _handle_tournament_hand_result(session_id, updated_game)
+                    # Bots answer; a finished hand goes through tournament integration
+                    await _drive_bots(session_id, updated_game)
                 else:
                     await websocket.send_json({
                         "type": "error",
@@ -1992,33 +2451,31 @@ async def game_websocket(websocket: WebSocket, session_id: str, telegram_id: str
                     })
                     
             elif msg_type == "new_hand":
+                if tournament_orchestrator.is_running(session_id):
+                    await websocket.send_json({"type": "error", "message": "Tournament tables deal automatically"})
+                    continue
+                
                 # Start new hand (any player can request)
                 from game_engine import start_new_hand
                 updated_game = start_new_hand(session_id)
                 if updated_game:
                     print(f"🎮 GAME: New hand requested by seat {player_seat}")
                     await _broadcast_game_state(session_id, updated_game)
+                    await _drive_bots(session_id, updated_game)
                     
             elif msg_type == "chat":
                 # Broadcast chat message to all players in the game
-                chat_message = data.get("message", "")
-                sender_name = data.get("senderName", "Player")
-                
-                # Validate message (prevent spam/abuse)
-                if len(chat_message) <= 20:  # Quick phrases are short
-                    await _broadcast_chat_message(session_id, player_seat, sender_name, chat_message)
+                chat_message = data["message"]
+                sender_name = data.get("senderName") or "Player"
+                await _broadcast_chat_message(session_id, player_seat, sender_name, chat_message)
                     
     except WebSocketDisconnect:
         print(f"🎮 GAME WS: Seat {player_seat} disconnected from game {session_id}")
     except Exception as e:
         print(f"❌ GAME WS: Error for seat {player_seat}: {e}")
     finally:
-        if session_id in game_connections:
-            game_connections[session_id].pop(player_seat, None)
-            # Update connection count
-            game = get_game(session_id)
-            if game:
-                game.connected_count = len(game_connections.get(session_id, {}))
+        heartbeat_monitor.unregister(websocket)
+        await _release()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -2027,9 +2484,10 @@ async def game_websocket(websocket: WebSocket, session_id: str, telegram_id: str
 
 class TournamentRegisterRequest(BaseModel):
     tournament_id: str
-    telegram_id: int
+    telegram_id: Optional[int] = None  # Local browser mode only; otherwise taken from initData
     username: Optional[str] = None
     first_name: str = "Player"
+    initData: str = ""
 
 
 class TournamentCreateRequest(BaseModel):
@@ -2045,32 +2503,72 @@ class TournamentCreateRequest(BaseModel):
     players_per_table: int = 9
 
 
+TOURNAMENT_LIST_TTL_SECONDS = 1.0  # Lists showing a level countdown are rebuilt at most this often
+
+# (mode, registering_only) -> {"versions", "built_at", "body", "etag"}
+_tournament_list_cache: Dict[Tuple[Optional[TournamentMode], bool], Dict[str, Any]] = {}
+
+
 @app.get("/api/tournaments")
-async def get_tournaments(mode: Optional[str] = None, status: Optional[str] = None):
-    """Get list of tournaments with optional filters"""
+async def get_tournaments(request: Request, mode: Optional[str] = None, status: Optional[str] = None):
+    """Get list of tournaments with optional filters (cached per filter, supports If-None-Match)"""
     try:
         mode_enum = TournamentMode(mode) if mode else None
     except ValueError:
         mode_enum = None
     
-    if status == "registering":
+    registering_only = status == "registering"
+    if registering_only:
         tournaments = tournament_manager.get_registering_tournaments(mode_enum)
     else:
         tournaments = tournament_manager.get_active_tournaments(mode_enum)
     
-    return {
-        "success": True,
-        "tournaments": [t.to_dict(include_players=False) for t in tournaments],
-        "count": len(tournaments),
-    }
+    # Rebuild only when a listed tournament changed, or its countdown has moved on
+    versions = tuple((t.tournament_id, t.version) for t in tournaments)
+    ticking = any(t.level_started_at is not None for t in tournaments)
+    now = get_clock().time()
+    key = (mode_enum, registering_only)
+    cached = _tournament_list_cache.get(key)
+    if (
+        not cached
+        or cached["versions"] != versions
+        or (ticking and now - cached["built_at"] >= TOURNAMENT_LIST_TTL_SECONDS)
+    ):
+        body = json.dumps({
+            "success": True,
+            "tournaments": [t.to_dict(include_players=False) for t in tournaments],
+            "count": len(tournaments),
+        }).encode()
+        cached = {
+            "versions": versions,
+            "built_at": now,
+            "body": body,
+            "etag": f'"{hashlib.sha1(body).hexdigest()[:20]}"',
+        }
+        _tournament_list_cache[key] = cached
+    
+    headers = {"ETag": cached["etag"], "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == cached["etag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached["body"], media_type="application/json", headers=headers)
+
+
+@app.get("/api/tournaments/schedule")
+async def get_tournament_schedule():
+    """Scheduled tournaments whose registration hasn't opened yet"""
+    upcoming = tournament_scheduler.get_upcoming()
+    return {"success": True, "upcoming": upcoming, "count": len(upcoming)}
 
 
 @app.get("/api/tournaments/{tournament_id}")
 async def get_tournament(tournament_id: str):
-    """Get tournament details"""
+    """Get tournament details (finished tournaments come back from the archive)"""
     tournament = tournament_manager.get_tournament(tournament_id)
     if not tournament:
-        raise HTTPException(status_code=404, detail="Tournament not found")
+        record = await tournament_archiver.get_tournament_record(tournament_id)
+        if not record:
+            raise HTTPException(status_code=404, detail="Tournament not found")
+        return {"success": True, "tournament": record, "archived": True}
     
     return {
         "success": True,
@@ -2088,14 +2586,42 @@ async def get_tournament_leaderboard(tournament_id: str, limit: int = 10):
     }
 
 
+@app.get("/api/tournaments/{tournament_id}/payouts")
+async def get_tournament_payouts(tournament_id: str):
+    """Payout ladder in cents (follows the field live while registration is open)"""
+    tournament = tournament_manager.get_tournament(tournament_id)
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    
+    payouts = tournament.get_payouts_cents()
+    return {
+        "success": True,
+        "tournamentId": tournament_id,
+        "status": tournament.status.value,
+        "fieldSize": tournament.get_entries(),
+        "prizePoolCents": tournament.get_net_prize_pool_cents(),
+        "placesPaid": len(payouts),
+        "payouts": [
+            {"position": position, "amountCents": cents, "amount": cents / 100}
+            for position, cents in payouts.items()
+        ],
+    }
+
+
 @app.post("/api/tournaments/{tournament_id}/register")
-async def register_for_tournament(tournament_id: str, request: TournamentRegisterRequest):
+async def register_for_tournament(tournament_id: str, request: TournamentRegisterRequest, user: Dict[str, Any] = Depends(request_user)):
     """Register for a tournament"""
+    if not user:
+        if telegram_auth.configured or not request.telegram_id:
+            raise HTTPException(status_code=401, detail="User not authenticated")
+        # Local browser mode: fallback user info from request
+        user = {"id": request.telegram_id, "username": request.username, "first_name": request.first_name}
+    
     success, message, tournament = await tournament_manager.register_player(
         tournament_id=tournament_id,
-        telegram_id=request.telegram_id,
-        username=request.username,
-        first_name=request.first_name,
+        telegram_id=user["id"],
+        username=user.get("username"),
+        first_name=user.get("first_name") or "Player",
     )
     
     if not success:
@@ -2109,9 +2635,15 @@ async def register_for_tournament(tournament_id: str, request: TournamentRegiste
 
 
 @app.post("/api/tournaments/{tournament_id}/unregister")
-async def unregister_from_tournament(tournament_id: str, telegram_id: int):
+async def unregister_from_tournament(tournament_id: str, telegram_id: Optional[int] = None, user: Dict[str, Any] = Depends(request_user)):
     """Unregister from a tournament"""
-    success, message = await tournament_manager.unregister_player(tournament_id, telegram_id)
+    if not user:
+        if telegram_auth.configured or not telegram_id:
+            raise HTTPException(status_code=401, detail="User not authenticated")
+        # Local browser mode: the telegram_id query param
+        user = {"id": telegram_id}
+    
+    success, message = await tournament_manager.unregister_player(tournament_id, user["id"])
     
     if not success:
         raise HTTPException(status_code=400, detail=message)
@@ -2186,14 +2718,34 @@ async def start_tournament(tournament_id: str):
     }
 
 
+@app.post("/api/tournaments/{tournament_id}/fill-bots")
+async def fill_tournament_with_bots(tournament_id: str, count: Optional[int] = None, user: Dict[str, Any] = Depends(request_user)):
+    """Fill open seats with bots (a full Sit & Go starts immediately). Admin only: bots pay no buy-in"""
+    _require_admin(user)
+    success, message, added = await tournament_manager.fill_with_bots(tournament_id, count)
+    
+    if not success:
+        raise HTTPException(status_code=400, detail=message)
+    
+    tournament = tournament_manager.get_tournament(tournament_id)
+    return {
+        "success": True,
+        "message": message,
+        "botsAdded": added,
+        "tournament": tournament.to_dict(include_players=False) if tournament else None,
+    }
+
+
 @app.get("/api/tournaments/player/{telegram_id}")
-async def get_player_tournaments_api(telegram_id: int):
-    """Get tournaments a player is registered in"""
-    tournaments = tournament_manager.get_player_tournaments(telegram_id)
+async def get_player_tournaments_api(telegram_id: int, view: Optional[str] = None):
+    """Get a player's tournaments (view: registered, running or finished)"""
+    if view and view not in PlayerTournamentIndex.VIEWS:
+        raise HTTPException(status_code=400, detail=f"view must be one of {', '.join(PlayerTournamentIndex.VIEWS)}")
+    tournaments = await tournament_archiver.get_player_history(telegram_id, view)
     
     return {
         "success": True,
-        "tournaments": [t.to_dict(include_players=False) for t in tournaments],
+        "tournaments": tournaments,
         "count": len(tournaments),
     }
 
@@ -2205,8 +2757,18 @@ async def get_player_tournaments_api(telegram_id: int):
 tournament_connections: Dict[str, Dict[int, WebSocket]] = {}  # tournament_id -> {telegram_id: ws}
 
 
+def _your_player_payload(tournament, telegram_id: int) -> Optional[Dict[str, Any]]:
+    """The connected player's own entry plus their rank (chip rank, or finishing position once out)"""
+    player = tournament.players.get(telegram_id)
+    if not player:
+        return None
+    payload = player.to_dict()
+    payload["rank"] = tournament.get_rank(telegram_id)
+    return payload
+
+
 @app.websocket("/ws/tournament/{tournament_id}")
-async def tournament_websocket(websocket: WebSocket, tournament_id: str, telegram_id: str = None):
+async def tournament_websocket(websocket: WebSocket, tournament_id: str):
     """WebSocket for real-time tournament updates"""
     await websocket.accept()
     
@@ -2216,7 +2778,7 @@ async def tournament_websocket(websocket: WebSocket, tournament_id: str, telegra
         await websocket.close()
         return
     
-    tg_id = int(telegram_id) if telegram_id else 0
+    tg_id = _socket_telegram_id(websocket, "telegram_id") or 0  # Unidentified: spectator
     
     # Register connection
     if tournament_id not in tournament_connections:
@@ -2225,18 +2787,27 @@ async def tournament_websocket(websocket: WebSocket, tournament_id: str, telegra
     
     print(f"🏆 TOURNAMENT WS: Player {tg_id} connected to tournament {tournament_id}")
     
+    async def _release():
+        connections = tournament_connections.get(tournament_id)
+        if connections is not None and connections.get(tg_id) is websocket:
+            del connections[tg_id]
+    
+    heartbeat_monitor.register(websocket, on_dead=_release)
     try:
         # Send initial tournament state
-        player = tournament.players.get(tg_id)
         await websocket.send_json({
             "type": "tournamentState",
             "tournament": tournament.to_dict(include_players=True),
-            "yourPlayer": player.to_dict() if player else None,
+            "yourPlayer": _your_player_payload(tournament, tg_id),
         })
         
+        limiter = _ws_limiter()
         while True:
             data = await websocket.receive_json()
-            msg_type = data.get("type")
+            heartbeat_monitor.seen(websocket)
+            msg_type, error = validate_message(data, TOURNAMENT_MESSAGES)
+            if not await _admit_ws_message(websocket, limiter, msg_type, error):
+                continue
             
             if msg_type == "ping":
                 await websocket.send_json({"type": "pong"})
@@ -2252,7 +2823,7 @@ async def tournament_websocket(websocket: WebSocket, tournament_id: str, telegra
                 await websocket.send_json({
                     "type": "tournamentState",
                     "tournament": tournament.to_dict(include_players=True),
-                    "yourPlayer": player.to_dict() if player else None,
+                    "yourPlayer": _your_player_payload(tournament, tg_id),
                 })
                 
     except WebSocketDisconnect:
@@ -2260,8 +2831,8 @@ async def tournament_websocket(websocket: WebSocket, tournament_id: str, telegra
     except Exception as e:
         print(f"❌ TOURNAMENT WS: Error: {e}")
     finally:
-        if tournament_id in tournament_connections:
-            tournament_connections[tournament_id].pop(tg_id, None)
+        heartbeat_monitor.unregister(websocket)
+        await _release()
 
 
 async def broadcast_tournament_update(tournament_id: str, event_type: str, data: Any):
@@ -2289,6 +2860,20 @@ tournament_manager.on_event("blind_increase", lambda tid, data: asyncio.create_t
 tournament_manager.on_event("tournament_finished", lambda tid, data: asyncio.create_task(
     broadcast_tournament_update(tid, "tournamentFinished", data)
 ))
+tournament_manager.on_event("players_moved", lambda tid, data: asyncio.create_task(
+    broadcast_tournament_update(tid, "playersMoved", data)
+))
+tournament_manager.on_event("break_started", lambda tid, data: asyncio.create_task(
+    broadcast_tournament_update(tid, "breakStarted", data)
+))
+tournament_manager.on_event("player_seated", lambda tid, data: asyncio.create_task(
+    broadcast_tournament_update(tid, "playerSeated", data)
+))
+tournament_manager.on_event("tournament_cancelled", lambda tid, data: asyncio.create_task(
+    broadcast_tournament_update(tid, "tournamentCancelled", data)
+))
+tournament_orchestrator.on_update = _broadcast_game_state
+tournament_archiver.on_game_evicted = _drop_game_sockets
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -2299,13 +2884,15 @@ tournament_manager.on_event("tournament_finished", lambda tid, data: asyncio.cre
 async def startup_event():
     """Initialize default tournaments on server start"""
     await create_default_tournaments()
+    tournament_archiver.start()
+    asyncio.create_task(run_lobby_sweeper())
+    asyncio.create_task(heartbeat_monitor.run())
     
     # Register tournament callbacks for blind increases
-    from tournament_engine import tournament_manager, sync_tournament_blinds
+    from tournament_engine import tournament_manager
     
     async def on_blind_increase(tournament_id: str, blinds: dict):
-        """Handle blind level increase"""
-        await sync_tournament_blinds(tournament_id)
+        """Handle blind level increase (tables pick the new blinds up at their next deal)"""
         # Broadcast blind update to all connected clients
         tournament = tournament_manager.get_tournament(tournament_id)
         if tournament:
@@ -0,0 +1,401 @@
+"""
+Headless Self-Play Simulator
+Runs hands through game_engine with pluggable bot policies - no network, no timers, no logging.
+Checks chip conservation and betting-round invariants on every hand, so it also works as a fuzzer.
+
+Usage:
+    python simulator.py --hands 100000 --players 6 --policy random
+    python simulator.py --hands 10000000 --workers 8      # batch mode, one table per shard
+"""
+
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import game_engine
+from bots import bot_policy
+from game_engine import (
+    GameState, GamePhase, Player,
+    create_game, start_new_hand, process_action, end_game, starting_hand_class
+)
+
+
+# A policy picks an action for the player to act: (action, amount)
+Policy = Callable[[GameState, Player, random.Random], Tuple[str, int]]
+
+MAX_ACTIONS_PER_HAND = 500  # Anything longer is reported as a stuck betting round
+MAX_ANOMALIES_KEPT = 50
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BOT POLICIES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def min_raise_to(game: GameState) -> int:
+    """Minimum total bet for a bet/raise, same rule as process_action"""
+    if game.current_bet == 0:
+        return game.big_blind
+    return game.current_bet + game.min_raise
+
+
+def legal_actions(game: GameState, player: Player) -> List[str]:
+    """Actions process_action will accept for this player right now"""
+    to_call = game.current_bet - player.current_bet
+    actions = ["all_in"] if player.chips > 0 else []
+    if to_call <= 0:
+        actions.append("check")
+    else:
+        actions += ["fold", "call"]
+    if player.chips + player.current_bet > min_raise_to(game):
+        actions.append("raise")
+    return actions
+
+
+def passive_policy(game: GameState, player: Player, rng: random.Random) -> Tuple[str, int]:
+    """Calling station: never folds, never raises"""
+    if game.current_bet > player.current_bet:
+        return "call", 0
+    return "check", 0
+
+
+def random_policy(game: GameState, player: Player, rng: random.Random) -> Tuple[str, int]:
+    """Uniform-ish random legal action with random raise sizes (fuzzing)"""
+    actions = legal_actions(game, player)
+    weights = {"fold": 2, "check": 4, "call": 4, "raise": 3, "all_in": 1}
+    action = rng.choices(actions, weights=[weights[a] for a in actions])[0]
+    if action == "raise":
+        low = min_raise_to(game)
+        high = player.chips + player.current_bet - 1
+        return "raise", rng.randint(low, max(low, high))
+    return action, 0
+
+
+def aggressive_policy(game: GameState, player: Player, rng: random.Random) -> Tuple[str, int]:
+    """Raises pot-sized whenever it can, otherwise calls"""
+    actions = legal_actions(game, player)
+    if "raise" in actions and rng.random() < 0.6:
+        target = max(min_raise_to(game), game.current_bet + game.pot)
+        return "raise", min(target, player.chips + player.current_bet - 1)
+    if "call" in actions:
+        return "call", 0
+    return "check", 0
+
+
+POLICIES: Dict[str, Policy] = {
+    "passive": passive_policy,
+    "random": random_policy,
+    "aggressive": aggressive_policy,
+    "bot": bot_policy,  # The server-side seat bot (bots.py)
+}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SIMULATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class SimulationResult:
+    """Counters and invariant violations from a simulation run"""
+    hands_played: int = 0
+    actions: int = 0
+    rejected_actions: int = 0        # Legal actions the engine refused
+    table_resets: int = 0            # Restarts after bust-outs or stuck hands
+    rake_collected: int = 0
+    pot_total: int = 0               # Sum of awarded pots (before rake)
+    pots_counted: int = 0            # Hands in pot_total (anomaly hands award no pot)
+    elapsed: float = 0.0
+    anomalies: List[str] = field(default_factory=list)
+    anomaly_count: int = 0
+    # Starting hand class ("AKs") -> times dealt / times won
+    hand_class_dealt: Counter = field(default_factory=Counter)
+    hand_class_won: Counter = field(default_factory=Counter)
+    # Winning hand name ("Two Pair", "Last Standing") -> count
+    winning_hands: Counter = field(default_factory=Counter)
+
+    @property
+    def hands_per_second(self) -> float:
+        return self.hands_played / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def average_pot(self) -> float:
+        return self.pot_total / self.pots_counted if self.pots_counted else 0.0
+
+    def win_rates(self) -> Dict[str, float]:
+        """Fraction of dealt hands won, per starting hand class"""
+        return {
+            hand: self.hand_class_won[hand] / dealt
+            for hand, dealt in self.hand_class_dealt.items()
+        }
+
+    def merge(self, other: "SimulationResult"):
+        """Add another shard's counters into this result (elapsed is wall time, set by caller)"""
+        self.hands_played += other.hands_played
+        self.actions += other.actions
+        self.rejected_actions += other.rejected_actions
+        self.table_resets += other.table_resets
+        self.rake_collected += other.rake_collected
+        self.pot_total += other.pot_total
+        self.pots_counted += other.pots_counted
+        self.hand_class_dealt.update(other.hand_class_dealt)
+        self.hand_class_won.update(other.hand_class_won)
+        self.winning_hands.update(other.winning_hands)
+        for anomaly in other.anomalies:
+            self.record_anomaly(anomaly)
+        self.anomaly_count += other.anomaly_count - len(other.anomalies)
+
+    def record_anomaly(self, message: str):
+        self.anomaly_count += 1
+        if len(self.anomalies) < MAX_ANOMALIES_KEPT:
+            self.anomalies.append(message)
+
+    def to_dict(self) -> Dict:
+        return {
+            "handsPlayed": self.hands_played,
+            "actions": self.actions,
+            "rejectedActions": self.rejected_actions,
+            "tableResets": self.table_resets,
+            "rakeCollected": self.rake_collected,
+            "averagePot": round(self.average_pot, 2),
+            "winningHands": dict(self.winning_hands),
+            "elapsed": round(self.elapsed, 3),
+            "handsPerSecond": round(self.hands_per_second, 1),
+            "anomalyCount": self.anomaly_count,
+            "anomalies": self.anomalies,
+        }
+
+
+def _new_table(session_id: str, num_players: int, small_blind: int, big_blind: int) -> GameState:
+    players_data = [
+        {"telegram_id": seat, "first_name": f"Bot{seat}"}
+        for seat in range(1, num_players + 1)
+    ]
+    return create_game(session_id, "SIM", players_data, small_blind, big_blind)
+
+
+def _table_chips(game: GameState) -> int:
+    return sum(p.chips for p in game.players.values()) + game.pot
+
+
+def play_hand(game: GameState, policies: List[Policy], rng: random.Random,
+               result: SimulationResult) -> Optional[str]:
+    """Play one started hand to completion. Returns an anomaly description or None."""
+    for _ in range(MAX_ACTIONS_PER_HAND):
+        if game.phase == GamePhase.FINISHED:
+            return None
+
+        seat = game.current_player_seat
+        player = game.players.get(seat) if seat is not None else None
+        if not player:
+            return f"no player at current seat {seat} in {game.phase.value}"
+        if player.is_folded or player.is_all_in or not player.is_active:
+            return f"seat {seat} cannot act (folded={player.is_folded}, all_in={player.is_all_in}) in {game.phase.value}"
+
+        action, amount = policies[(seat - 1) % len(policies)](game, player, rng)
+        ok, message, _ = process_action(game.session_id, seat, action, amount)
+        result.actions += 1
+        if not ok:
+            # Policies only pick legal actions - a refusal is an engine/policy disagreement
+            result.rejected_actions += 1
+            result.record_anomaly(f"{action} {amount} rejected for seat {seat}: {message}")
+            fallback = "call" if game.current_bet > player.current_bet else "check"
+            ok, message, _ = process_action(game.session_id, seat, fallback, 0)
+            result.actions += 1
+            if not ok:
+                return f"fallback {fallback} rejected for seat {seat}: {message}"
+
+    return f"hand did not finish within {MAX_ACTIONS_PER_HAND} actions ({game.phase.value})"
+
+
+def simulate_table(
+    num_hands: int,
+    num_players: int = 6,
+    policies: Optional[List[Policy]] = None,
+    seed: Optional[int] = None,
+    small_blind: int = 10,
+    big_blind: int = 20,
+    session_id: str = "sim_table",
+) -> SimulationResult:
+    """
+    Play num_hands hands at one table in-process.
+    Busted tables (fewer than 2 players with chips) and stuck hands restart with fresh stacks.
+    """
+    rng = random.Random(seed)
+    random.seed(seed)  # game_engine shuffles with the module-level RNG
+    policies = policies or [random_policy]
+    result = SimulationResult()
+
+    verbose = game_engine.VERBOSE
+    game_engine.VERBOSE = False
+    started = time.perf_counter()
+    try:
+        game = _new_table(session_id, num_players, small_blind, big_blind)
+        chips_in_play = _table_chips(game)
+
+        while result.hands_played < num_hands:
+            if sum(1 for p in game.players.values() if p.chips > 0) < 2:
+                game = _new_table(session_id, num_players, small_blind, big_blind)
+                chips_in_play = _table_chips(game)
+                result.table_resets += 1
+
+            start_new_hand(session_id)
+            dealt = {p.seat: starting_hand_class(p.cards) for p in game.players.values() if p.is_active}
+            anomaly = play_hand(game, policies, rng, result)
+            result.hands_played += 1
+            result.rake_collected += game.total_rake_collected
+            chips_in_play -= game.total_rake_collected
+
+            if anomaly:
+                result.record_anomaly(f"hand {result.hands_played}: {anomaly}")
+                game = _new_table(session_id, num_players, small_blind, big_blind)
+                chips_in_play = _table_chips(game)
+                result.table_resets += 1
+                continue
+
+            result.pot_total += game.last_pot
+            result.pots_counted += 1
+            result.hand_class_dealt.update(dealt.values())
+            if game.winner_seat in dealt:
+                result.hand_class_won[dealt[game.winner_seat]] += 1
+            result.winning_hands[game.winner_hand] += 1
+
+            # Invariants after every completed hand
+            if game.pot != 0:
+                result.record_anomaly(f"hand {result.hands_played}: pot not empty after hand ({game.pot})")
+            if any(p.chips < 0 for p in game.players.values()):
+                result.record_anomaly(f"hand {result.hands_played}: negative stack")
+            total = _table_chips(game)
+            if total != chips_in_play:
+                result.record_anomaly(
+                    f"hand {result.hands_played}: chips not conserved (expected {chips_in_play}, found {total})"
+                )
+                chips_in_play = total
+    finally:
+        result.elapsed = time.perf_counter() - started
+        game_engine.VERBOSE = verbose
+        end_game(session_id)
+
+    return result
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BATCH MODE (PROCESS POOL)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _run_shard(shard: Tuple[int, int, List[str], Optional[int], int, int, str]) -> SimulationResult:
+    """Worker entry point - policies travel by name so the shard is picklable"""
+    num_hands, num_players, policy_names, seed, small_blind, big_blind, session_id = shard
+    return simulate_table(
+        num_hands=num_hands,
+        num_players=num_players,
+        policies=[POLICIES[name] for name in policy_names],
+        seed=seed,
+        small_blind=small_blind,
+        big_blind=big_blind,
+        session_id=session_id,
+    )
+
+
+def run_batch(
+    total_hands: int,
+    num_players: int = 6,
+    policy_names: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    tables: Optional[int] = None,
+    seed: Optional[int] = None,
+    small_blind: int = 10,
+    big_blind: int = 20,
+) -> SimulationResult:
+    """
+    Split total_hands over independent simulated tables and play them in a process pool.
+    Tables share nothing, so throughput scales with the number of cores.
+    """
+    workers = workers or os.cpu_count() or 1
+    # A few tables per worker keeps every core busy until the end of the run
+    tables = max(1, min(tables or workers * 4, total_hands))
+    policy_names = policy_names or ["random"]
+    base_seed = seed if seed is not None else random.randrange(2 ** 32)
+
+    per_table, extra = divmod(total_hands, tables)
+    shards = [
+        (per_table + (1 if i < extra else 0), num_players, policy_names,
+         base_seed + i, small_blind, big_blind, f"sim_table_{i + 1}")
+        for i in range(tables)
+    ]
+
+    result = SimulationResult()
+    started = time.perf_counter()
+    if workers == 1:
+        for shard in shards:
+            result.merge(_run_shard(shard))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for shard_result in pool.map(_run_shard, shards):
+                result.merge(shard_result)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless poker self-play simulator")
+    parser.add_argument("--hands", type=int, default=10000)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--policy", action="append", choices=sorted(POLICIES),
+                        help="Policy per seat (repeat to mix; cycles over seats)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--small-blind", type=int, default=10)
+    parser.add_argument("--big-blind", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Batch mode: number of worker processes (0 = single table in-process)")
+    parser.add_argument("--tables", type=int, default=None,
+                        help="Batch mode: number of independent tables (default 4 per worker)")
+    parser.add_argument("--top", type=int, default=10, help="Hand classes to show in the win-rate report")
+    args = parser.parse_args()
+
+    policy_names = args.policy or ["random"]
+    if args.workers:
+        result = run_batch(
+            total_hands=args.hands,
+            num_players=args.players,
+            policy_names=policy_names,
+            workers=args.workers,
+            tables=args.tables,
+            seed=args.seed,
+            small_blind=args.small_blind,
+            big_blind=args.big_blind,
+        )
+    else:
+        result = simulate_table(
+            num_hands=args.hands,
+            num_players=args.players,
+            policies=[POLICIES[name] for name in policy_names],
+            seed=args.seed,
+            small_blind=args.small_blind,
+            big_blind=args.big_blind,
+        )
+
+    print(f"🎲 SIM: {result.hands_played} hands in {result.elapsed:.2f}s ({result.hands_per_second:,.0f} hands/s)")
+    print(f"🎲 SIM: {result.actions} actions, {result.table_resets} table resets, rake ${result.rake_collected}")
+    print(f"🎲 SIM: average pot ${result.average_pot:.2f}")
+    if args.top:
+        rates = sorted(result.win_rates().items(), key=lambda item: item[1], reverse=True)
+        print("🎲 SIM: best starting hands - " + ", ".join(
+            f"{hand} {rate * 100:.1f}%" for hand, rate in rates[:args.top]
+        ))
+        print("🎲 SIM: winning hands - " + ", ".join(
+            f"{name} {count}" for name, count in result.winning_hands.most_common()
+        ))
+    if result.anomaly_count:
+        print(f"❌ SIM: {result.anomaly_count} invariant violations, first {len(result.anomalies)}:")
+        for anomaly in result.anomalies:
+            print(f"   - {anomaly}")
+    else:
+        print("✅ SIM: all invariants held")
+
+
+if __name__ == "__main__":
+    main()
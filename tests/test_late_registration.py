@@ -0,0 +1,116 @@
+"""
+Late registration and re-entry: seating into a new table, finishing positions, the payout ladder.
+Run from the repository root: python -m pytest -q
+"""
+
+import asyncio
+import random
+
+from clock import VirtualClock, set_clock
+from tournament_engine import TableOrchestrator, TournamentManager, TournamentMode, TournamentStatus
+
+
+def _run(scenario):
+    clock = VirtualClock()
+    previous = set_clock(clock)
+    try:
+        return asyncio.run(scenario(clock))
+    finally:
+        set_clock(previous)
+
+
+async def _started_tournament(manager: TournamentManager, entrants: int, is_bot: bool = False, **kwargs):
+    tournament = manager.create_tournament(
+        name="Late Reg",
+        mode=TournamentMode.TOURNAMENT,
+        buy_in=10,
+        min_players=2,
+        max_players=50,
+        publish=False,
+        **kwargs
+    )
+    manager.tournaments[tournament.tournament_id] = tournament
+    for telegram_id in range(1, entrants + 1):
+        await manager.register_player(tournament.tournament_id, telegram_id, None, f"P{telegram_id}", is_bot=is_bot)
+    ok, message = await manager.start_tournament(tournament.tournament_id)
+    assert ok, message
+    assert tournament.status == TournamentStatus.LATE_REG
+    return tournament
+
+
+def test_entrant_at_a_new_table_is_dealt_in_without_an_elimination():
+    async def scenario(clock):
+        random.seed(40)  # Deck shuffles; deep stacks keep the first hands from busting anyone anyway
+        manager = TournamentManager(clock=clock)
+        orchestrator = TableOrchestrator(manager, hand_pause_seconds=1, rng=random.Random(40))
+        dealt = set()
+
+        async def on_update(session_id, game):
+            if not tournament.final_positions:
+                dealt.update((session_id, p.telegram_id) for p in game.players.values() if p.is_active)
+
+        orchestrator.on_update = on_update
+        tournament = await _started_tournament(manager, 18, is_bot=True, starting_chips=10 ** 9)
+        try:
+            assert sorted(t.player_count for t in tournament.tables.values()) == [9, 9]
+
+            ok, _, _ = await manager.register_player(tournament.tournament_id, 19, None, "Late", is_bot=True)
+            assert ok
+            assert sorted(t.player_count for t in tournament.tables.values()) == [6, 6, 7]
+            new_table = tournament.tables[tournament.players[19].table_id]
+            assert new_table.game_session_id
+
+            await clock.advance(0)
+            assert (new_table.game_session_id, 19) in dealt
+        finally:
+            await orchestrator.stop()
+            manager._blind_tasks.pop(tournament.tournament_id).cancel()
+
+    _run(scenario)
+
+
+def test_reentry_then_elimination_keeps_finishing_positions_unique():
+    async def scenario(clock):
+        manager = TournamentManager(clock=clock)
+        tournament = await _started_tournament(manager, 10, max_entries=2)
+        try:
+            tournament_id = tournament.tournament_id
+            await manager.eliminate_players(tournament_id, [(1, 10000, [2])])
+            await manager.eliminate_players(tournament_id, [(3, 10000, [2])])
+            assert tournament.final_positions == {1: 10, 3: 9}
+
+            ok, message, _ = await manager.register_player(tournament_id, 1, None, "P1")
+            assert ok, message
+            assert tournament.final_positions == {3: 10}
+
+            await manager.eliminate_players(tournament_id, [(4, 10000, [2])])
+            assert tournament.final_positions == {3: 10, 4: 9}
+            assert tournament.players[4].position == 9
+            assert tournament.get_rank(3) == 10
+        finally:
+            manager._blind_tasks.pop(tournament.tournament_id).cancel()
+
+    _run(scenario)
+
+
+def test_late_entries_and_reentries_update_the_payout_ladder():
+    async def scenario(clock):
+        manager = TournamentManager(clock=clock)
+        tournament = await _started_tournament(manager, 10, max_entries=2)
+        try:
+            tournament_id = tournament.tournament_id
+            await manager.register_player(tournament_id, 11, None, "Late")
+            assert tournament.payouts == {
+                position: cents / 100 for position, cents in tournament.get_payouts_cents().items()
+            }
+            assert sum(tournament.payouts.values()) == tournament.get_net_prize_pool_cents() / 100
+
+            await manager.eliminate_players(tournament_id, [(5, 10000, [2])])
+            pool_before = tournament.get_net_prize_pool_cents()
+            await manager.register_player(tournament_id, 5, None, "P5")
+            assert tournament.get_net_prize_pool_cents() > pool_before
+            assert sum(tournament.payouts.values()) == tournament.get_net_prize_pool_cents() / 100
+        finally:
+            manager._blind_tasks.pop(tournament.tournament_id).cancel()
+
+    _run(scenario)
@@ -6,12 +6,28 @@ Supports: Tournament (MTT), Bounty Hunter (PKO), Sit & Go (SnG)
 import random
 import time
 import asyncio
+import bisect
+import heapq
 import uuid
-from typing import Dict, List, Optional, Any, Tuple, Callable
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Callable, Awaitable, Collection, Set, Deque, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
 
+from archive import ArchiveStore
+from clock import Clock, get_clock, now
+
+
+# Console logging of tournament events. Simulations turn this off.
+VERBOSE = True
+
+
+def _log(message: str):
+    if VERBOSE:
+        print(message)
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ENUMS AND CONSTANTS
@@ -87,6 +103,73 @@ BLIND_STRUCTURES = {
 }
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# PAYOUT CURVES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+PAYOUT_UNITS = 1_000_000          # Curves are parts per million of the net prize pool
+ITM_PERCENT = 15                  # Tournaments and PKO pay the top 15% of the field
+PAYOUT_CURVE_EXPONENT = 1.0       # Place i weighs 1 / i**exponent before banding
+
+# Sit & Go curves by format (relative weights, best place first)
+SNG_PAYOUT_WEIGHTS = {
+    SnGFormat.WINNER_TAKES_ALL.value: [1],
+    SnGFormat.TOP_2_PAID.value: [65, 35],
+    SnGFormat.TOP_3_PAID.value: [50, 30, 20],
+}
+
+
+def apportion(total: int, weights: List[float]) -> List[int]:
+    """Split an integer total exactly by weights (largest remainder), biggest share first"""
+    weight_sum = sum(weights)
+    if not weights or weight_sum <= 0:
+        return []
+    raw = [total * w / weight_sum for w in weights]
+    shares = [int(r) for r in raw]
+    leftover = total - sum(shares)
+    for i in sorted(range(len(raw)), key=lambda i: (shares[i] - raw[i], i))[:leftover]:
+        shares[i] += 1
+    return sorted(shares, reverse=True)
+
+
+def payout_places(structure: str, field_size: int) -> int:
+    """How many places a structure ("mtt" or an SnGFormat value) pays for a field"""
+    if structure == SnGFormat.DOUBLE_OR_NOTHING.value:
+        return max(1, field_size // 2)
+    if structure in SNG_PAYOUT_WEIGHTS:
+        # Never pay the whole field
+        return max(1, min(len(SNG_PAYOUT_WEIGHTS[structure]), field_size - 1))
+    return max(1, field_size * ITM_PERCENT // 100)
+
+
+@lru_cache(maxsize=None)
+def _payout_curve(structure: str, places: int) -> Tuple[int, ...]:
+    if structure == SnGFormat.DOUBLE_OR_NOTHING.value:
+        weights = [1.0] * places
+    elif structure in SNG_PAYOUT_WEIGHTS:
+        weights = SNG_PAYOUT_WEIGHTS[structure][:places]
+    else:
+        # Deep ladders: places past 9th pay in bands (3 wide to 27th, 9 to 81st, then 27)
+        weights = []
+        while len(weights) < places:
+            start = len(weights) + 1
+            size = 1 if start <= 9 else 3 if start <= 27 else 9 if start <= 81 else 27
+            band = [1 / place ** PAYOUT_CURVE_EXPONENT for place in range(start, min(start + size, places + 1))]
+            weights += [sum(band) / len(band)] * len(band)
+    return tuple(apportion(PAYOUT_UNITS, weights))
+
+
+def payout_curve(structure: str, field_size: int) -> Tuple[int, ...]:
+    """Share of the net prize pool per finishing position (in PAYOUT_UNITS), cached per places paid"""
+    return _payout_curve(structure, payout_places(structure, field_size))
+
+
+def precompute_payout_curves(structure: str, max_players: int):
+    """Build every curve a field of up to max_players can need (field sizes that pay alike share one)"""
+    for places in sorted({payout_places(structure, n) for n in range(1, max_players + 1)}):
+        _payout_curve(structure, places)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # DATA CLASSES
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -106,7 +189,9 @@ class TournamentPlayer:
     eliminated_at: Optional[float] = None
     eliminated_by: Optional[int] = None  # telegram_id of eliminator
     total_bounty_won: float = 0.0    # Total bounty earned (for PKO)
-    registered_at: float = field(default_factory=time.time)
+    registered_at: float = field(default_factory=now)
+    is_bot: bool = False             # House seat filled by bots.py (pays no buy-in)
+    entries: int = 1                 # Buy-ins including re-entries
     
     def is_eliminated(self) -> bool:
         return self.eliminated_at is not None
@@ -124,6 +209,8 @@ class TournamentPlayer:
             "isEliminated": self.is_eliminated(),
             "eliminatedAt": int(self.eliminated_at * 1000) if self.eliminated_at else None,
             "totalBountyWon": self.total_bounty_won,
+            "isBot": self.is_bot,
+            "entries": self.entries,
         }
 
 
@@ -136,33 +223,61 @@ class TournamentTable:
     max_seats: int = 9
     game_session_id: Optional[str] = None
     is_active: bool = True
+    number: int = 0                  # Table number; tables break highest-number first on ties
+    player_count: int = 0            # Kept in step with seats by add_player / remove_player
+    _free_seats: List[int] = field(default_factory=list, repr=False)  # Empty seats, unordered
+    _seat_of: Dict[int, int] = field(default_factory=dict, repr=False)  # telegram_id -> seat
     
     def __post_init__(self):
         if not self.seats:
             self.seats = {i: None for i in range(1, self.max_seats + 1)}
+        self._free_seats = [seat for seat, player in self.seats.items() if player is None]
+        self._seat_of = {player: seat for seat, player in self.seats.items() if player is not None}
+        self.player_count = len(self._seat_of)
     
     def get_player_count(self) -> int:
-        return sum(1 for p in self.seats.values() if p is not None)
+        return self.player_count
     
     def get_empty_seats(self) -> List[int]:
-        return [seat for seat, player in self.seats.items() if player is None]
+        return sorted(self._free_seats)
     
     def add_player(self, telegram_id: int) -> Optional[int]:
-        """Add player to table, returns seat number or None if full"""
-        empty = self.get_empty_seats()
-        if not empty:
+        """Add player to a random empty seat in O(1), returns seat number or None if full"""
+        free = self._free_seats
+        if not free:
             return None
-        seat = random.choice(empty)
+        i = random.randrange(len(free))
+        free[i], free[-1] = free[-1], free[i]
+        seat = free.pop()
         self.seats[seat] = telegram_id
+        self._seat_of[telegram_id] = seat
+        self.player_count += 1
         return seat
     
     def remove_player(self, telegram_id: int) -> bool:
         """Remove player from table"""
-        for seat, player_id in self.seats.items():
-            if player_id == telegram_id:
-                self.seats[seat] = None
-                return True
-        return False
+        seat = self._seat_of.pop(telegram_id, None)
+        if seat is None:
+            return False
+        self.seats[seat] = None
+        self._free_seats.append(seat)
+        self.player_count -= 1
+        return True
+    
+    def players_in_blind_order(self, button_seat: Optional[int] = None) -> List[int]:
+        """
+        Seated telegram_ids in the order they will next post the big blind:
+        the button moves one seat before the next hand, so that is two seats after it.
+        """
+        occupied = sorted(seat for seat, player_id in self.seats.items() if player_id is not None)
+        if not occupied:
+            return []
+        start = 0
+        if button_seat is not None:
+            start = next((i for i, seat in enumerate(occupied) if seat > button_seat), 0)
+        start = (start + 2) % len(occupied)  # Skip the next button and small blind
+        ordered = occupied[start:] + occupied[:start]
+        return [self.seats[seat] for seat in ordered]
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -176,6 +291,124 @@ class TournamentTable:
         }
 
 
+class ChipLeaderboard:
+    """
+    Players still in a tournament kept sorted by chips (descending) in a flat array.
+    Rank lookups bisect in O(log n), top-k is a slice; an update is two bisects plus a memmove.
+    """
+    
+    def __init__(self):
+        self._keys: List[Tuple[int, int]] = []  # (-chips, telegram_id), ascending
+        self._chips: Dict[int, int] = {}        # telegram_id -> chips as currently keyed
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def add(self, telegram_id: int, chips: int):
+        self._chips[telegram_id] = chips
+        bisect.insort(self._keys, (-chips, telegram_id))
+    
+    def remove(self, telegram_id: int):
+        chips = self._chips.pop(telegram_id, None)
+        if chips is None:
+            return
+        idx = bisect.bisect_left(self._keys, (-chips, telegram_id))
+        del self._keys[idx]
+    
+    def update(self, telegram_id: int, chips: int):
+        if self._chips.get(telegram_id) == chips:
+            return
+        self.remove(telegram_id)
+        self.add(telegram_id, chips)
+    
+    def rank(self, telegram_id: int) -> Optional[int]:
+        """1-based chip rank, None if the player isn't on the board"""
+        chips = self._chips.get(telegram_id)
+        if chips is None:
+            return None
+        return bisect.bisect_left(self._keys, (-chips, telegram_id)) + 1
+    
+    def top(self, k: Optional[int] = None) -> List[int]:
+        """telegram_ids of the k biggest stacks (all when k is None)"""
+        keys = self._keys if k is None else self._keys[:k]
+        return [telegram_id for _, telegram_id in keys]
+
+
+RECENT_TOURNAMENT_SECONDS = 24 * 3600  # Finished tournaments stay on a player's list this long
+
+
+class PlayerTournamentIndex:
+    """
+    telegram_id -> tournaments they entered, split into registered / running / finished views.
+    Views are insertion-ordered dicts used as sets, so adding, dropping and moving an entry are O(1).
+    Finished entries expire RECENT_TOURNAMENT_SECONDS after the tournament ends, from a FIFO queue
+    of (expires_at, tournament_id, telegram_ids) that is drained on access.
+    """
+    
+    REGISTERED = "registered"
+    RUNNING = "running"
+    FINISHED = "finished"
+    VIEWS = (REGISTERED, RUNNING, FINISHED)
+    
+    def __init__(self, recent_seconds: float = RECENT_TOURNAMENT_SECONDS):
+        self.recent_seconds = recent_seconds
+        self._views: Dict[int, Dict[str, Dict[str, None]]] = {}  # telegram_id -> view -> tournament_ids
+        self._expiry: Deque[Tuple[float, str, Tuple[int, ...]]] = deque()
+    
+    def __len__(self) -> int:
+        return len(self._views)
+    
+    def add(self, telegram_id: int, tournament_id: str, view: str = REGISTERED):
+        views = self._views.get(telegram_id)
+        if views is None:
+            views = self._views[telegram_id] = {v: {} for v in self.VIEWS}
+        for ids in views.values():
+            ids.pop(tournament_id, None)
+        views[view][tournament_id] = None
+    
+    def discard(self, telegram_id: int, tournament_id: str):
+        views = self._views.get(telegram_id)
+        if not views:
+            return
+        for ids in views.values():
+            ids.pop(tournament_id, None)
+        if not any(views.values()):
+            del self._views[telegram_id]
+    
+    def move(self, telegram_ids: Iterable[int], tournament_id: str, view: str, at: float = 0.0):
+        """Move a tournament's entrants to another view; finished entries start aging at `at`"""
+        moved = []
+        for telegram_id in telegram_ids:
+            views = self._views.get(telegram_id)
+            if views is None or not any(tournament_id in ids for ids in views.values()):
+                continue
+            for ids in views.values():
+                ids.pop(tournament_id, None)
+            views[view][tournament_id] = None
+            moved.append(telegram_id)
+        
+        if view == self.FINISHED and moved:
+            self._expiry.append((at + self.recent_seconds, tournament_id, tuple(moved)))
+    
+    def expire(self, moment: float):
+        """Drop finished entries whose time is up"""
+        while self._expiry and self._expiry[0][0] <= moment:
+            _, tournament_id, telegram_ids = self._expiry.popleft()
+            for telegram_id in telegram_ids:
+                views = self._views.get(telegram_id)
+                if views and tournament_id in views[self.FINISHED]:
+                    self.discard(telegram_id, tournament_id)
+    
+    def get(self, telegram_id: int, view: Optional[str] = None) -> List[str]:
+        """tournament_ids in one view, or in all of them (registered, running, then finished)"""
+        views = self._views.get(telegram_id)
+        if not views:
+            return []
+        if view:
+            return list(views.get(view, ()))
+        return [tournament_id for v in self.VIEWS for tournament_id in views[v]]
+
+
 @dataclass
 class Tournament:
     """Tournament instance"""
@@ -191,7 +424,7 @@ class Tournament:
     # Blind structure
     blind_structure: str = "standard"  # Key in BLIND_STRUCTURES
     current_level: int = 0
-    level_started_at: float = 0.0
+    level_started_at: Optional[float] = None  # None until the first level starts (clock time 0.0 is a real start)
     
     # Prize structure
     prize_pool: float = 0.0
@@ -205,9 +438,13 @@ class Tournament:
     players_per_table: int = 9       # 6 or 9 for SnG
     
     # Timing
-    created_at: float = field(default_factory=time.time)
+    created_at: float = field(default_factory=now)
     registration_ends_at: Optional[float] = None
     late_reg_levels: int = 3         # Late reg available for first N levels
+    max_entries: int = 1             # Entries per player during late reg (1 = freezeout)
+    break_every_levels: int = 0      # Synchronized break after every N levels (0 = no breaks)
+    break_seconds: int = 300
+    break_until: Optional[float] = None
     started_at: Optional[float] = None
     finished_at: Optional[float] = None
     
@@ -219,17 +456,133 @@ class Tournament:
     payouts: Dict[int, float] = field(default_factory=dict)  # position -> payout
     final_positions: Dict[int, int] = field(default_factory=dict)  # telegram_id -> position
     
+    # Bumped on every change to the lobby summary (to_dict(include_players=False)); keys response caches
+    version: int = 0
+    
+    # Running aggregates - only change players/chips/eliminations through the methods below
+    _players_remaining: int = field(default=0, repr=False)
+    _total_chips: int = field(default=0, repr=False)
+    _active_chips: int = field(default=0, repr=False)
+    _leaderboard: ChipLeaderboard = field(default_factory=ChipLeaderboard, repr=False)
+    _eliminated_order: List[int] = field(default_factory=list, repr=False)  # First out first
+    _payouts_cents: Dict[Tuple[int, int], Dict[int, int]] = field(default_factory=dict, repr=False)
+    _entries: int = field(default=0, repr=False)
+    _table_sizes: List[Tuple[int, int, str]] = field(default_factory=list, repr=False)  # Min-heap, stale entries skipped
+    
+    def touch(self):
+        self.version += 1
+    
+    def add_player(self, player: TournamentPlayer):
+        self.touch()
+        self.players[player.telegram_id] = player
+        self._entries += player.entries
+        self._total_chips += player.chips
+        if not player.is_eliminated():
+            self._players_remaining += 1
+            self._active_chips += player.chips
+            self._leaderboard.add(player.telegram_id, player.chips)
+    
+    def remove_player(self, telegram_id: int) -> Optional[TournamentPlayer]:
+        player = self.players.pop(telegram_id, None)
+        if player:
+            self.touch()
+            self._entries -= player.entries
+            self._total_chips -= player.chips
+            if not player.is_eliminated():
+                self._players_remaining -= 1
+                self._active_chips -= player.chips
+                self._leaderboard.remove(telegram_id)
+        return player
+    
+    def set_chips(self, telegram_id: int, chips: int):
+        player = self.players[telegram_id]
+        delta = chips - player.chips
+        player.chips = chips
+        self._total_chips += delta
+        if not player.is_eliminated():
+            self._active_chips += delta
+            self._leaderboard.update(telegram_id, chips)
+    
+    def mark_eliminated(self, telegram_id: int, eliminated_at: float, eliminated_by: Optional[int]):
+        player = self.players[telegram_id]
+        if player.is_eliminated():
+            return
+        self.touch()
+        player.eliminated_at = eliminated_at
+        player.eliminated_by = eliminated_by
+        self._players_remaining -= 1
+        self._active_chips -= player.chips
+        self._leaderboard.remove(telegram_id)
+        self._eliminated_order.append(telegram_id)
+    
+    def reenter(self, telegram_id: int, chips: int):
+        """Bring an eliminated player back with a fresh stack (late registration re-entry)"""
+        player = self.players[telegram_id]
+        self.touch()
+        self._eliminated_order.remove(telegram_id)
+        self.final_positions.pop(telegram_id, None)
+        # The player is back above everyone who busted after them: those each finish a place lower
+        for other_id in self._eliminated_order:
+            other = self.players[other_id]
+            if other.position < player.position:
+                other.position += 1
+                self.final_positions[other_id] = other.position
+        player.eliminated_at = None
+        player.eliminated_by = None
+        player.position = 0
+        player.entries += 1
+        player.bounty = player.starting_bounty
+        self._entries += 1
+        self._total_chips += chips - player.chips
+        player.chips = chips
+        self._players_remaining += 1
+        self._active_chips += chips
+        self._leaderboard.add(telegram_id, chips)
+    
+    def get_entries(self) -> int:
+        """Buy-ins so far, re-entries included (the field size payouts are based on)"""
+        return self._entries
+    
+    def note_table_size(self, table: TournamentTable):
+        """Record a table's new player count in the size heap (older entries go stale)"""
+        heapq.heappush(self._table_sizes, (table.player_count, table.number, table.table_id))
+        if len(self._table_sizes) > 2 * len(self.tables) + 16:
+            self._table_sizes = [(t.player_count, t.number, t.table_id) for t in self.tables.values() if t.is_active]
+            heapq.heapify(self._table_sizes)
+    
+    def get_shortest_open_table(self) -> Optional[TournamentTable]:
+        """Active table with the fewest players and a free seat (amortized O(log tables))"""
+        while self._table_sizes:
+            count, _, table_id = self._table_sizes[0]
+            table = self.tables.get(table_id)
+            if table and table.is_active and table.player_count == count and count < table.max_seats:
+                return table
+            heapq.heappop(self._table_sizes)
+        return None
+    
+    def get_rank(self, telegram_id: int) -> Optional[int]:
+        """Chip rank while in the tournament, finishing position once eliminated"""
+        player = self.players.get(telegram_id)
+        if not player:
+            return None
+        if player.is_eliminated():
+            return player.position
+        return self._leaderboard.rank(telegram_id)
+    
+    def get_top_players(self, limit: Optional[int] = None) -> List[TournamentPlayer]:
+        """Players still in, biggest stack first"""
+        return [self.players[telegram_id] for telegram_id in self._leaderboard.top(limit)]
+    
     def get_players_remaining(self) -> int:
-        return sum(1 for p in self.players.values() if not p.is_eliminated())
+        return self._players_remaining
     
     def get_average_stack(self) -> int:
-        active = [p for p in self.players.values() if not p.is_eliminated()]
-        if not active:
+        if not self._players_remaining:
             return 0
-        return sum(p.chips for p in active) // len(active)
+        return self._active_chips // self._players_remaining
     
     def get_total_chips(self) -> int:
-        return sum(p.chips for p in self.players.values())
+        return self._total_chips
     
     def get_current_blinds(self) -> Dict[str, int]:
         structure = BLIND_STRUCTURES.get(self.blind_structure, BLIND_STRUCTURES["standard"])
@@ -239,74 +592,56 @@ class Tournament:
     
     def get_time_to_next_level(self) -> int:
         """Returns seconds until next blind level"""
-        if not self.level_started_at:
+        if self.level_started_at is None:
             return 0
         blinds = self.get_current_blinds()
-        elapsed = time.time() - self.level_started_at
+        elapsed = now() - self.level_started_at
         return max(0, int(blinds["duration"] - elapsed))
     
-    def calculate_prize_structure(self) -> Dict[int, float]:
-        """Calculate payout for each position"""
-        total_players = len(self.players)
-        net_pool = self.prize_pool * (1 - self.rake_percent / 100)
-        
-        # For Bounty Hunter, only 50% goes to regular prizes
+    def is_on_break(self) -> bool:
+        return self.break_until is not None and now() < self.break_until
+    
+    def is_hand_for_hand(self) -> bool:
+        """On the money bubble or the final-table bubble while more than one table is in play"""
+        bubble = self._players_remaining - 1
+        if bubble not in (len(self.payouts), self.players_per_table):
+            return False
+        return sum(1 for t in self.tables.values() if t.is_active) > 1
+    
+    def get_level_ends_at(self) -> Optional[float]:
+        """Clock time the current blind level ends (lets clients count down without polling)"""
+        if self.level_started_at is None:
+            return None
+        return self.level_started_at + self.get_current_blinds()["duration"]
+    
+    def get_payout_structure(self) -> str:
+        """Payout curve key: the Sit & Go format, or "mtt" for tournaments and PKO"""
+        return self.sng_format.value if self.mode == TournamentMode.SIT_AND_GO else "mtt"
+    
+    def get_net_prize_pool_cents(self) -> int:
+        """Prize pool after rake (and, for Bounty Hunter, after the bounty share) in cents"""
+        pool = round(self.prize_pool * 100)
+        pool = pool * (10000 - round(self.rake_percent * 100)) // 10000
         if self.mode == TournamentMode.BOUNTY_HUNTER:
-            net_pool = net_pool * (1 - self.bounty_percent / 100)
-        
-        # ITM = top 15% (at least 1)
-        itm_count = max(1, total_players * 15 // 100)
-        
-        if total_players <= 6:
-            # Small SnG
-            if self.sng_format == SnGFormat.WINNER_TAKES_ALL:
-                return {1: net_pool}
-            elif self.sng_format == SnGFormat.TOP_2_PAID:
-                return {1: net_pool * 0.65, 2: net_pool * 0.35}
-            elif self.sng_format == SnGFormat.TOP_3_PAID:
-                return {1: net_pool * 0.50, 2: net_pool * 0.30, 3: net_pool * 0.20}
-            elif self.sng_format == SnGFormat.DOUBLE_OR_NOTHING:
-                half = total_players // 2
-                payout = net_pool / half
-                return {i: payout for i in range(1, half + 1)}
-        
-        # Standard tournament payout structure
-        payouts = {}
-        if itm_count >= 15:
-            payouts = {
-                1: net_pool * 0.30,
-                2: net_pool * 0.20,
-                3: net_pool * 0.15,
-            }
-            for i in range(4, 7):
-                payouts[i] = net_pool * 0.08
-            for i in range(7, 10):
-                payouts[i] = net_pool * 0.05
-            remaining = net_pool * (1 - 0.30 - 0.20 - 0.15 - 0.08*3 - 0.05*3)
-            for i in range(10, itm_count + 1):
-                payouts[i] = remaining / (itm_count - 9)
-        elif itm_count >= 9:
-            payouts = {
-                1: net_pool * 0.35,
-                2: net_pool * 0.22,
-                3: net_pool * 0.15,
-            }
-            for i in range(4, 7):
-                payouts[i] = net_pool * 0.06
-            for i in range(7, itm_count + 1):
-                payouts[i] = net_pool * 0.04
-        elif itm_count >= 3:
-            payouts = {
-                1: net_pool * 0.50,
-                2: net_pool * 0.30,
-                3: net_pool * 0.20,
-            }
-        else:
-            payouts = {1: net_pool}
-        
-        self.payouts = payouts
+            pool = pool * (10000 - round(self.bounty_percent * 100)) // 10000
+        return pool
+    
+    def get_payouts_cents(self) -> Dict[int, int]:
+        """Payout per finishing position in cents for the current field (cached until it or the pool changes)"""
+        key = (self.get_net_prize_pool_cents(), self._entries)
+        payouts = self._payouts_cents.get(key)
+        if payouts is None:
+            curve = payout_curve(self.get_payout_structure(), self._entries)
+            payouts = {i + 1: cents for i, cents in enumerate(apportion(key[0], curve))}
+            self._payouts_cents.clear()
+            self._payouts_cents[key] = payouts
         return payouts
     
+    def calculate_prize_structure(self) -> Dict[int, float]:
+        """Calculate payout for each position (exact to the cent, shares sum to the net pool)"""
+        self.payouts = {position: cents / 100 for position, cents in self.get_payouts_cents().items()}
+        return self.payouts
+    
     def to_dict(self, include_players: bool = True) -> Dict[str, Any]:
         blinds = self.get_current_blinds()
         
@@ -323,35 +658,94 @@ class Tournament:
             "currentLevel": self.current_level,
             "currentBlinds": blinds,
             "timeToNextLevel": self.get_time_to_next_level(),
+            "levelEndsAt": int(self.get_level_ends_at() * 1000) if self.level_started_at is not None else None,
             "prizePool": self.prize_pool,
             "rakePercent": self.rake_percent,
             "bountyPercent": self.bounty_percent if self.mode == TournamentMode.BOUNTY_HUNTER else 0,
             "sngFormat": self.sng_format.value if self.mode == TournamentMode.SIT_AND_GO else None,
             "playersPerTable": self.players_per_table,
             "registeredCount": len(self.players),
+            "entries": self._entries,
+            "maxEntries": self.max_entries,
             "playersRemaining": self.get_players_remaining(),
             "averageStack": self.get_average_stack(),
             "totalChips": self.get_total_chips(),
             "createdAt": int(self.created_at * 1000),
+            "registrationEndsAt": int(self.registration_ends_at * 1000) if self.registration_ends_at else None,
             "startedAt": int(self.started_at * 1000) if self.started_at else None,
             "finishedAt": int(self.finished_at * 1000) if self.finished_at else None,
             "lateRegLevels": self.late_reg_levels,
+            "breakUntil": int(self.break_until * 1000) if self.is_on_break() else None,
             "tablesCount": len(self.tables),
+            "version": self.version,
         }
         
         if include_players:
-            # Sort by chips (descending) for leaderboard
-            sorted_players = sorted(
-                self.players.values(),
-                key=lambda p: (not p.is_eliminated(), p.chips),
-                reverse=True
-            )
-            result["players"] = [p.to_dict() for p in sorted_players]
+            # Leaderboard order: chip leaders, then eliminated players by finishing position
+            ordered = self.get_top_players()
+            ordered += [self.players[telegram_id] for telegram_id in reversed(self._eliminated_order)]
+            result["players"] = [p.to_dict() for p in ordered]
             result["payouts"] = {str(k): v for k, v in self.payouts.items()}
         
         return result
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# TABLE BALANCING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def plan_table_balance(
+    tables: List[TournamentTable],
+    button_seats: Optional[Dict[str, int]] = None
+) -> Tuple[List[str], List[Tuple[int, str, str]]]:
+    """
+    Plan the fewest moves that leave every active table within one player of the others,
+    on as few tables as the field needs.
+    
+    Tables break emptiest first (highest number on ties). Tables that already hold more
+    players keep the extra seats, so only true surplus moves. Players leave a table in
+    the order they would next post the big blind, and always go to the currently
+    smallest table short of its target (a heap of table sizes).
+    
+    Returns (table_ids_to_break, moves) where a move is (telegram_id, from_table_id, to_table_id).
+    """
+    button_seats = button_seats or {}
+    active = [t for t in tables if t.is_active]
+    if len(active) <= 1:
+        return [], []
+    
+    total = sum(t.player_count for t in active)
+    max_seats = max(t.max_seats for t in active)
+    needed = max(1, -(-total // max_seats))
+    
+    break_order = sorted(active, key=lambda t: (t.player_count, -t.number))
+    broken = break_order[:max(0, len(active) - needed)]
+    kept = sorted(break_order[len(broken):], key=lambda t: t.player_count, reverse=True)
+    
+    base, extra = divmod(total, len(kept))
+    targets = {t.table_id: base + (1 if i < extra else 0) for i, t in enumerate(kept)}
+    
+    # Everyone at a broken table moves, plus each kept table's surplus
+    movers: List[Tuple[int, str]] = []
+    for table in broken + kept:
+        surplus = table.player_count - targets.get(table.table_id, 0)
+        if surplus > 0:
+            order = table.players_in_blind_order(button_seats.get(table.table_id))
+            movers += [(telegram_id, table.table_id) for telegram_id in order[:surplus]]
+    
+    short = [(t.player_count, t.number, t.table_id) for t in kept if t.player_count < targets[t.table_id]]
+    heapq.heapify(short)
+    
+    moves = []
+    for telegram_id, from_table_id in movers:
+        count, number, to_table_id = heapq.heappop(short)
+        moves.append((telegram_id, from_table_id, to_table_id))
+        if count + 1 < targets[to_table_id]:
+            heapq.heappush(short, (count + 1, number, to_table_id))
+    
+    return [t.table_id for t in broken], moves
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # TOURNAMENT MANAGER
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -359,11 +753,19 @@ class Tournament:
 class TournamentManager:
     """Manages all tournaments"""
     
-    def __init__(self):
+    def __init__(self, clock: Optional[Clock] = None):
+        self._clock = clock  # None follows the process-wide clock (see clock.set_clock)
         self.tournaments: Dict[str, Tournament] = {}
-        self.player_tournaments: Dict[int, List[str]] = {}  # telegram_id -> tournament_ids
+        self.player_tournaments = PlayerTournamentIndex()  # Human entrants only
         self._blind_tasks: Dict[str, asyncio.Task] = {}
         self._callbacks: Dict[str, List[Callable]] = {}
+        self._next_bot_id = -1  # Bots get negative telegram ids
+        self.session_index: Dict[str, Tuple[str, str]] = {}  # game session_id -> (tournament_id, table_id)
+        self.deferred_balancing: Set[str] = set()  # Tournaments that rebalance only at a TournamentBarrier
+    
+    @property
+    def clock(self) -> Clock:
+        return self._clock or get_clock()
     
     # ═══════════════════════════════════════════════════════════════════════════
     # TOURNAMENT CREATION
@@ -379,10 +781,11 @@ class TournamentManager:
         max_players: int = 180,
         blind_structure: str = "standard",
         late_reg_levels: int = 3,
+        publish: bool = True,
         **kwargs
     ) -> Tournament:
-        """Create a new tournament"""
-        tournament_id = f"t_{mode.value}_{int(time.time())}_{random.randint(1000, 9999)}"
+        """Create a new tournament (publish=False builds it without listing it, see publish_tournament)"""
+        tournament_id = f"t_{mode.value}_{int(time.time())}_{uuid.uuid4().hex[:8]}"
         
         tournament = Tournament(
             tournament_id=tournament_id,
@@ -394,6 +797,7 @@ class TournamentManager:
             max_players=max_players,
             blind_structure=blind_structure,
             late_reg_levels=late_reg_levels,
+            created_at=self.clock.time(),
             **kwargs
         )
         
@@ -409,18 +813,26 @@ class TournamentManager:
             tournament.max_players = tournament.players_per_table
             tournament.blind_structure = kwargs.get("blind_structure", "turbo")
         
-        self.tournaments[tournament_id] = tournament
-        print(f"🏆 TOURNAMENT: Created {mode.value} tournament '{name}' (ID: {tournament_id})")
+        precompute_payout_curves(tournament.get_payout_structure(), tournament.max_players)
         
+        if publish:
+            self.publish_tournament(tournament)
         return tournament
     
+    def publish_tournament(self, tournament: Tournament):
+        """List a built tournament so players can find and join it"""
+        tournament.created_at = self.clock.time()
+        self.tournaments[tournament.tournament_id] = tournament
+        _log(f"🏆 TOURNAMENT: Created {tournament.mode.value} tournament '{tournament.name}' (ID: {tournament.tournament_id})")
+    
     def create_sit_and_go(
         self,
         buy_in: float,
         players_per_table: int = 9,
         sng_format: SnGFormat = SnGFormat.TOP_3_PAID,
         blind_structure: str = "turbo",
-        starting_chips: int = 1500
+        starting_chips: int = 1500,
+        publish: bool = True
     ) -> Tournament:
         """Quick create a Sit & Go table"""
         name = f"Sit & Go ${buy_in} ({players_per_table}-max)"
@@ -436,6 +848,7 @@ class TournamentManager:
             sng_format=sng_format,
             players_per_table=players_per_table,
             late_reg_levels=0,  # No late reg in SnG
+            publish=publish,
         )
     
     def create_bounty_tournament(
@@ -470,9 +883,10 @@ class TournamentManager:
         tournament_id: str,
         telegram_id: int,
         username: Optional[str],
-        first_name: str
+        first_name: str,
+        is_bot: bool = False
     ) -> Tuple[bool, str, Optional[Tournament]]:
-        """Register a player for a tournament"""
+        """Register a player for a tournament (late entrants and re-entries are seated at once)"""
         tournament = self.tournaments.get(tournament_id)
         
         if not tournament:
@@ -482,12 +896,15 @@ class TournamentManager:
         if tournament.status not in [TournamentStatus.REGISTERING, TournamentStatus.LATE_REG]:
             return False, "Registration is closed", None
         
+        existing = tournament.players.get(telegram_id)
+        if existing:
+            if tournament.status == TournamentStatus.LATE_REG and existing.is_eliminated():
+                return await self._reenter_player(tournament, existing)
+            return True, "Already registered", tournament
+        
         if len(tournament.players) >= tournament.max_players:
             return False, "Tournament is full", None
         
-        if telegram_id in tournament.players:
-            return True, "Already registered", tournament
-        
         # Calculate starting bounty for PKO
         starting_bounty = 0.0
         if tournament.mode == TournamentMode.BOUNTY_HUNTER:
@@ -501,17 +918,23 @@ class TournamentManager:
             chips=tournament.starting_chips,
             bounty=starting_bounty,
             starting_bounty=starting_bounty,
+            registered_at=self.clock.time(),
+            is_bot=is_bot,
         )
         
-        tournament.players[telegram_id] = player
-        tournament.prize_pool += tournament.buy_in
+        tournament.add_player(player)
+        if not is_bot:
+            tournament.prize_pool += tournament.buy_in
+        if tournament.status == TournamentStatus.LATE_REG:
+            tournament.calculate_prize_structure()  # The field grew after the start
+            await self._seat_late_entry(tournament, player)
         
         # Track player's tournaments
-        if telegram_id not in self.player_tournaments:
-            self.player_tournaments[telegram_id] = []
-        self.player_tournaments[telegram_id].append(tournament_id)
+        if not is_bot:
+            view = PlayerTournamentIndex.RUNNING if tournament.status == TournamentStatus.LATE_REG else PlayerTournamentIndex.REGISTERED
+            self.player_tournaments.add(telegram_id, tournament_id, view)
         
-        print(f"🏆 TOURNAMENT: Player {telegram_id} registered for {tournament.name}")
+        _log(f"🏆 TOURNAMENT: Player {telegram_id} registered for {tournament.name}")
         
         # Check if SnG should auto-start
         if tournament.mode == TournamentMode.SIT_AND_GO:
@@ -520,6 +943,57 @@ class TournamentManager:
         
         return True, "Registered successfully", tournament
     
+    async def _reenter_player(
+        self,
+        tournament: Tournament,
+        player: TournamentPlayer
+    ) -> Tuple[bool, str, Optional[Tournament]]:
+        """Buy an eliminated player back in during late registration"""
+        if player.entries >= tournament.max_entries:
+            return False, "No re-entries left", None
+        
+        tournament.reenter(player.telegram_id, tournament.starting_chips)
+        if not player.is_bot:
+            tournament.prize_pool += tournament.buy_in
+        tournament.calculate_prize_structure()
+        await self._seat_late_entry(tournament, player)
+        
+        _log(f"🏆 TOURNAMENT: Player {player.telegram_id} re-entered {tournament.name} (entry {player.entries})")
+        return True, "Re-entered successfully", tournament
+    
+    async def _seat_late_entry(self, tournament: Tournament, player: TournamentPlayer):
+        """
+        Seat a late entrant at the shortest table. When all are full a new table opens and the
+        tables rebalance into it, so the entrant is dealt in without waiting for a bust elsewhere.
+        """
+        table = tournament.get_shortest_open_table()
+        opened = table is None
+        if opened:
+            number = len(tournament.tables) + 1
+            table = TournamentTable(
+                table_id=f"{tournament.tournament_id}_table_{number}",
+                tournament_id=tournament.tournament_id,
+                max_seats=tournament.players_per_table,
+                number=number,
+            )
+            tournament.tables[table.table_id] = table
+            _log(f"🏆 TOURNAMENT: Opened table {table.table_id} for late registration")
+        
+        player.seat = table.add_player(player.telegram_id)
+        player.table_id = table.table_id
+        tournament.note_table_size(table)
+        
+        await self._notify("player_seated", tournament.tournament_id, {
+            "telegramId": player.telegram_id,
+            "tableId": table.table_id,
+            "seat": player.seat,
+            "gameSessionId": table.game_session_id,
+        })
+        
+        # After the notice, so the moves carry the new table's game session
+        if opened and tournament.tournament_id not in self.deferred_balancing:
+            await self._balance_tables(tournament)
+    
     async def unregister_player(
         self,
         tournament_id: str,
@@ -537,15 +1011,58 @@ class TournamentManager:
         if telegram_id not in tournament.players:
             return False, "Not registered"
         
-        del tournament.players[telegram_id]
-        tournament.prize_pool -= tournament.buy_in
+        player = tournament.remove_player(telegram_id)
+        if not player.is_bot:
+            tournament.prize_pool -= tournament.buy_in
         
-        if telegram_id in self.player_tournaments:
-            self.player_tournaments[telegram_id].remove(tournament_id)
+        self.player_tournaments.discard(telegram_id, tournament_id)
         
-        print(f"🏆 TOURNAMENT: Player {telegram_id} unregistered from {tournament.name}")
+        _log(f"🏆 TOURNAMENT: Player {telegram_id} unregistered from {tournament.name}")
         return True, "Unregistered successfully"
     
+    async def fill_with_bots(
+        self,
+        tournament_id: str,
+        count: Optional[int] = None
+    ) -> Tuple[bool, str, int]:
+        """
+        Register bots into open seats so a tournament can start without waiting for humans.
+        Defaults to filling a Sit & Go (which then auto-starts) or an MTT up to min_players.
+        Returns (success, message, bots_added).
+        """
+        from bots import BOT_NAMES
+        
+        tournament = self.tournaments.get(tournament_id)
+        
+        if not tournament:
+            return False, "Tournament not found", 0
+        
+        if tournament.status != TournamentStatus.REGISTERING:
+            return False, "Registration is closed", 0
+        
+        if not any(not p.is_bot for p in tournament.players.values()):
+            return False, "Need at least one registered player", 0
+        
+        if count is None:
+            target = tournament.max_players if tournament.mode == TournamentMode.SIT_AND_GO else tournament.min_players
+            count = target - len(tournament.players)
+        count = min(count, tournament.max_players - len(tournament.players))
+        
+        added = 0
+        for _ in range(max(0, count)):
+            bot_id = self._next_bot_id
+            self._next_bot_id -= 1
+            name = BOT_NAMES[(-bot_id - 1) % len(BOT_NAMES)]
+            success, message, _ = await self.register_player(tournament_id, bot_id, None, name, is_bot=True)
+            if not success:
+                # e.g. the previous bot filled a Sit & Go and started it
+                _log(f"🤖 TOURNAMENT: Stopped adding bots to {tournament.name}: {message}")
+                break
+            added += 1
+        
+        _log(f"🤖 TOURNAMENT: Added {added} bots to {tournament.name}")
+        return True, f"Added {added} bots", added
+    
     # ═══════════════════════════════════════════════════════════════════════════
     # TOURNAMENT LIFECYCLE
     # ═══════════════════════════════════════════════════════════════════════════
@@ -563,9 +1080,10 @@ class TournamentManager:
         if len(tournament.players) < tournament.min_players:
             return False, f"Need at least {tournament.min_players} players"
         
-        tournament.status = TournamentStatus.RUNNING
-        tournament.started_at = time.time()
-        tournament.level_started_at = time.time()
+        tournament.status = TournamentStatus.LATE_REG if tournament.late_reg_levels > 0 else TournamentStatus.RUNNING
+        tournament.started_at = self.clock.time()
+        self.player_tournaments.move(tournament.players, tournament_id, PlayerTournamentIndex.RUNNING)
+        tournament.level_started_at = self.clock.time()
         tournament.current_level = 0
         
         # Calculate prize structure
@@ -577,9 +1095,31 @@ class TournamentManager:
         # Start blind timer
         await self._start_blind_timer(tournament_id)
         
-        print(f"🏆 TOURNAMENT: Started {tournament.name} with {len(tournament.players)} players")
+        tournament.touch()
+        _log(f"🏆 TOURNAMENT: Started {tournament.name} with {len(tournament.players)} players")
+        
+        await self._notify("tournament_started", tournament_id, {"tables": len(tournament.tables)})
         return True, "Tournament started"
     
+    async def cancel_tournament(self, tournament_id: str, reason: str = "") -> Tuple[bool, str]:
+        """Call off a tournament that never started"""
+        tournament = self.tournaments.get(tournament_id)
+        
+        if not tournament:
+            return False, "Tournament not found"
+        
+        if tournament.status != TournamentStatus.REGISTERING:
+            return False, "Tournament already started"
+        
+        tournament.status = TournamentStatus.CANCELLED
+        tournament.finished_at = self.clock.time()
+        tournament.touch()
+        self.player_tournaments.move(tournament.players, tournament_id, PlayerTournamentIndex.FINISHED, tournament.finished_at)
+        _log(f"🏆 TOURNAMENT: Cancelled {tournament.name}: {reason}")
+        
+        await self._notify("tournament_cancelled", tournament_id, {"reason": reason})
+        return True, "Tournament cancelled"
+    
     async def _seat_players(self, tournament: Tournament):
         """Distribute players to tables"""
         players = list(tournament.players.values())
@@ -594,6 +1134,7 @@ class TournamentManager:
                 table_id=table_id,
                 tournament_id=tournament.tournament_id,
                 max_seats=seats_per_table,
+                number=i + 1,
             )
             tournament.tables[table_id] = table
         
@@ -605,7 +1146,10 @@ class TournamentManager:
             player.table_id = table.table_id
             player.seat = seat
         
-        print(f"🏆 TOURNAMENT: Seated {len(players)} players across {len(table_list)} tables")
+        for table in table_list:
+            tournament.note_table_size(table)
+        
+        _log(f"🏆 TOURNAMENT: Seated {len(players)} players across {len(table_list)} tables")
     
     async def _start_blind_timer(self, tournament_id: str):
         """Start the blind level timer"""
@@ -615,20 +1159,35 @@ class TournamentManager:
                 if not tournament or tournament.status in [TournamentStatus.FINISHED, TournamentStatus.CANCELLED]:
                     break
                 
-                blinds = tournament.get_current_blinds()
-                await asyncio.sleep(blinds["duration"])
+                # A level that follows a break starts its clock when the break ends
+                ends_at = tournament.get_level_ends_at()
+                if ends_at is None:
+                    await self.clock.sleep(tournament.get_current_blinds()["duration"])
+                else:
+                    await self.clock.sleep(max(0.0, ends_at - self.clock.time()))
                 
                 # Increase blind level
                 tournament.current_level += 1
-                tournament.level_started_at = time.time()
+                tournament.level_started_at = self.clock.time()
+                
+                if tournament.break_every_levels and tournament.current_level % tournament.break_every_levels == 0:
+                    tournament.break_until = tournament.level_started_at + tournament.break_seconds
+                    tournament.level_started_at = tournament.break_until
+                    _log(f"☕ TOURNAMENT: {tournament.name} on a {tournament.break_seconds}s break")
+                    await self._notify("break_started", tournament_id, {
+                        "until": int(tournament.break_until * 1000),
+                        "seconds": tournament.break_seconds,
+                    })
                 
                 # Check if late reg should end
                 if tournament.current_level > tournament.late_reg_levels:
                     if tournament.status == TournamentStatus.LATE_REG:
                         tournament.status = TournamentStatus.RUNNING
+                        tournament.calculate_prize_structure()  # The field is final: lock the ladder
+                tournament.touch()
                 
                 new_blinds = tournament.get_current_blinds()
-                print(f"🏆 TOURNAMENT: Level {tournament.current_level} - Blinds {new_blinds['sb']}/{new_blinds['bb']} (Ante: {new_blinds['ante']})")
+                _log(f"🏆 TOURNAMENT: Level {tournament.current_level} - Blinds {new_blinds['sb']}/{new_blinds['bb']} (Ante: {new_blinds['ante']})")
                 
                 # Notify via callback
                 await self._notify("blind_increase", tournament_id, new_blinds)
@@ -657,115 +1216,163 @@ class TournamentManager:
         if eliminated.is_eliminated():
             return False, "Player already eliminated", None
         
-        # Record elimination
-        remaining = tournament.get_players_remaining()
-        eliminated.eliminated_at = time.time()
-        eliminated.eliminated_by = eliminator_id
-        eliminated.position = remaining
-        tournament.final_positions[eliminated_id] = remaining
-        
-        # Handle bounty for PKO mode
-        bounty_result = None
-        if tournament.mode == TournamentMode.BOUNTY_HUNTER and eliminated.bounty > 0:
-            # 50% cash, 50% added to eliminator's bounty
-            cash_bounty = eliminated.bounty / 2
-            added_bounty = eliminated.bounty / 2
+        success, message, bounty_results = await self.eliminate_players(
+            tournament_id, [(eliminated_id, eliminated.chips, [eliminator_id])]
+        )
+        if not success:
+            return False, message, None
+        return True, "Player eliminated", bounty_results[0] if bounty_results else None
+    
+    async def eliminate_players(
+        self,
+        tournament_id: str,
+        busts: List[Tuple[int, int, List[int]]]
+    ) -> Tuple[bool, str, List[Dict]]:
+        """
+        Eliminate everyone who busted in one hand, atomically.
+        busts: (eliminated_id, stack at the start of the hand, eliminator_ids), where the eliminators
+        are the players who won the busted player's chips (several when side pots split them).
+        Whoever started the hand with more chips finishes higher (telegram_id breaks exact ties).
+        PKO bounties split evenly between the eliminators. Tables rebalance once at the end.
+        Returns (success, message, bounty_results).
+        """
+        tournament = self.tournaments.get(tournament_id)
+        
+        if not tournament:
+            return False, "Tournament not found", []
+        
+        busts = [
+            (eliminated_id, starting_stack, [e for e in eliminator_ids if e in tournament.players])
+            for eliminated_id, starting_stack, eliminator_ids in busts
+            if eliminated_id in tournament.players and not tournament.players[eliminated_id].is_eliminated()
+        ]
+        if not busts:
+            return False, "No players to eliminate", []
+        
+        # Worst finisher first: smallest starting stack takes the lowest position
+        busts.sort(key=lambda bust: (bust[1], -bust[0]))
+        position = tournament.get_players_remaining()
+        eliminated_at = self.clock.time()
+        bounty_results = []
+        
+        for eliminated_id, _, eliminator_ids in busts:
+            eliminated = tournament.players[eliminated_id]
+            tournament.mark_eliminated(eliminated_id, eliminated_at, eliminator_ids[0] if eliminator_ids else None)
+            eliminated.position = position
+            tournament.final_positions[eliminated_id] = position
             
-            eliminator.total_bounty_won += cash_bounty
-            eliminator.bounty += added_bounty
+            # Handle bounty for PKO mode
+            if tournament.mode == TournamentMode.BOUNTY_HUNTER and eliminated.bounty > 0 and eliminator_ids:
+                # 50% cash, 50% added to eliminator's bounty, shared between eliminators
+                cash_bounty = eliminated.bounty / 2
+                added_bounty = eliminated.bounty / 2
+                shares = []
+                for eliminator_id in eliminator_ids:
+                    eliminator = tournament.players[eliminator_id]
+                    eliminator.total_bounty_won += cash_bounty / len(eliminator_ids)
+                    eliminator.bounty += added_bounty / len(eliminator_ids)
+                    shares.append({
+                        "telegramId": eliminator_id,
+                        "cashBounty": cash_bounty / len(eliminator_ids),
+                        "addedBounty": added_bounty / len(eliminator_ids),
+                        "newBounty": eliminator.bounty,
+                    })
+                    _log(f"🏆 BOUNTY: {eliminator.first_name} won ${cash_bounty / len(eliminator_ids)} bounty, new bounty: ${eliminator.bounty}")
+                
+                first = tournament.players[eliminator_ids[0]]
+                bounty_results.append({
+                    "cashBounty": cash_bounty,
+                    "addedBounty": added_bounty,
+                    "newBounty": first.bounty,
+                    "eliminatedPlayer": eliminated.first_name,
+                    "eliminatorPlayer": first.first_name,
+                    "eliminators": shares,
+                })
             
-            bounty_result = {
-                "cashBounty": cash_bounty,
-                "addedBounty": added_bounty,
-                "newBounty": eliminator.bounty,
-                "eliminatedPlayer": eliminated.first_name,
-                "eliminatorPlayer": eliminator.first_name,
-            }
+            # Remove from table
+            table = tournament.tables.get(eliminated.table_id)
+            if table:
+                table.remove_player(eliminated_id)
+                tournament.note_table_size(table)
             
-            print(f"🏆 BOUNTY: {eliminator.first_name} won ${cash_bounty} bounty, new bounty: ${eliminator.bounty}")
-        
-        # Remove from table
-        table = tournament.tables.get(eliminated.table_id)
-        if table:
-            table.remove_player(eliminated_id)
-        
-        eliminated.table_id = None
-        eliminated.seat = 0
-        
-        # Check if payout earned
-        payout = tournament.payouts.get(remaining, 0)
-        if payout > 0:
-            print(f"🏆 TOURNAMENT: {eliminated.first_name} finished #{remaining}, wins ${payout}")
+            eliminated.table_id = None
+            eliminated.seat = 0
+            
+            # Check if payout earned
+            payout = tournament.payouts.get(position, 0)
+            if payout > 0:
+                _log(f"🏆 TOURNAMENT: {eliminated.first_name} finished #{position}, wins ${payout}")
+            
+            eliminator_names = ", ".join(tournament.players[e].first_name for e in eliminator_ids) or "nobody"
+            _log(f"🏆 TOURNAMENT: {eliminated.first_name} eliminated by {eliminator_names}, position #{position}")
+            position -= 1
         
         # Check for tournament end
         remaining_now = tournament.get_players_remaining()
         if remaining_now == 1:
             await self.finish_tournament(tournament_id)
         elif remaining_now <= tournament.players_per_table:
-            # Final table
-            tournament.status = TournamentStatus.FINAL_TABLE
-            await self._balance_tables(tournament)
-        else:
+            # Final table (late registration may still bring players back)
+            if tournament.status != TournamentStatus.LATE_REG:
+                tournament.status = TournamentStatus.FINAL_TABLE
+            if tournament_id not in self.deferred_balancing:
+                await self._balance_tables(tournament)
+        elif tournament_id not in self.deferred_balancing:
             # Balance tables if needed
             await self._balance_tables(tournament)
         
-        print(f"🏆 TOURNAMENT: {eliminated.first_name} eliminated by {eliminator.first_name}, position #{remaining}")
-        
-        return True, "Player eliminated", bounty_result
+        tournament.touch()
+        return True, f"{len(busts)} players eliminated", bounty_results
     
     async def _balance_tables(self, tournament: Tournament):
-        """Balance players across tables"""
-        active_tables = [t for t in tournament.tables.values() if t.is_active]
-        
-        if len(active_tables) <= 1:
-            return
-        
-        # Calculate target players per table
-        total_players = tournament.get_players_remaining()
-        target_per_table = total_players // len(active_tables)
-        
-        # Close tables with too few players
-        for table in active_tables:
-            if table.get_player_count() < 3 and len(active_tables) > 1:
-                # Move all players to other tables
-                for seat, player_id in list(table.seats.items()):
-                    if player_id:
-                        await self._move_player_to_table(tournament, player_id)
-                table.is_active = False
-                active_tables.remove(table)
-        
-        # Balance remaining tables
-        for table in active_tables:
-            while table.get_player_count() > target_per_table + 1:
-                # Find player to move
-                for seat, player_id in table.seats.items():
-                    if player_id:
-                        await self._move_player_to_table(tournament, player_id)
-                        break
-    
-    async def _move_player_to_table(self, tournament: Tournament, telegram_id: int):
-        """Move a player to a table with fewest players"""
-        player = tournament.players.get(telegram_id)
-        if not player:
-            return
-        
-        # Remove from current table
-        old_table = tournament.tables.get(player.table_id)
-        if old_table:
-            old_table.remove_player(telegram_id)
-        
-        # Find table with fewest players
-        active_tables = [t for t in tournament.tables.values() if t.is_active and t.table_id != player.table_id]
-        if not active_tables:
-            return
-        
-        target_table = min(active_tables, key=lambda t: t.get_player_count())
-        seat = target_table.add_player(telegram_id)
-        
-        if seat:
-            player.table_id = target_table.table_id
-            player.seat = seat
-            print(f"🏆 TOURNAMENT: Moved {player.first_name} to table {target_table.table_id}")
+        """
+        Break and balance tables in one planned pass (see plan_table_balance).
+        Seats move immediately; a player still in a hand at the old table finishes it there
+        and joins the new table's next deal (see TableOrchestrator).
+        """
+        from game_engine import get_game
+        from bots import BETTING_PHASES
+        
+        button_seats = {}
+        for table in tournament.tables.values():
+            game = get_game(table.game_session_id) if table.game_session_id else None
+            if game:
+                button_seats[table.table_id] = game.dealer_seat
+        
+        broken, moves = plan_table_balance(list(tournament.tables.values()), button_seats)
+        
+        for telegram_id, from_table_id, to_table_id in moves:
+            self._move_player(tournament, telegram_id, tournament.tables[from_table_id], tournament.tables[to_table_id])
+        
+        for table_id in broken:
+            table = tournament.tables[table_id]
+            table.is_active = False
+            game = get_game(table.game_session_id) if table.game_session_id else None
+            # A hand still running there reports its result first; the orchestrator retires it after
+            if not game or game.phase not in BETTING_PHASES:
+                self.unregister_session(table.game_session_id)
+            _log(f"🏆 TOURNAMENT: Broke table {table_id}")
+        
+        if moves:
+            await self._notify("players_moved", tournament.tournament_id, [
+                {
+                    "telegramId": telegram_id,
+                    "fromTableId": from_table_id,
+                    "toTableId": to_table_id,
+                    "gameSessionId": tournament.tables[to_table_id].game_session_id,
+                }
+                for telegram_id, from_table_id, to_table_id in moves
+            ])
+    
+    def _move_player(self, tournament: Tournament, telegram_id: int, from_table: TournamentTable, to_table: TournamentTable):
+        """Reseat a player (the planner guarantees to_table has a free seat)"""
+        player = tournament.players[telegram_id]
+        from_table.remove_player(telegram_id)
+        player.seat = to_table.add_player(telegram_id)
+        player.table_id = to_table.table_id
+        tournament.note_table_size(from_table)
+        tournament.note_table_size(to_table)
+        _log(f"🏆 TOURNAMENT: Moved {player.first_name} to table {to_table.table_id}")
     
     async def finish_tournament(self, tournament_id: str) -> Tuple[bool, str]:
         """Finish a tournament"""
@@ -775,7 +1382,10 @@ class TournamentManager:
             return False, "Tournament not found"
         
         tournament.status = TournamentStatus.FINISHED
-        tournament.finished_at = time.time()
+        tournament.finished_at = self.clock.time()
+        tournament.touch()
+        self.player_tournaments.move(tournament.players, tournament_id, PlayerTournamentIndex.FINISHED, tournament.finished_at)
+        self.player_tournaments.expire(tournament.finished_at)
         
         # Find winner
         winner = None
@@ -792,7 +1402,10 @@ class TournamentManager:
             task.cancel()
             del self._blind_tasks[tournament_id]
         
-        print(f"🏆 TOURNAMENT: {tournament.name} finished! Winner: {winner.first_name if winner else 'N/A'}")
+        for table in tournament.tables.values():
+            self.unregister_session(table.game_session_id)
+        
+        _log(f"🏆 TOURNAMENT: {tournament.name} finished! Winner: {winner.first_name if winner else 'N/A'}")
         
         await self._notify("tournament_finished", tournament_id, {
             "winner": winner.to_dict() if winner else None,
@@ -808,33 +1421,47 @@ class TournamentManager:
     def get_tournament(self, tournament_id: str) -> Optional[Tournament]:
         return self.tournaments.get(tournament_id)
     
+    def register_session(self, session_id: str, tournament_id: str, table_id: str):
+        """Index a table's game session so hand results map back to it in O(1)"""
+        self.session_index[session_id] = (tournament_id, table_id)
+    
+    def unregister_session(self, session_id: Optional[str]):
+        if session_id:
+            self.session_index.pop(session_id, None)
+    
+    def get_tournament_for_session(self, session_id: str) -> Optional[Tuple[str, str]]:
+        """(tournament_id, table_id) for a game session, None for non-tournament games"""
+        return self.session_index.get(session_id)
+    
     def get_active_tournaments(self, mode: Optional[TournamentMode] = None) -> List[Tournament]:
         """Get all active tournaments, optionally filtered by mode"""
+        # self.tournaments is in creation order, so reversing it is newest-first without a sort
         tournaments = [
-            t for t in self.tournaments.values()
+            t for t in reversed(self.tournaments.values())
             if t.status not in [TournamentStatus.FINISHED, TournamentStatus.CANCELLED]
         ]
         
         if mode:
             tournaments = [t for t in tournaments if t.mode == mode]
         
-        return sorted(tournaments, key=lambda t: t.created_at, reverse=True)
+        return tournaments
     
     def get_registering_tournaments(self, mode: Optional[TournamentMode] = None) -> List[Tournament]:
         """Get tournaments open for registration"""
         tournaments = [
-            t for t in self.tournaments.values()
+            t for t in reversed(self.tournaments.values())
             if t.status in [TournamentStatus.REGISTERING, TournamentStatus.LATE_REG]
         ]
         
         if mode:
             tournaments = [t for t in tournaments if t.mode == mode]
         
-        return sorted(tournaments, key=lambda t: t.created_at, reverse=True)
+        return tournaments
     
-    def get_player_tournaments(self, telegram_id: int) -> List[Tournament]:
-        """Get all tournaments a player is registered in"""
-        tournament_ids = self.player_tournaments.get(telegram_id, [])
+    def get_player_tournaments(self, telegram_id: int, view: Optional[str] = None) -> List[Tournament]:
+        """A player's registered, running and recently finished tournaments (or one of those views)"""
+        self.player_tournaments.expire(self.clock.time())
+        tournament_ids = self.player_tournaments.get(telegram_id, view)
         return [self.tournaments[tid] for tid in tournament_ids if tid in self.tournaments]
     
     def get_leaderboard(self, tournament_id: str, limit: int = 10) -> List[Dict]:
@@ -843,15 +1470,12 @@ class TournamentManager:
         if not tournament:
             return []
         
-        active_players = [p for p in tournament.players.values() if not p.is_eliminated()]
-        sorted_players = sorted(active_players, key=lambda p: p.chips, reverse=True)
-        
         return [
             {
                 "position": i + 1,
                 "player": p.to_dict(),
             }
-            for i, p in enumerate(sorted_players[:limit])
+            for i, p in enumerate(tournament.get_top_players(limit))
         ]
     
     # ═══════════════════════════════════════════════════════════════════════════
@@ -888,11 +1512,16 @@ tournament_manager = TournamentManager()
 # GAME ENGINE INTEGRATION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-async def create_game_session_for_table(tournament_id: str, table_id: str) -> Optional[str]:
+async def create_game_session_for_table(
+    tournament_id: str,
+    table_id: str,
+    manager: Optional[TournamentManager] = None
+) -> Optional[str]:
     """Create a game_engine session for a tournament table"""
     from game_engine import create_game, GameState, Player
     
-    tournament = tournament_manager.get_tournament(tournament_id)
+    manager = manager or tournament_manager
+    tournament = manager.get_tournament(tournament_id)
     if not tournament:
         return None
     
@@ -916,6 +1545,7 @@ async def create_game_session_for_table(tournament_id: str, table_id: str) -> Op
                 name=tp.first_name,
                 seat=seat,
                 chips=tp.chips,
+                is_bot=tp.is_bot,
             )
     
     # Create game state
@@ -934,34 +1564,51 @@ async def create_game_session_for_table(tournament_id: str, table_id: str) -> Op
     from game_engine import active_games
     active_games[session_id] = game
     table.game_session_id = session_id
+    manager.register_session(session_id, tournament_id, table_id)
     
-    print(f"🏆 TOURNAMENT: Created game session {session_id} for table {table_id}")
+    _log(f"🏆 TOURNAMENT: Created game session {session_id} for table {table_id}")
     return session_id
 
 
-async def sync_tournament_blinds(tournament_id: str):
-    """Update blinds in all active game sessions for a tournament"""
+async def sync_tournament_blinds(
+    tournament_id: str,
+    manager: Optional[TournamentManager] = None,
+    table_id: Optional[str] = None
+):
+    """Update blinds in the tournament's game sessions (only table_id's when given)"""
     from game_engine import active_games
     
-    tournament = tournament_manager.get_tournament(tournament_id)
+    manager = manager or tournament_manager
+    tournament = manager.get_tournament(tournament_id)
     if not tournament:
         return
     
     blinds = tournament.get_current_blinds()
+    tables = [tournament.tables[table_id]] if table_id in tournament.tables else []
+    if table_id is None:
+        tables = list(tournament.tables.values())
     
-    for table in tournament.tables.values():
+    for table in tables:
         if table.game_session_id and table.game_session_id in active_games:
             game = active_games[table.game_session_id]
+            if (game.small_blind, game.big_blind) == (blinds["sb"], blinds["bb"]):
+                continue
             game.small_blind = blinds["sb"]
             game.big_blind = blinds["bb"]
-            print(f"🏆 TOURNAMENT: Updated blinds for {table.table_id}: {blinds['sb']}/{blinds['bb']}")
+            _log(f"🏆 TOURNAMENT: Updated blinds for {table.table_id}: {blinds['sb']}/{blinds['bb']}")
 
 
-async def handle_hand_result(tournament_id: str, table_id: str, session_id: str):
+async def handle_hand_result(
+    tournament_id: str,
+    table_id: str,
+    session_id: str,
+    manager: Optional[TournamentManager] = None
+):
     """Called after each hand to sync chips and check for eliminations"""
     from game_engine import get_game
     
-    tournament = tournament_manager.get_tournament(tournament_id)
+    manager = manager or tournament_manager
+    tournament = manager.get_tournament(tournament_id)
     if not tournament:
         return
     
@@ -973,84 +1620,836 @@ async def handle_hand_result(tournament_id: str, table_id: str, session_id: str)
     if not table:
         return
     
-    eliminations = []
+    busts = []
     winner_seat = game.winner_seat
+    # game_engine awards each pot to a single winner, so that player eliminates everyone who busted
+    eliminator_ids = [game.players[winner_seat].telegram_id] if winner_seat in game.players else []
     
     # Update tournament player chips from game state
     for seat, player in game.players.items():
         if player.telegram_id in tournament.players:
             tp = tournament.players[player.telegram_id]
-            tp.chips = player.chips
+            starting_stack = tp.chips  # Tournament stacks are last synced at the previous hand's end
+            tournament.set_chips(player.telegram_id, player.chips)
             
             # Check for elimination (0 chips)
             if player.chips <= 0 and not tp.is_eliminated():
-                # Find eliminator (the winner of this hand)
-                eliminator_id = None
-                if winner_seat and winner_seat in game.players:
-                    eliminator_id = game.players[winner_seat].telegram_id
-                
-                eliminations.append((player.telegram_id, eliminator_id))
+                busts.append((player.telegram_id, starting_stack, eliminator_ids))
     
-    # Process eliminations
-    for eliminated_id, eliminator_id in eliminations:
-        if eliminator_id:
-            await tournament_manager.eliminate_player(tournament_id, eliminated_id, eliminator_id)
+    # Process all of this hand's eliminations in one batch
+    if busts and eliminator_ids:
+        await manager.eliminate_players(tournament_id, busts)
 
 
-async def get_tournament_for_session(session_id: str) -> Optional[Tuple[str, str]]:
+async def get_tournament_for_session(
+    session_id: str,
+    manager: Optional[TournamentManager] = None
+) -> Optional[Tuple[str, str]]:
     """Get tournament_id and table_id for a game session"""
-    if not session_id.startswith("tourney_"):
+    manager = manager or tournament_manager
+    return manager.get_tournament_for_session(session_id)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TABLE ORCHESTRATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+HAND_PAUSE_SECONDS = 3.0  # Results stay on screen this long before a table deals again
+
+
+def sync_table_roster(
+    tournament: Tournament,
+    table: TournamentTable,
+    sitting_out: Collection[int] = ()
+):
+    """
+    Rebuild a table's game session from its tournament seats before the next hand and move the button.
+    Between hands the tournament stacks are authoritative (handle_hand_result synced them), and players
+    may have been moved in or out. Players in sitting_out (still finishing a hand at the table they were
+    moved from) skip this deal. game_engine posts blinds in dict order, so seats are inserted small blind
+    first (the button itself heads-up).
+    """
+    from game_engine import get_game, Player
+    
+    game = get_game(table.game_session_id) if table.game_session_id else None
+    if not game:
         return None
     
-    # Extract table_id from session_id
-    table_id = session_id.replace("tourney_", "")
+    seated = sorted(
+        (seat, telegram_id) for seat, telegram_id in table.seats.items()
+        if telegram_id is not None and telegram_id not in sitting_out
+    )
+    if seated:
+        button = next((i for i, (seat, _) in enumerate(seated) if seat > game.dealer_seat), 0)
+        game.dealer_seat = seated[button][0]
+        first = button if len(seated) == 2 else (button + 1) % len(seated)
+        seated = seated[first:] + seated[:first]
+    
+    players = {}
+    for seat, telegram_id in seated:
+        tp = tournament.players[telegram_id]
+        players[seat] = Player(telegram_id=telegram_id, name=tp.first_name, seat=seat, chips=tp.chips, is_bot=tp.is_bot)
+    game.players = players
+    return game
+
+
+class TournamentBarrier:
+    """
+    Holds a tournament's tables between hands so they deal together: hand-for-hand play on the
+    bubbles, synchronized breaks, and merge points where tables are broken only while no hand runs.
+    
+    Tables signal arrival from the orchestrator's deal path in O(1). A single coordination task
+    per tournament waits on one event (no polling), runs the break or the merge once everyone
+    is in, then releases every waiting table at once.
+    """
+    
+    def __init__(
+        self,
+        manager: TournamentManager,
+        tournament_id: str,
+        on_release: Callable[[Set[str]], None]
+    ):
+        self.manager = manager
+        self.tournament_id = tournament_id
+        self.on_release = on_release       # Called with the released session_ids (they deal next)
+        self.live: Set[str] = set()        # Sessions expected at the barrier (not waiting for players)
+        self.arrived: Set[str] = set()
+        self.hand_for_hand = False
+        self.merge_pending = False         # Balancing was deferred; rebalance at the next barrier
+        self.break_until: Optional[float] = None
+        self._released: Set[str] = set()
+        self._all_arrived: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def holding(self) -> bool:
+        return self.hand_for_hand or self.merge_pending or self.break_until is not None
+    
+    def admit(self, session_id: str) -> bool:
+        """A table wants to deal: True if it may, otherwise it waits at the barrier"""
+        if session_id in self._released:
+            self._released.discard(session_id)
+            return True
+        if not self.holding:
+            return True
+        self.arrived.add(session_id)
+        self._check()
+        return False
+    
+    def add(self, session_id: str):
+        self.live.add(session_id)
     
-    # Find tournament
-    for tournament in tournament_manager.tournaments.values():
-        if table_id in tournament.tables:
-            return tournament.tournament_id, table_id
+    def discard(self, session_id: str):
+        """Session retired or waiting for players: stop expecting it"""
+        self.live.discard(session_id)
+        self.arrived.discard(session_id)
+        self._released.discard(session_id)
+        self._check()
     
-    return None
+    def set_hand_for_hand(self, enabled: bool):
+        if enabled == self.hand_for_hand:
+            return
+        self.hand_for_hand = enabled
+        if enabled:
+            self.manager.deferred_balancing.add(self.tournament_id)
+            _log(f"🏆 TOURNAMENT: {self.tournament_id} playing hand-for-hand")
+        else:
+            self.merge_pending = True  # Busts that ended it were not balanced yet
+        self._ensure_task()
+    
+    def start_break(self, until: float):
+        self.break_until = until
+        self._ensure_task()
+    
+    def close(self):
+        self.manager.deferred_balancing.discard(self.tournament_id)
+        if self._task:
+            self._task.cancel()
+            self._task = None
+    
+    def _check(self):
+        if self._all_arrived and self.arrived and len(self.arrived) >= len(self.live):
+            self._all_arrived.set()
+    
+    def _ensure_task(self):
+        if self._task is None or self._task.done():
+            self._all_arrived = asyncio.Event()
+            self._task = asyncio.create_task(self._coordinate())
+            self._check()
+    
+    async def _coordinate(self):
+        clock = self.manager.clock
+        while self.holding:
+            await self._all_arrived.wait()
+            self._all_arrived.clear()
+            
+            if self.break_until is not None:
+                await clock.sleep(self.break_until - clock.time())
+                self.break_until = None
+            
+            # Merge point: every table is between hands, so tables break without sit-outs
+            tournament = self.manager.get_tournament(self.tournament_id)
+            if tournament and (self.merge_pending or self.hand_for_hand):
+                await self.manager._balance_tables(tournament)
+            if not self.hand_for_hand:
+                self.merge_pending = False
+                self.manager.deferred_balancing.discard(self.tournament_id)
+            
+            released, self.arrived = self.arrived, set()
+            self._released |= released
+            self.on_release(released)
+        self._task = None
+
+
+class TableOrchestrator:
+    """
+    Runs every table of started tournaments as a live game_engine session: deals hands, plays bot
+    seats, folds humans whose turn timer expired, settles results and deals again after a pause.
+    
+    All tables share one driver task and one heap of (due_at, seq, session_id, kind) timers, so a
+    table costs a heap entry while it waits and O(seats) per hand, however many tables are running.
+    Human actions arrive through after_action(); blinds and seat moves take effect at the next deal.
+    Each tournament's TournamentBarrier can hold its tables there (hand-for-hand, breaks, merges).
+    """
+    
+    def __init__(
+        self,
+        manager: TournamentManager,
+        hand_pause_seconds: float = HAND_PAUSE_SECONDS,
+        rng: Optional[random.Random] = None
+    ):
+        self.manager = manager
+        self.hand_pause_seconds = hand_pause_seconds
+        self.rng = rng or random.Random()
+        self.on_update: Optional[Callable[[str, Any], Awaitable]] = None  # (session_id, game) after orchestrator moves
+        self._sessions: Dict[str, str] = {}                  # Sessions being driven -> tournament_id
+        self._barriers: Dict[str, TournamentBarrier] = {}    # tournament_id -> barrier
+        self._in_hand: Dict[str, Set[int]] = {}              # session_id -> telegram_ids dealt into its hand
+        self._playing_at: Dict[int, str] = {}                # telegram_id -> session_id of their live hand
+        self._idle: Dict[str, Set[str]] = {}                 # tournament_id -> sessions short of players
+        self._due: List[Tuple[float, int, str, str]] = []    # (due_at, seq, session_id, "deal" | "timeout")
+        self._seq = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        manager.on_event("tournament_started", self._on_tournament_started)
+        manager.on_event("break_started", self._on_break_started)
+        manager.on_event("player_seated", self._on_player_seated)
+    
+    @property
+    def clock(self) -> Clock:
+        return self.manager.clock
+    
+    def is_running(self, session_id: str) -> bool:
+        return session_id in self._sessions
+    
+    async def start_tables(self, tournament_id: str):
+        """Create a session for every active table and deal the first hands"""
+        tournament = self.manager.get_tournament(tournament_id)
+        if not tournament:
+            return
+        if tournament_id not in self._barriers:
+            self._barriers[tournament_id] = TournamentBarrier(self.manager, tournament_id, self._deal_now)
+        for table in tournament.tables.values():
+            if table.is_active:
+                await self._start_table(tournament_id, table)
+        _log(f"🏆 TOURNAMENT: Dealing {len(tournament.tables)} tables for {tournament.name}")
+    
+    async def _start_table(self, tournament_id: str, table: TournamentTable):
+        session_id = table.game_session_id or await create_game_session_for_table(
+            tournament_id, table.table_id, manager=self.manager
+        )
+        if session_id:
+            self._sessions[session_id] = tournament_id
+            self._barriers[tournament_id].add(session_id)
+            self._schedule(self.clock.time(), session_id, "deal")
+    
+    async def after_action(self, session_id: str):
+        """A human acted at an orchestrated table: let bots respond, then time or settle the hand"""
+        if session_id in self._in_hand:
+            await self._advance(session_id)
+    
+    async def stop(self):
+        for barrier in self._barriers.values():
+            barrier.close()
+        if self._task:
+            self._task.cancel()
+            self._task = None
+    
+    async def _on_tournament_started(self, tournament_id: str, data: Any):
+        await self.start_tables(tournament_id)
+    
+    async def _on_break_started(self, tournament_id: str, data: Any):
+        tournament = self.manager.get_tournament(tournament_id)
+        barrier = self._barriers.get(tournament_id)
+        if tournament and barrier and tournament.break_until:
+            barrier.start_break(tournament.break_until)
+    
+    async def _on_player_seated(self, tournament_id: str, data: Any):
+        """Late entrant: open their table's session, or wake it if it was short of players"""
+        tournament = self.manager.get_tournament(tournament_id)
+        if not tournament or tournament_id not in self._barriers:
+            return
+        table = tournament.tables[data["tableId"]]
+        if not table.game_session_id:
+            await self._start_table(tournament_id, table)
+            data["gameSessionId"] = table.game_session_id
+        elif table.game_session_id in self._idle.get(tournament_id, ()):
+            self._idle[tournament_id].discard(table.game_session_id)
+            self._barriers[tournament_id].add(table.game_session_id)
+            self._schedule(self.clock.time(), table.game_session_id, "deal")
+    
+    def _deal_now(self, session_ids: Set[str]):
+        """Barrier released: the waiting tables deal together"""
+        for session_id in session_ids:
+            self._schedule(self.clock.time(), session_id, "deal")
+    
+    # ═══════════════════════════════════════════════════════════════════════════
+    # HAND LIFECYCLE
+    # ═══════════════════════════════════════════════════════════════════════════
+    
+    async def _deal(self, session_id: str):
+        from game_engine import start_new_hand
+        
+        if session_id in self._in_hand:
+            return
+        located = self.manager.get_tournament_for_session(session_id)
+        if not located:
+            self._retire(session_id)  # Table was broken while it waited
+            return
+        tournament_id, table_id = located
+        tournament = self.manager.get_tournament(tournament_id)
+        table = tournament.tables.get(table_id) if tournament else None
+        if not table or not table.is_active or tournament.status in [TournamentStatus.FINISHED, TournamentStatus.CANCELLED]:
+            self._retire(session_id)
+            return
+        barrier = self._barriers[tournament_id]
+        if not barrier.admit(session_id):
+            return  # Held for hand-for-hand / a break / a merge; released via _deal_now
+        
+        game = sync_table_roster(tournament, table, sitting_out=self._playing_at)
+        if not game:
+            self._retire(session_id)
+            return
+        if sum(1 for p in game.players.values() if p.chips > 0) < 2:
+            # Wait for a hand elsewhere to finish (moved players, rebalancing)
+            self._idle.setdefault(tournament_id, set()).add(session_id)
+            barrier.discard(session_id)
+            return
+        
+        await sync_tournament_blinds(tournament_id, manager=self.manager, table_id=table_id)
+        start_new_hand(session_id)
+        dealt = {p.telegram_id for p in game.players.values() if p.is_active}
+        self._in_hand[session_id] = dealt
+        for telegram_id in dealt:
+            self._playing_at[telegram_id] = session_id
+        await self._advance(session_id)
+    
+    async def _advance(self, session_id: str):
+        from game_engine import get_game
+        from bots import BETTING_PHASES, play_bot_turns
+        
+        game = get_game(session_id)
+        if not game:
+            self._retire(session_id)
+            return
+        play_bot_turns(game, self.rng)
+        await self._publish(session_id, game)
+        if game.phase in BETTING_PHASES:
+            self._schedule(game.turn_start_time + game.turn_timeout_seconds, session_id, "timeout")
+        else:
+            await self._finish_hand(session_id)
+    
+    async def _check_timeout(self, session_id: str):
+        from game_engine import get_game, process_action
+        from bots import BETTING_PHASES
+        
+        game = get_game(session_id)
+        if not game or session_id not in self._in_hand or game.phase not in BETTING_PHASES:
+            return
+        player = game.players.get(game.current_player_seat)
+        if not player or player.is_bot or game.turn_start_time is None:
+            return
+        if self.clock.time() < game.turn_start_time + game.turn_timeout_seconds:
+            return  # Someone acted since; the new turn scheduled its own check
+        action = "check" if player.current_bet >= game.current_bet else "fold"
+        _log(f"🏆 TOURNAMENT: {player.name} timed out at {session_id}, auto-{action}")
+        process_action(session_id, player.seat, action)
+        await self._advance(session_id)
+    
+    async def _finish_hand(self, session_id: str):
+        for telegram_id in self._in_hand.pop(session_id, ()):
+            if self._playing_at.get(telegram_id) == session_id:
+                del self._playing_at[telegram_id]
+        
+        located = self.manager.get_tournament_for_session(session_id)
+        if not located:
+            self._retire(session_id)
+            return
+        tournament_id, table_id = located
+        await handle_hand_result(tournament_id, table_id, session_id, manager=self.manager)
+        
+        tournament = self.manager.get_tournament(tournament_id)
+        if tournament.status in [TournamentStatus.FINISHED, TournamentStatus.CANCELLED]:
+            for table in tournament.tables.values():
+                self._retire(table.game_session_id)
+            self._idle.pop(tournament_id, None)
+            self._barriers.pop(tournament_id).close()
+            return
+        
+        barrier = self._barriers[tournament_id]
+        if tournament.tables[table_id].is_active:
+            self._schedule(self.clock.time() + self.hand_pause_seconds, session_id, "deal")
+        else:
+            self._retire(session_id)
+        
+        # Players from this hand (and anyone rebalanced by it) may complete a waiting table
+        for idle_session in self._idle.pop(tournament_id, ()):
+            barrier.add(idle_session)
+            self._schedule(self.clock.time() + self.hand_pause_seconds, idle_session, "deal")
+        barrier.set_hand_for_hand(tournament.is_hand_for_hand())
+    
+    def _retire(self, session_id: Optional[str]):
+        from game_engine import end_game
+        
+        tournament_id = self._sessions.pop(session_id, None) if session_id else None
+        if not tournament_id:
+            return
+        for telegram_id in self._in_hand.pop(session_id, ()):
+            if self._playing_at.get(telegram_id) == session_id:
+                del self._playing_at[telegram_id]
+        self._idle.get(tournament_id, set()).discard(session_id)
+        barrier = self._barriers.get(tournament_id)
+        if barrier:
+            barrier.discard(session_id)
+        self.manager.unregister_session(session_id)
+        end_game(session_id)
+    
+    async def _publish(self, session_id: str, game):
+        if self.on_update:
+            try:
+                await self.on_update(session_id, game)
+            except Exception as e:
+                print(f"❌ Orchestrator update error: {e}")
+    
+    # ═══════════════════════════════════════════════════════════════════════════
+    # TIMERS
+    # ═══════════════════════════════════════════════════════════════════════════
+    
+    def _schedule(self, due_at: float, session_id: str, kind: str):
+        heapq.heappush(self._due, (due_at, self._seq, session_id, kind))
+        self._seq += 1
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._drive())
+        elif self._due[0][1] == self._seq - 1:
+            self._wakeup.set()  # New earliest deadline: re-arm the driver's sleep
+    
+    async def _drive(self):
+        while True:
+            if not self._due:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            
+            due_at, _, session_id, kind = self._due[0]
+            delay = due_at - self.clock.time()
+            if delay > 0:
+                self._wakeup.clear()
+                sleeper = asyncio.ensure_future(self.clock.sleep(delay))
+                woken = asyncio.ensure_future(self._wakeup.wait())
+                try:
+                    await asyncio.wait([sleeper, woken], return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    sleeper.cancel()
+                    woken.cancel()
+                continue
+            
+            heapq.heappop(self._due)
+            if session_id not in self._sessions:
+                continue
+            try:
+                if kind == "deal":
+                    await self._deal(session_id)
+                else:
+                    await self._check_timeout(session_id)
+            except Exception as e:
+                print(f"❌ Orchestrator {kind} error at {session_id}: {e}")
+
+
+tournament_orchestrator = TableOrchestrator(tournament_manager)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# HELPER FUNCTIONS FOR INTEGRATION
+# TOURNAMENT SCHEDULE
 # ═══════════════════════════════════════════════════════════════════════════════
 
-async def create_default_tournaments():
-    """Create some default tournaments for testing"""
-    # Sit & Go tables
-    for buy_in in [5, 10, 25]:
-        tournament_manager.create_sit_and_go(
-            buy_in=buy_in,
-            players_per_table=6,
-            sng_format=SnGFormat.TOP_2_PAID,
-            blind_structure="turbo",
-        )
-        tournament_manager.create_sit_and_go(
-            buy_in=buy_in,
-            players_per_table=9,
-            sng_format=SnGFormat.TOP_3_PAID,
-            blind_structure="turbo",
+@dataclass
+class SitAndGoTemplate:
+    """A Sit & Go kept open for registration around the clock"""
+    buy_in: float
+    players_per_table: int = 9
+    sng_format: SnGFormat = SnGFormat.TOP_3_PAID
+    blind_structure: str = "turbo"
+    starting_chips: int = 1500
+    open_tables: int = 1   # Registering at any moment
+    spares: int = 1        # Built ahead of demand, waiting to replace one that fills
+
+
+@dataclass
+class ScheduledTournamentTemplate:
+    """A tournament launched every `every_seconds`, at `start_offset_seconds` past each interval (UTC epoch)"""
+    name: str
+    mode: TournamentMode
+    buy_in: float
+    every_seconds: int = 86400
+    start_offset_seconds: int = 0
+    announce_seconds: Optional[int] = None  # Registration opens this long before the start (None: when the previous one starts)
+    options: Dict[str, Any] = field(default_factory=dict)  # Extra create_tournament arguments
+    
+    def next_start_after(self, moment: float) -> float:
+        intervals = int((moment - self.start_offset_seconds) // self.every_seconds) + 1
+        return self.start_offset_seconds + intervals * self.every_seconds
+
+
+class TournamentScheduler:
+    """
+    Keeps the lobby stocked: every Sit & Go template always has `open_tables` registering, and every
+    scheduled template is announced and launched on its timetable.
+    
+    A filled Sit & Go is replaced from a pool of pre-built Tournament objects inside its
+    "tournament_started" notification, so the next table is listed before the last registration
+    returns; the pool is topped up afterwards. Scheduled tournaments share one driver task and a heap
+    of (due_at, seq, "announce" | "start", template index, start time | tournament_id) timers.
+    """
+    
+    def __init__(
+        self,
+        manager: TournamentManager,
+        sit_and_gos: List[SitAndGoTemplate],
+        scheduled: List[ScheduledTournamentTemplate]
+    ):
+        self.manager = manager
+        self.sit_and_gos = sit_and_gos
+        self.scheduled = scheduled
+        self._spares: Dict[int, List[Tournament]] = {}   # SnG template index -> pre-built tournaments
+        self._template_of: Dict[str, int] = {}           # Open SnG tournament_id -> template index
+        self._due: List[Tuple[float, int, str, int, Any]] = []
+        self._seq = 0
+        self._task: Optional[asyncio.Task] = None
+        manager.on_event("tournament_started", self._on_tournament_started)
+    
+    @property
+    def clock(self) -> Clock:
+        return self.manager.clock
+    
+    async def start(self):
+        """Open every Sit & Go and announce the next run of every scheduled tournament"""
+        if self._task:
+            return
+        
+        for index, template in enumerate(self.sit_and_gos):
+            for _ in range(template.open_tables):
+                self._open_sit_and_go(index)
+            self._refill(index)
+        
+        moment = self.clock.time()
+        for index in range(len(self.scheduled)):
+            self._plan_next(index, moment)
+        
+        self._task = asyncio.create_task(self._drive())
+    
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        self._due.clear()
+    
+    def get_upcoming(self) -> List[Dict[str, Any]]:
+        """Scheduled tournaments not yet announced, soonest first"""
+        return [
+            {"name": self.scheduled[index].name, "startsAt": int(start_at * 1000)}
+            for _, _, kind, index, start_at in sorted(self._due) if kind == "announce"
+        ]
+    
+    # ───────────────────────────────────────────────────────────────────────────
+    # SIT & GO POOL
+    # ───────────────────────────────────────────────────────────────────────────
+    
+    def _build_sit_and_go(self, index: int) -> Tournament:
+        template = self.sit_and_gos[index]
+        return self.manager.create_sit_and_go(
+            buy_in=template.buy_in,
+            players_per_table=template.players_per_table,
+            sng_format=template.sng_format,
+            blind_structure=template.blind_structure,
+            starting_chips=template.starting_chips,
+            publish=False,
         )
     
-    # Tournament
-    tournament_manager.create_tournament(
+    def _refill(self, index: int):
+        spares = self._spares.setdefault(index, [])
+        while len(spares) < self.sit_and_gos[index].spares:
+            spares.append(self._build_sit_and_go(index))
+    
+    def _open_sit_and_go(self, index: int):
+        spares = self._spares.get(index)
+        tournament = spares.pop() if spares else self._build_sit_and_go(index)
+        self.manager.publish_tournament(tournament)
+        self._template_of[tournament.tournament_id] = index
+    
+    async def _on_tournament_started(self, tournament_id: str, data: Dict):
+        index = self._template_of.pop(tournament_id, None)
+        if index is None:
+            return
+        self._open_sit_and_go(index)
+        asyncio.get_running_loop().call_soon(self._refill, index)
+    
+    # ───────────────────────────────────────────────────────────────────────────
+    # SCHEDULED TOURNAMENTS
+    # ───────────────────────────────────────────────────────────────────────────
+    
+    def _push(self, due_at: float, kind: str, index: int, payload: Any):
+        heapq.heappush(self._due, (due_at, self._seq, kind, index, payload))
+        self._seq += 1
+    
+    def _plan_next(self, index: int, after: float):
+        template = self.scheduled[index]
+        start_at = template.next_start_after(after)
+        announce_at = after if template.announce_seconds is None else start_at - template.announce_seconds
+        self._push(max(announce_at, after), "announce", index, start_at)
+    
+    def _announce(self, index: int, start_at: float):
+        template = self.scheduled[index]
+        tournament = self.manager.create_tournament(
+            name=template.name,
+            mode=template.mode,
+            buy_in=template.buy_in,
+            **template.options
+        )
+        tournament.registration_ends_at = start_at
+        self._push(start_at, "start", index, tournament.tournament_id)
+    
+    async def _launch(self, index: int, tournament_id: str):
+        tournament = self.manager.get_tournament(tournament_id)
+        if tournament and tournament.status == TournamentStatus.REGISTERING:
+            success, message = await self.manager.start_tournament(tournament_id)
+            if not success:
+                await self.manager.cancel_tournament(tournament_id, message)
+        
+        start_at = tournament.registration_ends_at if tournament else self.clock.time()
+        self._plan_next(index, start_at)
+    
+    async def _drive(self):
+        while self._due:
+            due_at, _, kind, index, payload = self._due[0]
+            delay = due_at - self.clock.time()
+            if delay > 0:
+                await self.clock.sleep(delay)
+                continue
+            
+            heapq.heappop(self._due)
+            try:
+                if kind == "announce":
+                    self._announce(index, payload)
+                else:
+                    await self._launch(index, payload)
+            except Exception as e:
+                print(f"❌ Scheduler {kind} error for {self.scheduled[index].name}: {e}")
+
+
+DEFAULT_SIT_AND_GOS = [
+    template
+    for buy_in in [5, 10, 25]
+    for template in (
+        SitAndGoTemplate(buy_in=buy_in, players_per_table=6, sng_format=SnGFormat.TOP_2_PAID),
+        SitAndGoTemplate(buy_in=buy_in, players_per_table=9, sng_format=SnGFormat.TOP_3_PAID),
+    )
+]
+
+DEFAULT_SCHEDULE = [
+    ScheduledTournamentTemplate(
         name="Daily $10 Tournament",
         mode=TournamentMode.TOURNAMENT,
         buy_in=10,
-        starting_chips=10000,
-        min_players=18,
-        max_players=100,
-    )
-    
-    # Bounty Hunter
-    tournament_manager.create_bounty_tournament(
+        every_seconds=86400,
+        start_offset_seconds=19 * 3600,  # 19:00 UTC
+        options={
+            "starting_chips": 10000,
+            "min_players": 18,
+            "max_players": 100,
+            "break_every_levels": 4,  # 5 minute break every hour
+            "max_entries": 2,
+        },
+    ),
+    ScheduledTournamentTemplate(
         name="$20 Bounty Hunter",
+        mode=TournamentMode.BOUNTY_HUNTER,
         buy_in=20,
-        bounty_percent=50,
-        min_players=18,
-        max_players=50,
-    )
-    
-    print("🏆 Created default tournaments")
+        every_seconds=6 * 3600,
+        options={
+            "bounty_percent": 50,
+            "min_players": 18,
+            "max_players": 50,
+            "late_reg_levels": 4,
+        },
+    ),
+]
+
+tournament_scheduler = TournamentScheduler(tournament_manager, DEFAULT_SIT_AND_GOS, DEFAULT_SCHEDULE)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ARCHIVAL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+ARCHIVE_GRACE_SECONDS = 3600   # Finished tournaments and idle games stay in memory this long
+ARCHIVE_SWEEP_SECONDS = 60
+ARCHIVE_CACHE_SIZE = 256       # Reloaded records kept for repeat history queries
+
+
+class TournamentArchiver:
+    """
+    Moves finished tournaments and idle lobby games out of memory. After a grace period each one is
+    written to an ArchiveStore as its to_dict() record and evicted; history queries read records
+    back lazily, through a small LRU of recently loaded ones.
+    
+    Finished tournaments queue up from the "tournament_finished" / "tournament_cancelled" events in
+    finishing order, so a sweep only touches the ones that are due. Lobby games have no such event:
+    one is archived once nobody is connected and no hand has started or action landed for the grace
+    period (GameState.last_activity_at). Tournament tables are ended by the orchestrator and skipped here.
+    on_game_evicted(session_id) lets the server drop its sockets for an evicted game.
+    """
+    
+    def __init__(
+        self,
+        manager: TournamentManager,
+        store: Optional[ArchiveStore] = None,
+        grace_seconds: float = ARCHIVE_GRACE_SECONDS,
+        sweep_seconds: float = ARCHIVE_SWEEP_SECONDS
+    ):
+        self.manager = manager
+        self.store = store or ArchiveStore()
+        self.grace_seconds = grace_seconds
+        self.sweep_seconds = sweep_seconds
+        self._finished: Deque[Tuple[float, str]] = deque()   # (archive_at, tournament_id)
+        self._cache: Dict[Tuple[str, str], Dict[str, Any]] = {}  # (kind, key) -> record, LRU order
+        self._task: Optional[asyncio.Task] = None
+        self.on_game_evicted: Optional[Callable[[str], Any]] = None
+        manager.on_event("tournament_finished", self._on_tournament_over)
+        manager.on_event("tournament_cancelled", self._on_tournament_over)
+    
+    @property
+    def clock(self) -> Clock:
+        return self.manager.clock
+    
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+    
+    async def _on_tournament_over(self, tournament_id: str, data: Any):
+        self._finished.append((self.clock.time() + self.grace_seconds, tournament_id))
+    
+    async def _run(self):
+        while True:
+            await self.clock.sleep(self.sweep_seconds)
+            try:
+                await self.sweep()
+            except Exception as e:
+                print(f"❌ Archive sweep error: {e}")
+    
+    async def sweep(self) -> Tuple[int, int]:
+        """Archive and evict everything past its grace period. Returns (tournaments, games) archived."""
+        from game_engine import active_games, end_game
+        
+        moment = self.clock.time()
+        
+        tournaments = 0
+        while self._finished and self._finished[0][0] <= moment:
+            _, tournament_id = self._finished.popleft()
+            tournament = self.manager.get_tournament(tournament_id)
+            if not tournament:
+                continue
+            record = tournament.to_dict(include_players=True)
+            record["archivedAt"] = int(moment * 1000)
+            await asyncio.to_thread(self.store.save, "tournaments", tournament_id, record)
+            del self.manager.tournaments[tournament_id]
+            self.manager.deferred_balancing.discard(tournament_id)
+            tournaments += 1
+        
+        due = [
+            (session_id, game) for session_id, game in active_games.items()
+            if game.connected_count == 0
+            and moment - game.last_activity_at >= self.grace_seconds
+            and not self.manager.get_tournament_for_session(session_id)
+        ]
+        
+        games = 0
+        for session_id, game in due:
+            record = game.to_dict()
+            record["archivedAt"] = int(moment * 1000)
+            await asyncio.to_thread(self.store.save, "games", session_id, record)
+            if active_games.get(session_id) is not game or game.connected_count or game.last_activity_at > moment:
+                continue  # Someone came back while the record was being written
+            end_game(session_id)
+            games += 1
+            if self.on_game_evicted:
+                result = self.on_game_evicted(session_id)
+                if asyncio.iscoroutine(result):
+                    await result
+        
+        if tournaments or games:
+            _log(f"🗄️ ARCHIVE: {tournaments} tournaments, {games} games archived")
+        return tournaments, games
+    
+    async def _load(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        record = self._cache.pop((kind, key), None)
+        if record is None:
+            record = await asyncio.to_thread(self.store.load, kind, key)
+            if record is None:
+                return None
+        self._cache[(kind, key)] = record  # Most recently used last
+        if len(self._cache) > ARCHIVE_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        return record
+    
+    async def get_tournament_record(self, tournament_id: str, include_players: bool = True) -> Optional[Dict[str, Any]]:
+        """A tournament's to_dict() record, live or reloaded from the archive"""
+        tournament = self.manager.get_tournament(tournament_id)
+        if tournament:
+            return tournament.to_dict(include_players=include_players)
+        record = await self._load("tournaments", tournament_id)
+        if record and not include_players:
+            record = {k: v for k, v in record.items() if k not in ("players", "payouts")}
+        return record
+    
+    async def get_game_record(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """The archived record of an evicted game"""
+        return await self._load("games", session_id)
+    
+    async def get_player_history(self, telegram_id: int, view: Optional[str] = None) -> List[Dict[str, Any]]:
+        """A player's tournaments as summaries, archived ones included"""
+        self.manager.player_tournaments.expire(self.clock.time())
+        records = []
+        for tournament_id in self.manager.player_tournaments.get(telegram_id, view):
+            record = await self.get_tournament_record(tournament_id, include_players=False)
+            if record:
+                records.append(record)
+        return records
+
+
+tournament_archiver = TournamentArchiver(tournament_manager)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HELPER FUNCTIONS FOR INTEGRATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+async def create_default_tournaments():
+    """Open the default Sit & Gos and start the tournament schedule"""
+    await tournament_scheduler.start()
+    _log("🏆 Created default tournaments")
@@ -0,0 +1,372 @@
+"""
+Tournament Simulator
+Plays complete MTT / Bounty Hunter / Sit & Go tournaments through TournamentManager with bots.
+Blind levels run on a VirtualClock that advances one hand-length per round of hands, so nothing
+really sleeps. Reports duration, levels reached, eliminations per level and bounty flows.
+
+Usage:
+    python tournament_simulator.py --mode sitgo --players 9 --tournaments 2000 --workers 8
+    python tournament_simulator.py --mode bounty --players 180 --tournaments 50
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import game_engine
+import tournament_engine
+from clock import VirtualClock, set_clock
+from game_engine import start_new_hand, end_game
+from simulator import POLICIES, Policy, SimulationResult, play_hand
+from tournament_engine import (
+    BLIND_STRUCTURES, Tournament, TournamentManager, TournamentMode, TournamentStatus, SnGFormat,
+    create_game_session_for_table, sync_tournament_blinds, sync_table_roster, handle_hand_result
+)
+
+
+HAND_SECONDS = 45                 # Virtual time one hand takes at each table
+MAX_HANDS_PER_TOURNAMENT = 100000  # Safety stop for tournaments that never finish
+MAX_ANOMALIES_KEPT = 50
+
+
+@dataclass
+class TournamentRun:
+    """Outcome of one simulated tournament"""
+    entrants: int
+    hands: int = 0                    # Hands dealt across all tables
+    duration: float = 0.0             # Virtual seconds from start to finish
+    levels_reached: int = 0           # Blind level index at the end
+    eliminations_per_level: Counter = field(default_factory=Counter)
+    bounties_paid: float = 0.0        # Cash bounties paid out (PKO)
+    winner_bounty: float = 0.0        # Bounties the winner collected plus their own head
+    anomalies: List[str] = field(default_factory=list)
+
+
+@dataclass
+class TournamentReport:
+    """Aggregated results over many simulated tournaments"""
+    tournaments: int = 0
+    hands: int = 0
+    durations: List[float] = field(default_factory=list)
+    levels_reached: Counter = field(default_factory=Counter)
+    eliminations_per_level: Counter = field(default_factory=Counter)
+    bounties_paid: float = 0.0
+    winner_bounties: List[float] = field(default_factory=list)
+    anomalies: List[str] = field(default_factory=list)
+    anomaly_count: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def tournaments_per_minute(self) -> float:
+        return self.tournaments * 60 / self.elapsed if self.elapsed > 0 else 0.0
+
+    def record_anomaly(self, message: str):
+        self.anomaly_count += 1
+        if len(self.anomalies) < MAX_ANOMALIES_KEPT:
+            self.anomalies.append(message)
+
+    def add(self, run: TournamentRun):
+        self.tournaments += 1
+        self.hands += run.hands
+        self.durations.append(run.duration)
+        self.levels_reached[run.levels_reached] += 1
+        self.eliminations_per_level.update(run.eliminations_per_level)
+        self.bounties_paid += run.bounties_paid
+        self.winner_bounties.append(run.winner_bounty)
+        for anomaly in run.anomalies:
+            self.record_anomaly(anomaly)
+
+    def merge(self, other: "TournamentReport"):
+        self.tournaments += other.tournaments
+        self.hands += other.hands
+        self.durations.extend(other.durations)
+        self.levels_reached.update(other.levels_reached)
+        self.eliminations_per_level.update(other.eliminations_per_level)
+        self.bounties_paid += other.bounties_paid
+        self.winner_bounties.extend(other.winner_bounties)
+        for anomaly in other.anomalies:
+            self.record_anomaly(anomaly)
+        self.anomaly_count += other.anomaly_count - len(other.anomalies)
+
+    def duration_percentiles(self) -> Dict[str, float]:
+        """p10 / p50 / p90 / mean tournament duration in virtual seconds"""
+        if not self.durations:
+            return {}
+        if len(self.durations) == 1:
+            value = self.durations[0]
+            return {"p10": value, "p50": value, "p90": value, "mean": value}
+        deciles = statistics.quantiles(self.durations, n=10)
+        return {
+            "p10": deciles[0],
+            "p50": statistics.median(self.durations),
+            "p90": deciles[-1],
+            "mean": statistics.fmean(self.durations),
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SINGLE TOURNAMENT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _create_tournament(manager: TournamentManager, config: Dict[str, Any]) -> Tournament:
+    mode = TournamentMode(config["mode"])
+    entrants = config["players"]
+    blind_structure = config.get("blind_structure")
+
+    if mode == TournamentMode.SIT_AND_GO:
+        return manager.create_sit_and_go(
+            buy_in=config.get("buy_in", 10),
+            players_per_table=entrants,
+            sng_format=SnGFormat(config.get("sng_format", SnGFormat.TOP_3_PAID.value)),
+            blind_structure=blind_structure or "turbo",
+            starting_chips=config.get("starting_chips", 1500),
+        )
+    if mode == TournamentMode.BOUNTY_HUNTER:
+        return manager.create_bounty_tournament(
+            name="Simulated Bounty Hunter",
+            buy_in=config.get("buy_in", 20),
+            starting_chips=config.get("starting_chips", 10000),
+            min_players=2,
+            max_players=entrants,
+            blind_structure=blind_structure or "standard",
+        )
+    return manager.create_tournament(
+        name="Simulated Tournament",
+        mode=mode,
+        buy_in=config.get("buy_in", 10),
+        starting_chips=config.get("starting_chips", 10000),
+        min_players=2,
+        max_players=entrants,
+        blind_structure=blind_structure or "standard",
+        players_per_table=config.get("players_per_table", 9),
+    )
+
+
+async def play_tournament(config: Dict[str, Any], policies: List[Policy], rng: random.Random) -> TournamentRun:
+    """Register bots, start the tournament and deal hands until one player is left"""
+    clock = VirtualClock()
+    previous = set_clock(clock)  # Turn timers and level countdowns read the process-wide clock
+    try:
+        return await _play_tournament(config, policies, rng, clock)
+    finally:
+        set_clock(previous)
+
+
+async def _play_tournament(
+    config: Dict[str, Any], policies: List[Policy], rng: random.Random, clock: VirtualClock
+) -> TournamentRun:
+    manager = TournamentManager(clock=clock)
+    tournament = _create_tournament(manager, config)
+    tournament_id = tournament.tournament_id
+    run = TournamentRun(entrants=config["players"])
+    hand_stats = SimulationResult()
+
+    async def on_blind_increase(tid: str, blinds: dict):
+        await sync_tournament_blinds(tid, manager=manager)
+
+    manager.on_event("blind_increase", on_blind_increase)
+
+    for telegram_id in range(1, run.entrants + 1):
+        await manager.register_player(tournament_id, telegram_id, None, f"Bot{telegram_id}")
+    if tournament.status == TournamentStatus.REGISTERING:
+        ok, message = await manager.start_tournament(tournament_id)
+        if not ok:
+            run.anomalies.append(f"start failed: {message}")
+            return run
+
+    for table in tournament.tables.values():
+        await create_game_session_for_table(tournament_id, table.table_id, manager=manager)
+
+    total_chips = tournament.starting_chips * run.entrants
+    try:
+        while tournament.status != TournamentStatus.FINISHED:
+            dealt = 0
+            for table in list(tournament.tables.values()):
+                if not table.is_active:
+                    if table.game_session_id:
+                        end_game(table.game_session_id)
+                    continue
+                game = sync_table_roster(tournament, table)
+                if not game or sum(1 for p in game.players.values() if p.chips > 0) < 2:
+                    continue
+
+                start_new_hand(game.session_id)
+                anomaly = play_hand(game, policies, rng, hand_stats)
+                run.hands += 1
+                dealt += 1
+                if anomaly:
+                    run.anomalies.append(f"{table.table_id} hand {run.hands}: {anomaly}")
+                    return run
+
+                level = tournament.current_level
+                remaining = tournament.get_players_remaining()
+                await handle_hand_result(tournament_id, table.table_id, game.session_id, manager=manager)
+                run.eliminations_per_level[level] += remaining - tournament.get_players_remaining()
+
+                chips = tournament.get_total_chips()
+                if chips != total_chips:
+                    run.anomalies.append(f"hand {run.hands}: chips not conserved ({chips} != {total_chips})")
+                    return run
+                if tournament.status == TournamentStatus.FINISHED:
+                    break
+
+            if tournament.status == TournamentStatus.FINISHED:
+                break
+            if dealt == 0:
+                unseated = [p.telegram_id for p in tournament.players.values()
+                            if not p.is_eliminated() and p.table_id is None]
+                run.anomalies.append(
+                    f"stalled with {tournament.get_players_remaining()} players left "
+                    f"({len(unseated)} unseated) at level {tournament.current_level}"
+                )
+                return run
+            if run.hands >= MAX_HANDS_PER_TOURNAMENT:
+                run.anomalies.append(f"not finished after {run.hands} hands")
+                return run
+
+            # All tables deal in parallel in real life: one round of hands costs one hand of time
+            await clock.advance(config.get("hand_seconds", HAND_SECONDS))
+    finally:
+        task = manager._blind_tasks.pop(tournament_id, None)
+        if task:
+            task.cancel()
+        for table in tournament.tables.values():
+            if table.game_session_id:
+                end_game(table.game_session_id)
+        # Filled in here so runs that stop on an anomaly still report how far they got
+        run.duration = (tournament.finished_at or clock.time()) - (tournament.started_at or 0.0)
+        run.levels_reached = tournament.current_level
+        _check_blind_clock(tournament, run, config.get("hand_seconds", HAND_SECONDS))
+
+    run.bounties_paid = sum(p.total_bounty_won for p in tournament.players.values())
+    winner = next((p for p in tournament.players.values() if not p.is_eliminated()), None)
+    if winner:
+        run.winner_bounty = winner.total_bounty_won + winner.bounty
+    return run
+
+
+def _check_blind_clock(tournament: Tournament, run: TournamentRun, hand_seconds: float):
+    """A tournament that outlived its first level (plus a hand of slack) must have moved past it"""
+    first_level = BLIND_STRUCTURES.get(tournament.blind_structure, BLIND_STRUCTURES["standard"])[0]["duration"]
+    if run.levels_reached == 0 and run.duration > first_level + hand_seconds:
+        run.anomalies.append(
+            f"blind level never increased in {run.duration / 60:.1f} min (level 1 lasts {first_level / 60:.1f} min)"
+        )
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MANY TOURNAMENTS (PROCESS POOL)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+async def _play_many(config: Dict[str, Any], count: int, seed: int) -> TournamentReport:
+    rng = random.Random(seed)
+    random.seed(seed)  # Deck shuffles, seating and tournament ids use the module-level RNG
+    policies = [POLICIES[name] for name in config.get("policies", ["random"])]
+    report = TournamentReport()
+    for _ in range(count):
+        report.add(await play_tournament(config, policies, rng))
+    return report
+
+
+def _run_shard(shard: tuple) -> TournamentReport:
+    """Worker entry point: one event loop per process, tournaments run back to back"""
+    config, count, seed = shard
+    game_engine.VERBOSE = False
+    tournament_engine.VERBOSE = False
+    return asyncio.run(_play_many(config, count, seed))
+
+
+def run_tournaments(
+    config: Dict[str, Any],
+    count: int,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> TournamentReport:
+    """Simulate count independent tournaments, sharded over a process pool"""
+    workers = max(1, min(workers or os.cpu_count() or 1, count))
+    base_seed = seed if seed is not None else random.randrange(2 ** 32)
+    shards_count = min(count, workers * 4)
+    per_shard, extra = divmod(count, shards_count)
+    shards = [
+        (config, per_shard + (1 if i < extra else 0), base_seed + i)
+        for i in range(shards_count)
+    ]
+
+    report = TournamentReport()
+    started = time.perf_counter()
+    if workers == 1:
+        verbose = (game_engine.VERBOSE, tournament_engine.VERBOSE)
+        try:
+            for shard in shards:
+                report.merge(_run_shard(shard))
+        finally:
+            game_engine.VERBOSE, tournament_engine.VERBOSE = verbose
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for shard_report in pool.map(_run_shard, shards):
+                report.merge(shard_report)
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tournament blind-structure and payout simulator")
+    parser.add_argument("--mode", choices=[m.value for m in TournamentMode], default="sitgo")
+    parser.add_argument("--players", type=int, default=9)
+    parser.add_argument("--tournaments", type=int, default=100)
+    parser.add_argument("--blind-structure", choices=sorted(tournament_engine.BLIND_STRUCTURES), default=None)
+    parser.add_argument("--starting-chips", type=int, default=None)
+    parser.add_argument("--players-per-table", type=int, default=9)
+    parser.add_argument("--hand-seconds", type=float, default=HAND_SECONDS)
+    parser.add_argument("--policy", action="append", choices=sorted(POLICIES))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config: Dict[str, Any] = {
+        "mode": args.mode,
+        "players": args.players,
+        "players_per_table": args.players_per_table,
+        "hand_seconds": args.hand_seconds,
+        "policies": args.policy or ["random"],
+    }
+    if args.blind_structure:
+        config["blind_structure"] = args.blind_structure
+    if args.starting_chips:
+        config["starting_chips"] = args.starting_chips
+
+    report = run_tournaments(config, args.tournaments, workers=args.workers, seed=args.seed)
+
+    print(f"🏆 SIM: {report.tournaments} {args.mode} tournaments ({args.players} players) in "
+          f"{report.elapsed:.2f}s ({report.tournaments_per_minute:,.0f}/min), {report.hands} hands")
+    durations = report.duration_percentiles()
+    if durations:
+        print("🏆 SIM: duration (min) - " + ", ".join(
+            f"{name} {value / 60:.1f}" for name, value in durations.items()
+        ))
+    print("🏆 SIM: levels reached - " + ", ".join(
+        f"L{level + 1}: {count}" for level, count in sorted(report.levels_reached.items())
+    ))
+    print("🏆 SIM: eliminations per level - " + ", ".join(
+        f"L{level + 1}: {count}" for level, count in sorted(report.eliminations_per_level.items())
+    ))
+    if args.mode == TournamentMode.BOUNTY_HUNTER.value and report.tournaments:
+        print(f"🏆 SIM: bounties paid ${report.bounties_paid / report.tournaments:.2f}/tournament, "
+              f"winner bounty avg ${statistics.fmean(report.winner_bounties):.2f}")
+    if report.anomaly_count:
+        print(f"❌ SIM: {report.anomaly_count} anomalies, first {len(report.anomalies)}:")
+        for anomaly in report.anomalies:
+            print(f"   - {anomaly}")
+    else:
+        print("✅ SIM: all tournaments finished cleanly")
+
+
+if __name__ == "__main__":
+    main()